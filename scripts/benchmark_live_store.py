@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Live State Benchmark for Sports Auction
+Measures what the SQLite (WAL) live state adds to each bid through the
+auction service, with one commit per bid and with batched commits, and
+records the results as JSON
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine
+from auction_service import AuctionService
+from synthetic_league import make_league_config
+
+
+def time_bids(config, bids: int, state_path=None, commit_every: int = 1):
+    """Seconds per accepted bid through AuctionService (state() excluded)"""
+    engine = AuctionEngine(config, rng=random.Random(0))
+    for manager in engine.managers.values():
+        manager.budget = 10 ** 12
+    service = AuctionService(config, engine=engine, state_path=state_path, commit_every=commit_every)
+    managers = list(engine.managers)
+    try:
+        service.next_player()
+        samples = []
+        for i in range(bids):
+            with service.locked("bid") as locked_engine:
+                start = time.perf_counter()
+                amount = locked_engine.place_bid(managers[i % len(managers)])
+                service._record("bid", manager=managers[i % len(managers)], amount=amount)
+                samples.append(time.perf_counter() - start)
+    finally:
+        service.close()
+    samples.sort()
+    return {
+        "p50_s": statistics.median(samples),
+        "p99_s": samples[int(len(samples) * 0.99) - 1],
+        "mean_s": sum(samples) / len(samples),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark live state persistence per bid")
+    parser.add_argument("--bids", type=int, default=5000, help="Bids per run")
+    parser.add_argument("--players", type=int, default=1000, help="Players in the synthetic league")
+    parser.add_argument("--commit-every", type=int, nargs="+", default=[1, 10, 100],
+                        help="Actions per commit to test")
+    parser.add_argument("--output", default="live_store_benchmark.json", help="JSON file to write results to")
+    args = parser.parse_args(argv)
+    
+    print("💾 Sports Auction Live State Benchmark")
+    print("=" * 40)
+    
+    config = validate_config(make_league_config(args.players, 8, seed=0))
+    baseline = time_bids(config, args.bids)
+    print(f"In memory:           p50 {baseline['p50_s'] * 1e6:7.1f} µs | p99 {baseline['p99_s'] * 1e6:7.1f} µs")
+    
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for commit_every in args.commit_every:
+            path = os.path.join(tmp, f"live_{commit_every}.db")
+            run = time_bids(config, args.bids, path, commit_every)
+            run["commit_every"] = commit_every
+            run["overhead_p50_s"] = run["p50_s"] - baseline["p50_s"]
+            results.append(run)
+            print(f"SQLite, commit/{commit_every:<4}: p50 {run['p50_s'] * 1e6:7.1f} µs | p99 {run['p99_s'] * 1e6:7.1f} µs"
+                  f" | overhead {run['overhead_p50_s'] * 1e6:7.1f} µs per bid")
+    
+    report = {
+        "benchmark": "live_store",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "bids": args.bids,
+        "in_memory": baseline,
+        "results": results
+    }
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
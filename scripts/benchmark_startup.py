@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for Sports Auction
+Measures import time, config parse time, engine initialization and GUI
+build time across league sizes and records the results as JSON
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+python_dir = project_root / "src" / "python"
+sys.path.insert(0, str(python_dir))
+
+from config_loader import clear_config_cache, load_config_file
+from auction_engine import AuctionEngine
+from synthetic_league import make_league_config
+
+DEFAULT_PLAYERS = [100, 1000, 10000, 50000]
+DEFAULT_TEAMS = [2, 8, 64]
+
+
+def timed(func, repeat):
+    """Run func repeat times; return (median seconds, last result)"""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+def measure_import_time(repeat):
+    """Time a cold import of the desktop module in fresh interpreters"""
+    code = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {str(python_dir)!r})\n"
+        "start = time.perf_counter()\n"
+        "import cricket_auction\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        samples.append(float(output.stdout.strip()))
+    return statistics.median(samples)
+
+
+def open_display():
+    """Return a hidden Tk root, or None on display-less hosts"""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        root.withdraw()
+        return root
+    except Exception:
+        return None
+
+
+def measure_gui_build(config, repeat):
+    """Time AuctionApp construction (setup_gui) with a pre-validated config"""
+    root = open_display()
+    if root is None:
+        return None
+    root.destroy()
+    
+    import cricket_auction
+    
+    def build():
+        root = open_display()
+        try:
+            cricket_auction.AuctionApp(root, config)
+            root.update_idletasks()
+        finally:
+            root.destroy()
+    
+    seconds, _ = timed(build, repeat)
+    return seconds
+
+
+def run_case(num_players, num_teams, repeat, with_gui):
+    """Benchmark one (players, teams) combination"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "league.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(make_league_config(num_players, num_teams), f)
+        
+        def cold_load():
+            clear_config_cache()
+            return load_config_file(path)
+        
+        parse_cold, config = timed(cold_load, repeat)
+        parse_cached, _ = timed(lambda: load_config_file(path), repeat)
+    
+    init_seconds, _ = timed(lambda: AuctionEngine(config), repeat)
+    gui_seconds = measure_gui_build(config, repeat) if with_gui else None
+    
+    return {
+        "players": num_players,
+        "teams": num_teams,
+        "config_parse_s": parse_cold,
+        "config_parse_cached_s": parse_cached,
+        "initialize_auction_s": init_seconds,
+        "setup_gui_s": gui_seconds
+    }
+
+
+def git_revision():
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+                                capture_output=True, text=True, check=True)
+        return output.stdout.strip()
+    except Exception:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark auction startup time")
+    parser.add_argument("--players", type=int, nargs="+", default=DEFAULT_PLAYERS, help="Pool sizes to test")
+    parser.add_argument("--teams", type=int, nargs="+", default=DEFAULT_TEAMS, help="Team counts to test")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (median is recorded)")
+    parser.add_argument("--no-gui", action="store_true", help="Skip setup_gui timings")
+    parser.add_argument("--output", default="startup_benchmark.json", help="JSON file to write results to")
+    args = parser.parse_args(argv)
+    
+    print("⏱️  Sports Auction Startup Benchmark")
+    print("=" * 40)
+    
+    import_seconds = measure_import_time(args.repeat)
+    print(f"Import cricket_auction: {import_seconds * 1000:.1f} ms")
+    
+    display = None if args.no_gui else open_display()
+    with_gui = display is not None
+    if display is not None:
+        display.destroy()
+    elif not args.no_gui:
+        print("⚠️  No display available - setup_gui timings skipped")
+    
+    results = []
+    for num_players in args.players:
+        for num_teams in args.teams:
+            case = run_case(num_players, num_teams, args.repeat, with_gui)
+            results.append(case)
+            gui_text = f"{case['setup_gui_s'] * 1000:8.1f} ms" if case['setup_gui_s'] is not None else "     n/a"
+            print(f"{num_players:>6} players x {num_teams:>2} teams | "
+                  f"parse {case['config_parse_s'] * 1000:8.1f} ms "
+                  f"(cached {case['config_parse_cached_s'] * 1000:.3f} ms) | "
+                  f"init {case['initialize_auction_s'] * 1000:8.1f} ms | gui {gui_text}")
+    
+    report = {
+        "benchmark": "startup",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "import_s": import_seconds,
+        "results": results
+    }
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Config Snapshot Converter for Sports Auction
+Turns a JSON config into the binary .aucsnap snapshot (or back) and
+compares how long each takes to load into a ready auction engine
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import ConfigError, validate_config
+from config_snapshot import load_snapshot, snapshot_to_dict, write_snapshot
+from auction_engine import AuctionEngine
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert auction configs to and from binary snapshots")
+    parser.add_argument("source", help="JSON config (or .aucsnap snapshot with --to-json)")
+    parser.add_argument("output", nargs="?", help="File to write (default: source with the other suffix)")
+    parser.add_argument("--to-json", action="store_true", help="Convert a snapshot back to a JSON config")
+    args = parser.parse_args(argv)
+    
+    print("📦 Sports Auction Config Snapshot")
+    print("=" * 40)
+    
+    source = Path(args.source)
+    try:
+        if args.to_json:
+            output = Path(args.output or source.with_suffix(".json"))
+            data = snapshot_to_dict(str(source))
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            print(f"✅ {len(data['players'])} player(s) written to {output}")
+            return 0
+        
+        output = Path(args.output or source.with_suffix(".aucsnap"))
+        with open(source, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        write_snapshot(data, str(output))
+    except (OSError, ValueError, ConfigError) as e:
+        print(f"❌ Could not convert {source}: {e}")
+        return 1
+    
+    print(f"{source}: {os.path.getsize(source) / 1024:.0f} KB")
+    print(f"{output}: {os.path.getsize(output) / 1024:.0f} KB")
+    
+    # Load-to-ready-engine time for both formats
+    start = time.perf_counter()
+    with open(source, 'r', encoding='utf-8') as f:
+        AuctionEngine(validate_config(json.load(f)), rng=random.Random(0))
+    json_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    engine = AuctionEngine(load_snapshot(str(output)), rng=random.Random(0))
+    snapshot_seconds = time.perf_counter() - start
+    
+    print(f"\nJSON load + validate + engine: {json_seconds * 1000:8.1f} ms")
+    print(f"Snapshot read + engine:        {snapshot_seconds * 1000:8.1f} ms")
+    print(f"\n✅ Snapshot of {len(engine.player_pool)} player(s) written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
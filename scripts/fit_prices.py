@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Price Model Fitting for Sports Auction
+Learns expected sale prices from past seasons' CSV exports and server
+journals and writes the JSON model the desktop app shows next to each lot
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from valuation import fit_price_model, read_history
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit expected sale prices from past auctions")
+    parser.add_argument("history", nargs="+",
+                        help="CSV exports or .jsonl journals, one per season, oldest first")
+    parser.add_argument("--shrinkage", type=float, default=1.0,
+                        help="Sales a player needs to move halfway from the category average")
+    parser.add_argument("--decay", type=float, default=0.7, help="Weight multiplier per season back")
+    parser.add_argument("--output", default="price_model.json", help="JSON file to write the model to")
+    args = parser.parse_args(argv)
+    
+    print("📈 Sports Auction Price Model")
+    print("=" * 40)
+    
+    seasons = []
+    for path in args.history:
+        try:
+            sales = read_history(path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ Could not read {path}: {e}")
+            return 1
+        print(f"{path}: {len(sales)} sale(s)")
+        seasons.append(sales)
+    
+    start = time.perf_counter()
+    model = fit_price_model(seasons, shrinkage=args.shrinkage, decay=args.decay)
+    elapsed = time.perf_counter() - start
+    
+    print(f"\nFitted {model.sales} sale(s) in {elapsed * 1000:.1f} ms: "
+          f"{len(model.player_prices)} player(s), {len(model.category_prices)} categories")
+    for category, price in sorted(model.category_prices.items()):
+        print(f"  {category}: €{price:.0f} average")
+    
+    model.save(args.output)
+    print(f"\n✅ Model written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
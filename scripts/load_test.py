@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Load Test for the Sports Auction Server
+Simulates concurrent managers, spectators and an auctioneer against the
+live auction API and reports throughput, error rate and tail latency
+"""
+
+import argparse
+import functools
+import http.client
+import json
+import platform
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from config_loader import validate_config
+from instrumentation import LatencyHistogram
+from synthetic_league import make_league_config
+
+# Seconds a lot stays open after its last accepted bid before the auctioneer closes it
+DEFAULT_LOT_SECONDS = 0.5
+
+
+class LoadStats:
+    """Per-operation latency histograms and outcome counters shared by all clients"""
+    
+    def __init__(self):
+        self.histograms = {}
+        self.counts = {}
+        self._lock = threading.Lock()
+    
+    def record(self, operation: str, seconds: float, outcome: str):
+        """outcome is 'ok', 'rejected' (4xx rule refusals) or 'error'"""
+        with self._lock:
+            hist = self.histograms.get(operation)
+            if hist is None:
+                hist = self.histograms[operation] = LatencyHistogram()
+                self.counts[operation] = {'ok': 0, 'rejected': 0, 'error': 0}
+            self.counts[operation][outcome] += 1
+        hist.record(seconds)
+    
+    def report(self, elapsed: float):
+        operations = {}
+        for operation in sorted(self.histograms):
+            counts = self.counts[operation]
+            total = sum(counts.values())
+            summary = self.histograms[operation].to_dict()
+            summary.update(counts)
+            summary['throughput_per_s'] = total / elapsed if elapsed else 0.0
+            summary['error_rate'] = counts['error'] / total if total else 0.0
+            operations[operation] = summary
+        
+        total = sum(op['count'] for op in operations.values())
+        errors = sum(op['error'] for op in operations.values())
+        return {
+            "requests": total,
+            "throughput_per_s": total / elapsed if elapsed else 0.0,
+            "error_rate": errors / total if total else 0.0,
+            "operations": operations
+        }
+
+
+class SimulatedClient(threading.Thread):
+    """One simulated user holding a keep-alive connection to the server"""
+    
+    def __init__(self, host, port, stats: LoadStats, stop_event: threading.Event,
+                 think_time: float, seed: int):
+        super().__init__(daemon=True)
+        self.host = host
+        self.port = port
+        self.stats = stats
+        self.stop_event = stop_event
+        self.think_time = think_time
+        self.rng = random.Random(seed)
+        self.connection = None
+    
+    def request(self, operation, method, path, payload=None, timeout=10.0):
+        """Send one request, recording latency; returns the decoded JSON body or None"""
+        body = json.dumps(payload) if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        start = time.perf_counter()
+        try:
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+            self.connection.request(method, path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            self.stats.record(operation, time.perf_counter() - start, 'error')
+            self.close()
+            return None
+        
+        elapsed = time.perf_counter() - start
+        if response.status >= 500:
+            outcome = 'error'
+        elif response.status >= 400:
+            outcome = 'rejected'
+        else:
+            outcome = 'ok'
+        self.stats.record(operation, elapsed, outcome)
+        
+        try:
+            return json.loads(data) if outcome == 'ok' and data else None
+        except ValueError:
+            return None
+    
+    def pause(self):
+        """Think time with +/-50% jitter"""
+        self.stop_event.wait(self.think_time * self.rng.uniform(0.5, 1.5))
+    
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+    
+    def run(self):
+        try:
+            while not self.stop_event.is_set():
+                self.step()
+        finally:
+            self.close()
+    
+    def step(self):
+        raise NotImplementedError
+
+
+class Manager(SimulatedClient):
+    """Polls the lot and raises the bid while it is below a private valuation of the player"""
+    
+    def __init__(self, name, *args, bid_probability=0.5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = name
+        self.bid_probability = bid_probability
+        self.lot = None
+        self.valuation = 0
+    
+    def step(self):
+        state = self.request('poll', 'GET', '/api/state')
+        player = state and state['current_player']
+        if player and state['bidding_active'] and state['highest_bidder'] != self.name:
+            if player['name'] != self.lot:
+                # Most managers value a player at 1-3x base price, some not at all
+                self.lot = player['name']
+                self.valuation = player['base_price'] * self.rng.uniform(0.5, 3.0)
+            
+            me = next((m for m in state['managers'] if m['name'] == self.name), None)
+            can_afford = me is not None and me['budget'] > state['current_bid'] and me['players'] < me['max_players']
+            if can_afford and state['current_bid'] < self.valuation and self.rng.random() < self.bid_probability:
+                self.request('bid', 'POST', '/api/bid', {'manager': self.name})
+        self.pause()
+
+
+class Spectator(SimulatedClient):
+    """Follows the auction through long-poll subscriptions, occasionally reloading the page"""
+    
+    def __init__(self, *args, subscribe_timeout=2.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.subscribe_timeout = subscribe_timeout
+        self.version = -1
+    
+    def step(self):
+        if self.rng.random() < 0.05:
+            self.request('page', 'GET', '/src/web/auction_web.html')
+        
+        state = self.request('subscribe', 'GET', f'/api/state?since={self.version}&timeout={self.subscribe_timeout}',
+                             timeout=self.subscribe_timeout + 10)
+        if state:
+            self.version = state['version']
+        else:
+            self.pause()
+
+
+class Auctioneer(SimulatedClient):
+    """Opens lots and closes them once bidding has gone quiet"""
+    
+    def __init__(self, *args, lot_seconds=DEFAULT_LOT_SECONDS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lot_seconds = lot_seconds
+        self.last_change = time.monotonic()
+        self.last_version = None
+    
+    def step(self):
+        state = self.request('poll', 'GET', '/api/state')
+        if state is None:
+            self.pause()
+            return
+        
+        if state['version'] != self.last_version:
+            self.last_version = state['version']
+            self.last_change = time.monotonic()
+        
+        if not state['bidding_active']:
+            self.request('next', 'POST', '/api/next', {})
+        elif time.monotonic() - self.last_change >= self.lot_seconds:
+            if state['highest_bidder']:
+                self.request('sell', 'POST', '/api/sell', {})
+            else:
+                self.request('unsold', 'POST', '/api/unsold', {})
+        self.pause()
+
+
+def start_local_server(num_players, num_teams):
+    """Serve a synthetic league in-process on an ephemeral port; returns (httpd, url)"""
+    import server
+    from auction_service import AuctionService
+    
+    config = validate_config(make_league_config(num_players, num_teams))
+    service = AuctionService(config, server.SERVER_METRICS)
+    handler = type("LoadTestHandler", (server.AuctionHTTPRequestHandler,), {"service": service, "quiet": True})
+    handler = functools.partial(handler, directory=str(project_root))
+    httpd = server.AuctionHTTPServer(("127.0.0.1", 0), handler)
+    # Hundreds of clients connect at once; the default backlog of 5 would refuse some
+    httpd.request_queue_size = 1024
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+
+
+def run_load_test(url, manager_names, num_spectators, duration, think_time, seed=0):
+    """Run all simulated clients for duration seconds and return the report dict"""
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    stats = LoadStats()
+    stop_event = threading.Event()
+    
+    clients = [Auctioneer(host, port, stats, stop_event, think_time, seed)]
+    for i, name in enumerate(manager_names):
+        clients.append(Manager(name, host, port, stats, stop_event, think_time, seed + 1 + i))
+    for i in range(num_spectators):
+        clients.append(Spectator(host, port, stats, stop_event, think_time, seed + 10000 + i))
+    
+    start = time.perf_counter()
+    for client in clients:
+        client.start()
+    stop_event.wait(duration)
+    stop_event.set()
+    for client in clients:
+        client.join(timeout=15)
+    elapsed = time.perf_counter() - start
+    
+    report = stats.report(elapsed)
+    report.update({
+        "managers": len(manager_names),
+        "spectators": num_spectators,
+        "duration_s": elapsed
+    })
+    return report
+
+
+def fetch_state(url):
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=10)
+    try:
+        connection.request('GET', '/api/state')
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the auction server with simulated clients")
+    parser.add_argument("--url", help="Server hosting a live auction (default: start one in-process)")
+    parser.add_argument("--managers", type=int, default=50, help="Concurrent bidding managers")
+    parser.add_argument("--spectators", type=int, default=200, help="Concurrent subscribed spectators")
+    parser.add_argument("--players", type=int, default=5000, help="Player pool size for the in-process server")
+    parser.add_argument("--duration", type=float, default=10.0, help="Test duration in seconds")
+    parser.add_argument("--think-time", type=float, default=0.05, help="Mean pause between client actions (s)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for client behaviour")
+    parser.add_argument("--output", default="load_test.json", help="JSON file to write results to")
+    args = parser.parse_args(argv)
+    
+    print("🏋️  Sports Auction Load Test")
+    print("=" * 40)
+    
+    httpd = None
+    url = args.url
+    if url is None:
+        httpd, url = start_local_server(args.players, max(1, args.managers))
+        print(f"🚀 In-process server at {url} ({args.players} players, {args.managers} teams)")
+    
+    try:
+        manager_names = [m['name'] for m in fetch_state(url)['managers']][:args.managers]
+        print(f"👥 {len(manager_names)} managers + {args.spectators} spectators for {args.duration:.0f}s...")
+        report = run_load_test(url, manager_names, args.spectators, args.duration, args.think_time, args.seed)
+    finally:
+        if httpd is not None:
+            httpd.shutdown()
+            httpd.server_close()
+    
+    print(f"\n{'operation':<10} {'count':>8} {'req/s':>9} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for operation, op in report["operations"].items():
+        print(f"{operation:<10} {op['count']:>8} {op['throughput_per_s']:>9.1f} {op['error']:>7} "
+              f"{op['p50_ms']:>8.2f} {op['p95_ms']:>8.2f} {op['p99_ms']:>8.2f} {op['max_ms']:>8.2f}")
+    print(f"\nTotal: {report['requests']} requests, {report['throughput_per_s']:.1f} req/s, "
+          f"error rate {report['error_rate'] * 100:.2f}%")
+    
+    report.update({
+        "benchmark": "load_test",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "url": args.url or "in-process"
+    })
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Season History Queries for Sports Auction
+Answers cross-season questions from the SQLite history the desktop app
+writes (Export Results → Season history .db)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from season_store import SeasonStore
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query past auctions in a season history database")
+    parser.add_argument("database", help="Season history .db file")
+    parser.add_argument("--average", metavar="CATEGORY", help="Average sale price of a category")
+    parser.add_argument("--last", type=int, help="Limit --average to the last N seasons")
+    parser.add_argument("--category", help="Per-season prices of a category")
+    parser.add_argument("--player", help="Every season a player was auctioned")
+    parser.add_argument("--team", help="Per-season spending of a team")
+    args = parser.parse_args(argv)
+    
+    if not Path(args.database).exists():
+        print(f"❌ No season history at {args.database}")
+        return 1
+    
+    with SeasonStore(args.database) as store:
+        start = time.perf_counter()
+        print(f"📚 {len(store.seasons())} season(s): {', '.join(store.seasons())}")
+        
+        if args.average:
+            average = store.average_price(args.average, args.last)
+            span = f"last {args.last} season(s)" if args.last else "all seasons"
+            text = f"€{average:.0f}" if average is not None else "no sales"
+            print(f"Average {args.average} price over {span}: {text}")
+        if args.category:
+            for row in store.category_prices_by_season(args.category):
+                print(f"  {row['season']}: {row['sold']} sold, average €{row['average']:.0f}, top €{row['top']}")
+        if args.player:
+            for row in store.player_history(args.player):
+                result = f"{row['team']} for €{row['price']}" if row['price'] is not None else "unsold"
+                print(f"  {row['season']}: {row['category']} - {result}")
+        if args.team:
+            for row in store.team_history(args.team):
+                print(f"  {row['season']}: {row['players']} player(s), €{row['spent']} spent")
+        
+        print(f"\n⏱️  {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,57 +1,335 @@
 #!/usr/bin/env python3
 """
 Simple HTTP Server for Sports Auction
-A basic web server that serves our auction files
+A basic web server that serves our auction files, exposes Prometheus-style
+metrics at /metrics and can host a live auction behind a small JSON API
 """
 
+import argparse
+import functools
 import http.server
-import socketserver
+import json
+import sys
+import time
 import webbrowser
 import os
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import ConfigError, load_config_file
+from auction_engine import AuctionError
+from auction_service import AuctionService
+from metrics import MetricsRegistry
+from rules import evaluate_snapshot
+
+SERVER_METRICS = MetricsRegistry()
+
+REQUESTS_TOTAL = SERVER_METRICS.counter(
+    "auction_http_requests_total", "HTTP requests served", ("method", "path", "status"))
+REQUEST_SECONDS = SERVER_METRICS.histogram(
+    "auction_http_request_duration_seconds", "HTTP request latency", ("method", "path"))
+ACTIVE_CONNECTIONS = SERVER_METRICS.gauge(
+    "auction_http_active_connections", "Open client connections")
+
+# POST /api/<action> -> (AuctionService method, JSON body fields as (name, type, required))
+API_ACTIONS = {
+    "next": ("next_player", (("mode", str, False),)),
+    "bid": ("place_bid", (("manager", str, True),)),
+    "proxy": ("set_proxy_bid", (("manager", str, True), ("max", int, True))),
+    "sealed": ("submit_sealed_bid", (("manager", str, True), ("amount", int, True))),
+    "resolve": ("resolve_sealed_lot", ()),
+    "sell": ("sell_player", ()),
+    "unsold": ("mark_unsold", ()),
+    "batch/open": ("open_batch", (("size", int, True),)),
+    "batch/bid": ("batch_bid", (("player", str, True), ("manager", str, True))),
+    "batch/settle": ("settle_batch", ()),
+    "fill": ("fast_fill", ()),
+}
+
+# Stateless rules check for clients that keep their own auction state (the web page)
+RULES_PATH = "/api/rules/eligibility"
+
+# Upper bound for /api/state?since=<version> long-polls (seconds)
+MAX_SUBSCRIBE_TIMEOUT = 30.0
+
+# Most players one /api/players search returns
+MAX_SEARCH_LIMIT = 500
+
+
+# Request paths reported by name in the HTTP metrics
+METRIC_PATHS = frozenset(
+    ["/metrics", "/api/state", "/api/players", RULES_PATH] + [f"/api/{action}" for action in API_ACTIONS]
+)
+
+
+@functools.lru_cache(maxsize=256)
+def cached_eligibility(canonical_payload):
+    """Eligibility table per distinct lot state; repeated renders of one lot hit the cache"""
+    return evaluate_snapshot(json.loads(canonical_payload))
+
+
+def metrics_path_label(path):
+    """Collapse request paths to a small fixed label set"""
+    if path in METRIC_PATHS:
+        return path
+    # Unknown API paths (typos, probes) would otherwise each start a new series
+    return "other" if path.startswith("/api/") else "static"
+
 
 class AuctionHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Custom handler for auction files"""
     
+    # Keep-alive so polling clients reuse one connection
+    protocol_version = "HTTP/1.1"
+    
+    # Live auction hosted by this server (None: static files and metrics only)
+    service = None
+    quiet = False
+    
     def end_headers(self):
+        # Counted before the headers and body go out, so a client never sees
+        # its response before /metrics does
+        self.record_request()
+        
         # Add CORS headers to allow local file access
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         super().end_headers()
+    
+    def handle(self):
+        ACTIVE_CONNECTIONS.inc()
+        try:
+            super().handle()
+        finally:
+            ACTIVE_CONNECTIONS.dec()
+    
+    def handle_one_request(self):
+        self._status = None
+        super().handle_one_request()
+    
+    def parse_request(self):
+        # Timed from here, once the request line has arrived: on a keep-alive
+        # connection the wait before it is client idle time, not handling time
+        self._start = time.perf_counter()
+        return super().parse_request()
+    
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+    
+    def record_request(self):
+        # command stays unset when the request line could not be parsed
+        if getattr(self, 'command', None) and self._status is not None:
+            path = metrics_path_label(urlsplit(self.path).path)
+            REQUESTS_TOTAL.inc(method=self.command, path=path, status=str(self._status))
+            REQUEST_SECONDS.observe(time.perf_counter() - self._start, method=self.command, path=path)
+            self._status = None
+    
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+    
+    def send_body(self, status, body, content_type):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def send_json(self, status, payload):
+        self.send_body(status, json.dumps(payload), 'application/json')
+    
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/metrics":
+            self.send_body(200, SERVER_METRICS.render(), MetricsRegistry.CONTENT_TYPE)
+        elif url.path == "/api/state":
+            if self.service is None:
+                self.send_json(404, {"error": "No live auction is hosted by this server"})
+                return
+            
+            # ?since=<version>[&timeout=<seconds>] subscribes to the next change
+            query = parse_qs(url.query)
+            try:
+                since = int(query["since"][0]) if "since" in query else None
+                timeout = min(float(query.get("timeout", ["10"])[0]), MAX_SUBSCRIBE_TIMEOUT)
+            except ValueError:
+                self.send_json(400, {"error": "since and timeout must be numbers"})
+                return
+            
+            if since is None:
+                self.send_json(200, self.service.state())
+            else:
+                self.send_json(200, self.service.wait_for_change(since, timeout))
+        elif url.path == "/api/players":
+            self.handle_search(parse_qs(url.query))
+        else:
+            super().do_GET()
+    
+    def handle_search(self, query):
+        """GET /api/players?q=<prefix>[&category=][&min_price=][&max_price=][&limit=]"""
+        if self.service is None:
+            self.send_json(404, {"error": "No live auction is hosted by this server"})
+            return
+        
+        def number(name):
+            return int(query[name][0]) if query.get(name, [""])[0] else None
+        
+        try:
+            min_price, max_price = number("min_price"), number("max_price")
+            limit = min(number("limit") or 50, MAX_SEARCH_LIMIT)
+        except ValueError:
+            self.send_json(400, {"error": "min_price, max_price and limit must be whole numbers"})
+            return
+        category = query.get("category", [""])[0] or None
+        self.send_json(200, self.service.search_players(query.get("q", [""])[0], category,
+                                                        min_price, max_price, limit))
+    
+    def do_POST(self):
+        # Always consume the body so the keep-alive connection stays in sync
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            self.close_connection = True
+            self.send_json(400, {"error": "Invalid Content-Length"})
+            return
+        body = self.rfile.read(length) if length > 0 else b""
+        
+        path = urlsplit(self.path).path
+        if path == RULES_PATH:
+            self.handle_rules(body)
+            return
+        
+        action = API_ACTIONS.get(path[len("/api/"):]) if path.startswith("/api/") else None
+        if action is None:
+            self.send_json(404, {"error": f"Unknown endpoint: {path}"})
+            return
+        if self.service is None:
+            self.send_json(404, {"error": "No live auction is hosted by this server"})
+            return
+        
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            self.send_json(400, {"error": "Request body must be JSON"})
+            return
+        if not isinstance(payload, dict):
+            self.send_json(400, {"error": "Request body must be a JSON object"})
+            return
+        
+        method, fields = action
+        args = []
+        for name, kind, required in fields:
+            value = payload.get(name)
+            if value is None and not required:
+                args.append(None)
+            elif kind is int and (isinstance(value, bool) or not isinstance(value, int)):
+                self.send_json(400, {"error": f"{name} must be a whole number"})
+                return
+            elif kind is str and not isinstance(value, str):
+                self.send_json(400, {"error": f"{name} must be text"})
+                return
+            else:
+                args.append(value)
+        
+        try:
+            state = getattr(self.service, method)(*args)
+        except AuctionError as e:
+            self.send_json(409, {"error": str(e)})
+            return
+        
+        self.send_json(200, state)
+    
+    def handle_rules(self, body):
+        try:
+            payload = json.loads(body) if body else None
+            if not isinstance(payload, dict):
+                raise ValueError("Request body must be a JSON object")
+            table = cached_eligibility(json.dumps(payload, sort_keys=True))
+        except ValueError as e:
+            self.send_json(400, {"error": str(e)})
+            return
+        self.send_json(200, {"eligibility": table})
+
+
+class AuctionHTTPServer(http.server.ThreadingHTTPServer):
+    """One thread per connection so slow clients do not block bidders"""
+    
+    daemon_threads = True
+    allow_reuse_address = True
 
-def start_server():
+
+def start_server(argv=None):
     """Start the local web server"""
+    parser = argparse.ArgumentParser(description="Serve the Sports Auction web app")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument("--config", help="Host a live auction for this config file at /api/*")
+    parser.add_argument("--journal", help="Append every live auction action to this file (fsync per action)")
+    parser.add_argument("--state", help="Keep the live auction in this SQLite file (WAL) and resume it after a crash")
+    parser.add_argument("--state-commit-every", type=int, default=1,
+                        help="Actions per SQLite commit (a crash loses at most this many)")
+    parser.add_argument("--no-browser", action="store_true", help="Do not open the landing page")
+    parser.add_argument("--quiet", action="store_true", help="Do not log each request")
+    args = parser.parse_args(argv)
     
     # Change to the project root directory (parent of scripts)
-    project_root = Path(__file__).parent.parent
     os.chdir(project_root)
     
-    PORT = 8080
+    PORT = args.port
     
     print("🏆 Universal Sports Auction Server")
     print("=" * 40)
     print(f"🚀 Starting server on port {PORT}...")
     print(f"📁 Serving files from: {os.getcwd()}")
     
+    AuctionHTTPRequestHandler.quiet = args.quiet
+    if args.config:
+        try:
+            config = load_config_file(args.config)
+        except (OSError, ConfigError) as e:
+            print(f"❌ Could not load config: {e}")
+            return
+        try:
+            AuctionHTTPRequestHandler.service = AuctionService(config, SERVER_METRICS, args.journal,
+                                                               state_path=args.state,
+                                                               commit_every=args.state_commit_every)
+        except ValueError as e:
+            print(f"❌ Could not open live state: {e}")
+            return
+        if args.state and AuctionHTTPRequestHandler.service.version:
+            print(f"♻️  Resumed live auction from {args.state} at version {AuctionHTTPRequestHandler.service.version}")
+        print(f"🎯 Live auction: {config.title} ({len(config.players)} players)")
+    
     try:
-        with socketserver.TCPServer(("", PORT), AuctionHTTPRequestHandler) as httpd:
+        with AuctionHTTPServer(("", PORT), AuctionHTTPRequestHandler) as httpd:
             print(f"✅ Server running at: http://localhost:{PORT}")
             print(f"🎯 Auction App: http://localhost:{PORT}/src/web/auction_web.html")
             print(f"📋 Landing Page: http://localhost:{PORT}/index.html")
+            print(f"📈 Metrics: http://localhost:{PORT}/metrics")
             print(f"📊 Project Structure: http://localhost:{PORT}")
             print("\n🎮 Ready for auction! Open the URLs above in your browser.")
             print("Press Ctrl+C to stop the server.")
             
             # Automatically open the landing page in browser
-            try:
-                webbrowser.open(f"http://localhost:{PORT}/index.html")
-                print("🌐 Opening landing page in your default browser...")
-            except:
-                print("⚠️  Please manually open the URL in your browser")
+            if not args.no_browser:
+                try:
+                    webbrowser.open(f"http://localhost:{PORT}/index.html")
+                    print("🌐 Opening landing page in your default browser...")
+                except:
+                    print("⚠️  Please manually open the URL in your browser")
             
             httpd.serve_forever()
-            
+    
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
     except OSError as e:
@@ -62,6 +340,9 @@ def start_server():
             print(f"❌ Server error: {e}")
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
+    finally:
+        if AuctionHTTPRequestHandler.service is not None:
+            AuctionHTTPRequestHandler.service.close()
 
 if __name__ == "__main__":
     start_server()
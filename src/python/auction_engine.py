@@ -0,0 +1,836 @@
+#!/usr/bin/env python3
+"""
+Universal Sports Auction - Auction Engine
+GUI-free player/manager model and lot state machine shared by the
+desktop app, the server and simulations
+"""
+
+import csv
+import random
+import time
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, List, Dict, Optional, Tuple
+
+from config_loader import AuctionConfig, LOT_MODES
+from config_snapshot import player_rows
+from deadline_scheduler import DeadlineScheduler, Timer
+from fast_fill import plan_fast_fill
+from feasibility import FeasibilityTracker
+from lot_ordering import RANDOM_DRAW_ORDERS, order_players
+from player_search import PlayerSearchIndex
+from rules import ManagerSnapshot, RulesEngine
+
+# Remaining-time thresholds (seconds) for the countdown call, checked in order
+COUNTDOWN_CALLS = ((1.5, "Going twice..."), (3.0, "Going once..."))
+
+
+class AuctionError(Exception):
+    """Raised when an auction action is not allowed in the current state"""
+
+
+class BidError(AuctionError):
+    """Raised when a manager is not allowed to place a bid"""
+
+
+class Player:
+    """Represents a player in the auction"""
+    
+    # Pools can hold 100k+ players; slots keep each one small
+    __slots__ = ('name', 'base_price', 'category', 'sold_price', 'sold_to', 'is_sold')
+    
+    def __init__(self, name: str, base_price: int, category: str):
+        self.name = name
+        self.base_price = base_price
+        self.category = category
+        self.sold_price = 0
+        self.sold_to = None
+        self.is_sold = False
+    
+    def __repr__(self):
+        return f"Player({self.name}, {self.base_price}, {self.category})"
+
+
+class Manager:
+    """Represents a team manager"""
+    
+    def __init__(self, name: str, team_name: str, budget: int, max_players: int, category_limits: Dict[str, int],
+                 category_minimums: Optional[Dict[str, int]] = None,
+                 category_base_prices: Optional[Dict[str, int]] = None):
+        self.name = name
+        self.team_name = team_name
+        self.budget = budget
+        self.initial_budget = budget
+        self.max_players = max_players
+        self.category_limits = category_limits.copy()
+        self.players: List[Player] = []
+        self.category_counts: Dict[str, int] = {cat: 0 for cat in category_limits.keys()}
+        
+        # Players still required by category minimums and their base-price cost,
+        # kept current on add/remove so reserve checks never loop over categories
+        self.category_minimums = dict(category_minimums or {})
+        self.category_base_prices = dict(category_base_prices or {})
+        self.missing_required = sum(self.category_minimums.values())
+        self.missing_required_cost = sum(minimum * self.category_base_prices.get(cat, 0)
+                                         for cat, minimum in self.category_minimums.items())
+    
+    @property
+    def player_count(self) -> int:
+        return len(self.players)
+    
+    def can_bid(self, amount: int, category: str) -> bool:
+        """Check if manager can place this bid"""
+        if amount > self.budget:
+            return False
+        
+        # Check player limit
+        if len(self.players) >= self.max_players:
+            return False
+        
+        # Check category limit
+        if category in self.category_limits:
+            if self.category_counts[category] >= self.category_limits[category]:
+                return False
+        
+        return True
+    
+    def bid_rejection_reason(self, amount: int, category: str) -> Optional[str]:
+        """Explain why can_bid would refuse this bid, or None if it is allowed"""
+        if amount > self.budget:
+            return f"{self.name} doesn't have enough budget!"
+        if len(self.players) >= self.max_players:
+            return f"{self.name}'s team is full!"
+        if category in self.category_limits and self.category_counts[category] >= self.category_limits[category]:
+            return (f"{self.name} has reached the {category} limit "
+                    f"({self.category_counts[category]}/{self.category_limits[category]})!")
+        return None
+    
+    def add_player(self, player: Player):
+        """Add a player to the manager's team"""
+        self.players.append(player)
+        self.budget -= player.sold_price
+        
+        if player.category in self.category_counts:
+            if self.category_counts[player.category] < self.category_minimums.get(player.category, 0):
+                self._adjust_required(player.category, -1)
+            self.category_counts[player.category] += 1
+    
+    def remove_player(self, player: Player):
+        """Remove a player from the manager's team"""
+        if player in self.players:
+            self.players.remove(player)
+            self.budget += player.sold_price
+            
+            if player.category in self.category_counts:
+                self.category_counts[player.category] -= 1
+                if self.category_counts[player.category] < self.category_minimums.get(player.category, 0):
+                    self._adjust_required(player.category, 1)
+    
+    def _adjust_required(self, category: str, sign: int):
+        self.missing_required += sign
+        self.missing_required_cost += sign * self.category_base_prices.get(category, 0)
+    
+    def get_budget_left(self) -> int:
+        return self.budget
+    
+    def get_total_spent(self) -> int:
+        return self.initial_budget - self.budget
+    
+    def get_team_summary(self) -> str:
+        """Get formatted team summary"""
+        summary = f"{self.team_name}\nManager: {self.name}\n€{self.budget} left\n"
+        
+        # Category counts
+        for category, count in self.category_counts.items():
+            limit = self.category_limits.get(category, 0)
+            summary += f"{category}: {count}/{limit}, "
+        summary = summary.rstrip(", ") + "\n\n"
+        
+        for player in self.players:
+            summary += f"{player.name} ({player.category}) - €{player.sold_price}\n"
+        
+        return summary
+
+
+class CategoryIndex:
+    """Players of a pool grouped by category, updated on every draw, sale and unsold"""
+    
+    def __init__(self, players=()):
+        self.by_category: Dict[str, set] = {}
+        for player in players:
+            self.add(player)
+    
+    def add(self, player: Player):
+        self.by_category.setdefault(player.category, set()).add(player)
+    
+    def discard(self, player: Player):
+        members = self.by_category.get(player.category)
+        if members is not None:
+            members.discard(player)
+    
+    def count(self, category: str) -> int:
+        return len(self.by_category.get(category, ()))
+    
+    def players(self, category: str) -> set:
+        return self.by_category.get(category, set())
+
+
+class BatchLot:
+    """One of several players auctioned side by side in a batch round"""
+    
+    def __init__(self, player: Player):
+        self.player = player
+        self.current_bid = player.base_price
+        self.highest_bidder: Optional[str] = None
+
+
+class BatchCommitment:
+    """Budget, roster slots and category slots a manager holds by leading batch lots"""
+    
+    def __init__(self):
+        self.amount = 0
+        self.lots = 0
+        self.categories: Dict[str, int] = {}
+    
+    def add(self, lot: BatchLot, sign: int = 1):
+        self.amount += sign * lot.current_bid
+        self.lots += sign
+        category = lot.player.category
+        self.categories[category] = self.categories.get(category, 0) + sign
+
+
+class AuctionEngine:
+    """Auction state machine: player pool, current lot, bids and sales"""
+    
+    def __init__(self, config: AuctionConfig, rng: Optional[random.Random] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.config = config
+        self.rng = rng or random.Random()
+        
+        # Timed lots share one scheduler; the host calls tick() to fire expiries
+        self.scheduler = DeadlineScheduler(clock)
+        self.lot_timer: Optional[Timer] = None
+        self.on_lot_expired: Optional[Callable[[Player], None]] = None
+        
+        self.managers: Dict[str, Manager] = {}
+        self.player_pool: List[Player] = []
+        self.current_player: Optional[Player] = None
+        self.current_bid = 0
+        self.highest_bidder: Optional[str] = None
+        self.bidding_active = False
+        self.sold_players: List[Player] = []
+        # Re-auctioned first-unsold-first, so a deque keeps each draw O(1)
+        self.unsold_players: Deque[Player] = deque()
+        # Every accepted bid as (player name, manager name, amount), for the season history
+        self.bid_history: List[Tuple[str, str, int]] = []
+        
+        # Manager name -> maximum proxy bid for the current lot (insertion order breaks ties)
+        self.proxy_bids: Dict[str, int] = {}
+        
+        # Sealed/Vickrey lots collect one bid per manager and settle in resolve_sealed_lot()
+        self.lot_mode = config.lot_mode
+        self.sealed_bids: Dict[str, int] = {}
+        
+        # Batch rounds: player name -> open lot, and what each leading manager has committed
+        self.batch_lots: Dict[str, BatchLot] = {}
+        self.batch_commitments: Dict[str, BatchCommitment] = {}
+        
+        self.initialize()
+    
+    def initialize(self):
+        """Create managers and the shuffled player pool from the config"""
+        
+        # Calculate category limits and minimums
+        category_limits = {cat['name']: cat['max_per_team'] for cat in self.config.categories}
+        category_minimums = {cat['name']: cat.get('min_per_team', 0) for cat in self.config.categories}
+        category_base_prices = {cat['name']: cat.get('base_price', 0) for cat in self.config.categories}
+        
+        self.managers = {}
+        for team in self.config.teams:
+            manager = Manager(
+                name=team['manager_name'],
+                team_name=team['team_name'],
+                budget=self.config.total_budget,
+                max_players=self.config.max_players,
+                category_limits=category_limits,
+                category_minimums=category_minimums,
+                category_base_prices=category_base_prices
+            )
+            self.managers[team['manager_name']] = manager
+        
+        players = [
+            Player(name=name, base_price=price, category=category)
+            for name, category, price in player_rows(self.config.players)
+        ]
+        
+        ordered = order_players(players, self.config.player_order, self.config.categories, self.rng)
+        self.random_draw = self.config.player_order in RANDOM_DRAW_ORDERS
+        # Sequential orders are stored reversed so the next lot pops off the end in O(1)
+        self.player_pool = ordered if self.random_draw else ordered[::-1]
+        
+        # Per-category views of the pool and unsold list keep "players left" checks O(1)
+        self.pool_index = CategoryIndex(players)
+        self.unsold_index = CategoryIndex()
+        # Name-prefix search over the same players (pool and unsold, not the current lot)
+        self.search_index = PlayerSearchIndex(players)
+        self.rules = RulesEngine.from_config(self.config)
+        
+        # Dead ends found so far; new_dead_ends holds those the host has not shown yet
+        self.feasibility = FeasibilityTracker(self.managers.values(), self.rules, players)
+        self.new_dead_ends: List[str] = self.feasibility.warnings()
+        
+        self.current_player = None
+        self.current_bid = 0
+        self.highest_bidder = None
+        self.bidding_active = False
+        self.scheduler.cancel(self.lot_timer)
+        self.lot_timer = None
+        self.batch_lots = {}
+        self.batch_commitments = {}
+        self.sold_players = []
+        self.unsold_players = deque()
+        self.bid_history = []
+    
+    def all_teams_complete(self) -> bool:
+        return all(len(manager.players) >= manager.max_players for manager in self.managers.values())
+    
+    def next_player(self, mode: Optional[str] = None) -> Optional[Player]:
+        """Draw the next player for auction, or None when no players are left
+        
+        mode overrides the configured lot mode for this lot only.
+        """
+        mode = mode or self.config.lot_mode
+        if mode not in LOT_MODES:
+            raise AuctionError(f"Unknown lot mode: {mode}")
+        if self.batch_lots:
+            raise AuctionError("Settle the open batch before the next lot!")
+        
+        player = self._draw_player()
+        if player is None:
+            return None
+        
+        self.current_player = player
+        self.current_bid = player.base_price
+        self.highest_bidder = None
+        self.bidding_active = True
+        self.proxy_bids = {}
+        self.lot_mode = mode
+        self.sealed_bids = {}
+        
+        if self.config.lot_seconds > 0:
+            self._arm_lot_timer(self.scheduler.clock() + self.config.lot_seconds)
+        return player
+    
+    def _draw_player(self) -> Optional[Player]:
+        # First prioritize regular players from the main pool; only after all
+        # regular players are done, re-auction unsold players (randomly, or
+        # first-unsold-first for sequential orders)
+        if self.player_pool:
+            player = self._pop_random(self.player_pool) if self.random_draw else self.player_pool.pop()
+            self.pool_index.discard(player)
+        elif self.unsold_players:
+            player = self._pop_random(self.unsold_players) if self.random_draw else self.unsold_players.popleft()
+            self.unsold_index.discard(player)
+        else:
+            return None
+        self.search_index.discard(player)
+        return player
+    
+    def players_left(self, category: str) -> int:
+        """Players of a category still to be auctioned (pool and unsold, excluding the current lot)"""
+        return self.pool_index.count(category) + self.unsold_index.count(category)
+    
+    def search_players(self, prefix: str = '', category: Optional[str] = None, min_price: Optional[int] = None,
+                       max_price: Optional[int] = None, limit: int = 50) -> List[Player]:
+        """Players still to be auctioned whose name starts with prefix, in name order"""
+        return self.search_index.search(prefix, category, min_price, max_price, limit)
+    
+    def pass_rejection_reason(self, manager_name: str) -> Optional[str]:
+        """Why a manager may not let the current player go (category minimum out of reach), or None"""
+        if not self.current_player:
+            return None
+        category = self.current_player.category
+        return self.rules.pass_rejection_reason(self.managers[manager_name], category, self.players_left(category))
+    
+    def can_pass(self, manager_name: str) -> bool:
+        return self.pass_rejection_reason(manager_name) is None
+    
+    def eligibility(self) -> Dict[str, Dict]:
+        """Rules table for the current lot (see RulesEngine.eligibility); empty without a lot"""
+        if not self.current_player:
+            return {}
+        category = self.current_player.category
+        return self.rules.eligibility(self.managers.values(), category,
+                                     self.current_bid + self.config.bid_increment, self.players_left(category))
+    
+    def _pop_random(self, players) -> Player:
+        """Remove a random player by swapping it with the last entry
+        
+        O(1) for the pool list; on the unsold deque the index lookup walks
+        its blocks, which is still far cheaper than shifting a list.
+        """
+        index = self.rng.randint(0, len(players) - 1)
+        players[index], players[-1] = players[-1], players[index]
+        return players.pop()
+    
+    def place_bid(self, manager_name: str) -> int:
+        """Raise the current bid by one increment for a manager and return the new bid"""
+        if not self.bidding_active or not self.current_player:
+            raise AuctionError("No player is up for auction!")
+        self._require_open_lot()
+        
+        manager = self.managers[manager_name]
+        new_bid = self.current_bid + self.config.bid_increment
+        
+        reason = self.rules.bid_rejection_reason(manager, new_bid, self.current_player.category)
+        if reason:
+            raise BidError(reason)
+        
+        self._accept_bid(manager_name, new_bid)
+        
+        # Standing proxies answer the manual bid straight away
+        if self.proxy_bids:
+            self._resolve_proxies()
+        return self.current_bid
+    
+    def _accept_bid(self, manager_name: str, amount: int):
+        self.current_bid = amount
+        self.highest_bidder = manager_name
+        self.bid_history.append((self.current_player.name, manager_name, amount))
+        
+        # Soft close: a late bid keeps the lot open for at least the extension
+        if self.lot_timer is not None and self.config.bid_extension_seconds > 0:
+            extended = self.scheduler.clock() + self.config.bid_extension_seconds
+            if extended > self.lot_timer.deadline:
+                self._arm_lot_timer(extended)
+    
+    def set_proxy_bid(self, manager_name: str, max_amount: int) -> int:
+        """Register a manager's maximum for the current lot and resolve all proxies
+        
+        Returns the current bid after resolution.
+        """
+        if not self.bidding_active or not self.current_player:
+            raise AuctionError("No player is up for auction!")
+        if manager_name not in self.managers:
+            raise AuctionError(f"Unknown manager: {manager_name}")
+        self._require_open_lot()
+        
+        manager = self.managers[manager_name]
+        next_bid = self.current_bid + self.config.bid_increment
+        if max_amount < next_bid and manager_name != self.highest_bidder:
+            raise BidError(f"Maximum bid must be at least €{next_bid}!")
+        reason = self.rules.bid_rejection_reason(manager, min(next_bid, max_amount), self.current_player.category)
+        if reason:
+            raise BidError(reason)
+        
+        # Re-registering keeps the manager's original tie-break position
+        self.proxy_bids[manager_name] = max_amount
+        self._resolve_proxies()
+        return self.current_bid
+    
+    def _require_open_lot(self):
+        if self.lot_mode != 'open':
+            raise AuctionError(f"This is a {self.lot_mode} lot: submit a sealed bid instead!")
+    
+    def submit_sealed_bid(self, manager_name: str, amount: int):
+        """Record a manager's single sealed bid for the current lot"""
+        if not self.bidding_active or not self.current_player:
+            raise AuctionError("No player is up for auction!")
+        if self.lot_mode == 'open':
+            raise AuctionError("Sealed bids are only accepted in sealed and Vickrey lots!")
+        if manager_name not in self.managers:
+            raise AuctionError(f"Unknown manager: {manager_name}")
+        if manager_name in self.sealed_bids:
+            raise BidError(f"{manager_name} has already submitted a bid for this lot!")
+        if amount < self.current_player.base_price:
+            raise BidError(f"Bid must be at least the base price €{self.current_player.base_price}!")
+        
+        reason = self.rules.bid_rejection_reason(self.managers[manager_name], amount, self.current_player.category)
+        if reason:
+            raise BidError(reason)
+        
+        self.sealed_bids[manager_name] = amount
+        self.bid_history.append((self.current_player.name, manager_name, amount))
+    
+    def resolve_sealed_lot(self) -> Player:
+        """Settle a sealed or Vickrey lot in one pass over the submitted bids
+        
+        Bids are re-checked against the rules (limits may have changed since
+        submission); the highest eligible bid wins, earliest submission first
+        on ties. Sealed lots charge the winning bid, Vickrey lots the best
+        losing bid (or the base price with a single bidder). Without an
+        eligible bid the player is marked unsold. Returns the player.
+        """
+        if not self.current_player:
+            raise AuctionError("No player to sell!")
+        if self.lot_mode == 'open':
+            raise AuctionError("Only sealed and Vickrey lots can be resolved!")
+        
+        category = self.current_player.category
+        best = second = None  # (amount, manager name)
+        for name, amount in self.sealed_bids.items():
+            if self.rules.bid_rejection_reason(self.managers[name], amount, category) is not None:
+                continue
+            if best is None or amount > best[0]:
+                best, second = (amount, name), best
+            elif second is None or amount > second[0]:
+                second = (amount, name)
+        
+        if best is None:
+            return self.mark_unsold()
+        
+        if self.lot_mode == 'vickrey':
+            price = second[0] if second is not None else self.current_player.base_price
+        else:
+            price = best[0]
+        
+        self.current_bid = price
+        self.highest_bidder = best[1]
+        return self.sell_player(best[1], price)
+    
+    def cancel_proxy_bid(self, manager_name: str):
+        self.proxy_bids.pop(manager_name, None)
+    
+    def _proxy_level(self, manager_name: str, start: int) -> int:
+        """How many increments above start this manager's proxy would go (0 = cannot raise)"""
+        manager = self.managers[manager_name]
+        increment = self.config.bid_increment
+        category = self.current_player.category
+        if self.rules.bid_rejection_reason(manager, start + increment, category) is not None:
+            return 0
+        cap = min(self.proxy_bids.get(manager_name, start), self.rules.max_bid(manager, category))
+        return max(0, (cap - start) // increment)
+    
+    def _resolve_proxies(self):
+        """Settle competing proxies in one step instead of simulating each increment
+        
+        Every manager climbs the ladder start + k * increment up to the highest
+        rung their proxy and the rules allow. The highest reach wins at one rung
+        above the runner-up (capped at the winner's own reach). Ties go to the
+        standing leader, then to whoever registered their proxy first.
+        """
+        start = self.current_bid
+        leader = self.highest_bidder
+        
+        contenders = [(self._proxy_level(leader, start), leader)] if leader is not None else []
+        for name in self.proxy_bids:
+            if name != leader:
+                contenders.append((self._proxy_level(name, start), name))
+        
+        # Stable sort keeps the leader/registration order for equal levels
+        contenders.sort(key=lambda entry: -entry[0])
+        if not contenders or contenders[0][0] == 0:
+            return
+        
+        winner_level, winner = contenders[0]
+        runner_up = contenders[1][0] if len(contenders) > 1 else 0
+        
+        if winner == leader and runner_up == 0:
+            return  # Nobody can challenge the standing bid
+        
+        level = min(winner_level, runner_up + 1)
+        if level > 0:
+            self._accept_bid(winner, start + level * self.config.bid_increment)
+    
+    def eligible_managers(self, amount: int) -> List[Manager]:
+        """Managers who could buy the current player at the given price"""
+        if not self.current_player:
+            return []
+        category = self.current_player.category
+        return [manager for manager in self.managers.values()
+                if self.rules.bid_rejection_reason(manager, amount, category) is None]
+    
+    def sell_player(self, manager_name: Optional[str] = None, price: Optional[int] = None) -> Player:
+        """Finalize the sale of the current player and return it
+        
+        Defaults to the highest bidder at the current bid.
+        """
+        if not self.current_player:
+            raise AuctionError("No player to sell!")
+        
+        buyer = manager_name if manager_name is not None else self.highest_bidder
+        if buyer is None:
+            raise AuctionError("No bids have been placed!")
+        
+        player = self.current_player
+        self._complete_sale(player, buyer, price if price is not None else self.current_bid)
+        self.reset_lot()
+        return player
+    
+    def _complete_sale(self, player: Player, buyer: str, price: int):
+        player.sold_price = price
+        player.sold_to = buyer
+        player.is_sold = True
+        
+        self.managers[buyer].add_player(player)
+        self.sold_players.append(player)
+        self.new_dead_ends.extend(self.feasibility.record_sale(player, self.managers[buyer]))
+    
+    def take_new_dead_ends(self) -> List[str]:
+        """Dead ends caused since the last call (or found at setup), for the host to warn about"""
+        dead_ends, self.new_dead_ends = self.new_dead_ends, []
+        return dead_ends
+    
+    def mark_unsold(self) -> Player:
+        """Move the current player to the unsold list for re-auction"""
+        if not self.current_player:
+            raise AuctionError("No player to mark as unsold!")
+        
+        player = self.current_player
+        self.unsold_players.append(player)
+        self.unsold_index.add(player)
+        self.search_index.add(player)
+        self.reset_lot()
+        return player
+    
+    def reset_lot(self):
+        """Clear the current lot"""
+        self.bidding_active = False
+        self.current_player = None
+        self.current_bid = 0
+        self.highest_bidder = None
+        self.proxy_bids = {}
+        self.sealed_bids = {}
+        self.scheduler.cancel(self.lot_timer)
+        self.lot_timer = None
+    
+    def open_batch(self, size: int) -> List[Player]:
+        """Open up to size lots at once, drawn like next_player(); returns their players
+        
+        Meant for the tail of a draft, when only cheap leftovers remain.
+        """
+        if self.bidding_active:
+            raise AuctionError("Close the current lot before opening a batch!")
+        if self.batch_lots:
+            raise AuctionError("A batch is already open!")
+        if size < 1:
+            raise AuctionError("A batch needs at least one lot!")
+        
+        while len(self.batch_lots) < size:
+            player = self._draw_player()
+            if player is None:
+                break
+            self.batch_lots[player.name] = BatchLot(player)
+        return [lot.player for lot in self.batch_lots.values()]
+    
+    def batch_rejection_reason(self, manager_name: str, amount: int, category: str) -> Optional[str]:
+        """The rules engine's bid check, counting what the manager already leads in the batch"""
+        manager = self.managers[manager_name]
+        held = self.batch_commitments.get(manager_name)
+        if held is None:
+            return self.rules.bid_rejection_reason(manager, amount, category)
+        
+        # Batch lots the manager leads are as good as bought: their bids are spent
+        # and their players fill roster, category and minimum slots
+        counts = dict(manager.category_counts)
+        for held_category, lots in held.categories.items():
+            counts[held_category] = counts.get(held_category, 0) + lots
+        view = ManagerSnapshot(manager_name, manager.budget - held.amount, manager.player_count + held.lots,
+                               manager.max_players, counts, *self.rules.requirement_totals(counts))
+        reason = self.rules.bid_rejection_reason(view, amount, category)
+        if reason:
+            return f"{reason} (€{held.amount} is committed to {held.lots} other batch lot(s))"
+        return None
+    
+    def batch_bid(self, player_name: str, manager_name: str) -> int:
+        """Raise one batch lot by an increment for a manager and return its new bid
+        
+        The rules engine must allow this bid on top of every other batch lot
+        the manager currently leads, reserve for category minimums included, so settle_batch() can
+        complete all sales without re-checking.
+        """
+        lot = self.batch_lots.get(player_name)
+        if lot is None:
+            raise AuctionError(f"{player_name} is not in the open batch!")
+        if manager_name not in self.managers:
+            raise AuctionError(f"Unknown manager: {manager_name}")
+        if lot.highest_bidder == manager_name:
+            raise BidError(f"{manager_name} already leads the bidding for {player_name}!")
+        
+        new_bid = lot.current_bid + self.config.bid_increment
+        reason = self.batch_rejection_reason(manager_name, new_bid, lot.player.category)
+        if reason:
+            raise BidError(reason)
+        
+        # Outbid leader gets their commitment back
+        if lot.highest_bidder is not None:
+            self.batch_commitments[lot.highest_bidder].add(lot, -1)
+        
+        lot.current_bid = new_bid
+        lot.highest_bidder = manager_name
+        self.bid_history.append((player_name, manager_name, new_bid))
+        self.batch_commitments.setdefault(manager_name, BatchCommitment()).add(lot)
+        return new_bid
+    
+    def settle_batch(self) -> Tuple[List[Player], List[Player]]:
+        """Close every batch lot together; returns (sold, unsold) players"""
+        if not self.batch_lots:
+            raise AuctionError("No batch is open!")
+        
+        sold, unsold = [], []
+        for lot in self.batch_lots.values():
+            if lot.highest_bidder is None:
+                self.unsold_players.append(lot.player)
+                self.unsold_index.add(lot.player)
+                self.search_index.add(lot.player)
+                unsold.append(lot.player)
+            else:
+                self._complete_sale(lot.player, lot.highest_bidder, lot.current_bid)
+                sold.append(lot.player)
+        
+        self.batch_lots = {}
+        self.batch_commitments = {}
+        return sold, unsold
+    
+    def fast_fill(self) -> List[Player]:
+        """Sell leftover unsold players to incomplete teams at base price in one step
+        
+        Only available once the main pool is exhausted. Players that fit no
+        team's remaining slots, category limits or budget stay unsold.
+        Returns the players sold.
+        """
+        if self.bidding_active or self.batch_lots:
+            raise AuctionError("Close the open lots before fast fill!")
+        if self.player_pool:
+            raise AuctionError("Fast fill is only available once the main pool is exhausted!")
+        
+        plan = plan_fast_fill(self.managers.values(), self.unsold_players)
+        filled = set()
+        for player, manager_name in plan:
+            self._complete_sale(player, manager_name, player.base_price)
+            self.unsold_index.discard(player)
+            self.search_index.discard(player)
+            filled.add(id(player))
+        self.unsold_players = deque(player for player in self.unsold_players if id(player) not in filled)
+        return [player for player, _ in plan]
+    
+    def _arm_lot_timer(self, deadline: float):
+        self.scheduler.cancel(self.lot_timer)
+        self.lot_timer = self.scheduler.schedule_at(deadline, self._expire_lot)
+    
+    def _expire_lot(self):
+        """Lot clock ran out: sell to the highest bidder, otherwise mark unsold"""
+        self.lot_timer = None
+        if self.lot_mode != 'open':
+            player = self.resolve_sealed_lot()
+        elif self.highest_bidder is not None:
+            player = self.sell_player()
+        else:
+            player = self.mark_unsold()
+        if self.on_lot_expired is not None:
+            self.on_lot_expired(player)
+    
+    def tick(self, now: Optional[float] = None) -> int:
+        """Fire due lot timers; returns the number of lots closed"""
+        return self.scheduler.run_due(now)
+    
+    def time_remaining(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds left on the current lot, or None for untimed lots"""
+        if self.lot_timer is None:
+            return None
+        now = self.scheduler.clock() if now is None else now
+        return max(0.0, self.lot_timer.deadline - now)
+    
+    def countdown_call(self, now: Optional[float] = None) -> Optional[str]:
+        """'Going once...' / 'Going twice...' near the end of a timed lot"""
+        remaining = self.time_remaining(now)
+        if remaining is None:
+            return None
+        for threshold, call in COUNTDOWN_CALLS:
+            if remaining <= threshold:
+                return call
+        return None
+    
+    def total_budget_left(self) -> int:
+        return sum(manager.budget for manager in self.managers.values())
+    
+    def total_spent(self) -> int:
+        return sum(manager.get_total_spent() for manager in self.managers.values())
+    
+    def results_text(self) -> str:
+        """Formatted text results (what export_text writes)"""
+        
+        lines = [
+            f"{self.config.title.upper()} - AUCTION RESULTS\n",
+            f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            "=" * 50 + "\n\n",
+            # Team summaries
+            "TEAM SUMMARY\n",
+            "=" * 30 + "\n\n",
+        ]
+        
+        for manager in self.managers.values():
+            total_spent = manager.get_total_spent()
+            lines.append(f"{manager.team_name.upper()}\n")
+            lines.append(f"Manager: {manager.name}\n")
+            lines.append(f"Budget Left: €{manager.budget}\n")
+            lines.append(f"Total Spent: €{total_spent}\n")
+            lines.append(f"Players: {len(manager.players)}/{manager.max_players}\n")
+            
+            # Category counts
+            for cat_name, count in manager.category_counts.items():
+                limit = manager.category_limits.get(cat_name, 0)
+                lines.append(f"{cat_name}: {count}/{limit} ")
+            lines.append("\n\nPLAYERS:\n")
+            
+            for player in manager.players:
+                lines.append(f"  • {player.name} ({player.category}) - €{player.sold_price}\n")
+            lines.append("\n" + "-" * 40 + "\n\n")
+        
+        # Statistics
+        lines.append("AUCTION STATISTICS\n")
+        lines.append("=" * 30 + "\n")
+        lines.append(f"Remaining Players: {len(self.player_pool)}\n")
+        lines.append(f"Unsold Players: {len(self.unsold_players)}\n")
+        lines.append(f"Total Budget Used: €{self.total_spent()}\n")
+        return "".join(lines)
+    
+    def results_rows(self) -> List[list]:
+        """CSV rows, header first (what export_csv writes)"""
+        
+        rows = [["Team", "Manager", "Budget Left", "Total Spent", "Player", "Category", "Price"]]
+        for manager in self.managers.values():
+            total_spent = manager.get_total_spent()
+            
+            if manager.players:
+                for player in manager.players:
+                    rows.append([
+                        manager.team_name,
+                        manager.name,
+                        manager.budget,
+                        total_spent,
+                        player.name,
+                        player.category,
+                        player.sold_price
+                    ])
+            else:
+                rows.append([
+                    manager.team_name,
+                    manager.name,
+                    manager.budget,
+                    total_spent,
+                    "No players",
+                    "",
+                    ""
+                ])
+        return rows
+    
+    def export_text(self, filename):
+        """Export as formatted text file"""
+        write_text(filename, self.results_text())
+    
+    def export_csv(self, filename):
+        """Export as CSV file"""
+        write_csv(filename, self.results_rows())
+
+
+def write_text(filename: str, text: str):
+    """Write exported text results (safe to call off the engine's thread)"""
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def write_csv(filename: str, rows: List[list]):
+    """Write exported CSV rows (safe to call off the engine's thread)"""
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        csv.writer(csvfile).writerows(rows)
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Live Auction Service
+Thread-safe wrapper that hosts one AuctionEngine for the web server:
+serializes actions behind a lock, journals them to disk, optionally
+mirrors the live state to SQLite and records server metrics (bids/sec,
+lock wait, fsync latency)
+"""
+
+import collections
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from config_loader import AuctionConfig
+from auction_engine import AuctionEngine, AuctionError
+from live_store import LiveStateStore
+from metrics import MetricsRegistry
+
+# Window (seconds) over which the bids-per-second gauge is averaged
+BID_RATE_WINDOW = 10.0
+
+
+class AuctionService:
+    """One live auction shared by every server request thread"""
+    
+    def __init__(self, config: AuctionConfig, metrics: Optional[MetricsRegistry] = None,
+                 journal_path: Optional[str] = None, engine: Optional[AuctionEngine] = None,
+                 state_path: Optional[str] = None, commit_every: int = 1):
+        self.engine = engine or AuctionEngine(config)
+        self.metrics = metrics or MetricsRegistry()
+        self.version = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._bid_times = collections.deque()
+        self._bid_times_lock = threading.Lock()
+        
+        # Rules table for the current lot, recomputed at most once per state version
+        self._eligibility = {}
+        self._eligibility_version = -1
+        
+        self._journal = open(journal_path, 'a', encoding='utf-8') if journal_path else None
+        self._closed = False
+        
+        self.bids_total = self.metrics.counter(
+            "auction_bids_total", "Accepted bids", ("manager",))
+        self.bids_rejected = self.metrics.counter(
+            "auction_bids_rejected_total", "Bids refused by the rules engine")
+        self.metrics.gauge(
+            "auction_bids_per_second", f"Accepted bids per second over the last {BID_RATE_WINDOW:.0f}s",
+            function=self.bids_per_second)
+        self.lock_wait = self.metrics.histogram(
+            "auction_engine_lock_wait_seconds", "Time spent waiting for the engine lock", ("action",))
+        self.fsync_latency = self.metrics.histogram(
+            "auction_journal_fsync_seconds", "Journal write + fsync latency")
+        self.state_commit_latency = self.metrics.histogram(
+            "auction_state_save_seconds", "Live state SQLite write (and commit) latency per action")
+        
+        # Crash-safe SQLite copy; a saved auction for the same config is resumed
+        self._store = None
+        if state_path:
+            self._store = LiveStateStore(state_path, commit_every)
+            self.version = self._store.start(self.engine)
+        
+        # Timed lots: one thread sleeps until the engine's next deadline
+        self.engine.on_lot_expired = self._on_lot_expired
+        self._timer_thread = None
+        if self.engine.config.lot_seconds > 0:
+            self._timer_thread = threading.Thread(target=self._run_lot_timers, name="lot-timers", daemon=True)
+            self._timer_thread.start()
+    
+    @contextmanager
+    def locked(self, action: str):
+        """Hold the engine lock, recording how long it took to acquire"""
+        start = time.perf_counter()
+        with self._lock:
+            self.lock_wait.observe(time.perf_counter() - start, action=action)
+            yield self.engine
+    
+    def bids_per_second(self) -> float:
+        cutoff = time.monotonic() - BID_RATE_WINDOW
+        with self._bid_times_lock:
+            while self._bid_times and self._bid_times[0] < cutoff:
+                self._bid_times.popleft()
+            return len(self._bid_times) / BID_RATE_WINDOW
+    
+    def _record(self, action: str, **details):
+        """Bump the state version and append the action to the journal (caller holds the lock)"""
+        self.version += 1
+        self._changed.notify_all()
+        if self._store is not None:
+            start = time.perf_counter()
+            self._store.save(self.engine, self.version, action, details)
+            self.state_commit_latency.observe(time.perf_counter() - start)
+        if self._journal is None:
+            return
+        
+        entry = {"version": self.version, "time": time.time(), "action": action}
+        entry.update(details)
+        start = time.perf_counter()
+        self._journal.write(json.dumps(entry) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self.fsync_latency.observe(time.perf_counter() - start)
+    
+    def _run_lot_timers(self):
+        """Fire expired lots; any recorded change wakes the thread to re-read the deadline"""
+        with self._lock:
+            while not self._closed:
+                self.engine.tick()
+                self._changed.wait(self.engine.scheduler.time_until_next())
+    
+    def _on_lot_expired(self, player):
+        if player.is_sold:
+            self._record("sell", player=player.name, category=player.category,
+                         manager=player.sold_to, price=player.sold_price, timed=True)
+        else:
+            self._record("unsold", player=player.name, timed=True)
+    
+    def _current_eligibility(self) -> Dict[str, Dict[str, Any]]:
+        """Per-manager bid/pass table for the current lot (caller holds the lock)"""
+        if self._eligibility_version != self.version:
+            self._eligibility = self.engine.eligibility()
+            self._eligibility_version = self.version
+        return self._eligibility
+    
+    def state(self) -> Dict[str, Any]:
+        """Snapshot of the current lot and team budgets"""
+        with self.locked("state") as engine:
+            player = engine.current_player
+            return {
+                "version": self.version,
+                "title": engine.config.title,
+                "bidding_active": engine.bidding_active,
+                "current_player": {
+                    "name": player.name,
+                    "category": player.category,
+                    "base_price": player.base_price
+                } if player else None,
+                "current_bid": engine.current_bid,
+                "highest_bidder": engine.highest_bidder,
+                "eligibility": self._current_eligibility(),
+                "time_remaining": engine.time_remaining(),
+                "lot_mode": engine.lot_mode,
+                # Sealed amounts stay private until the lot is resolved
+                "sealed_bidders": list(engine.sealed_bids),
+                "batch_lots": [
+                    {
+                        "name": lot.player.name,
+                        "category": lot.player.category,
+                        "base_price": lot.player.base_price,
+                        "current_bid": lot.current_bid,
+                        "highest_bidder": lot.highest_bidder
+                    }
+                    for lot in engine.batch_lots.values()
+                ],
+                "dead_ends": engine.feasibility.warnings(),
+                "remaining_players": len(engine.player_pool),
+                "unsold_players": len(engine.unsold_players),
+                "managers": [
+                    {
+                        "name": manager.name,
+                        "team_name": manager.team_name,
+                        "budget": manager.budget,
+                        "players": len(manager.players),
+                        "max_players": manager.max_players
+                    }
+                    for manager in engine.managers.values()
+                ]
+            }
+    
+    def search_players(self, prefix: str = '', category: Optional[str] = None, min_price: Optional[int] = None,
+                       max_price: Optional[int] = None, limit: int = 50) -> Dict[str, Any]:
+        """Remaining players matching a name prefix and filters, in name order"""
+        with self.locked("search_players") as engine:
+            players = engine.search_players(prefix, category, min_price, max_price, limit)
+            return {
+                "version": self.version,
+                "players": [
+                    {"name": p.name, "category": p.category, "base_price": p.base_price}
+                    for p in players
+                ]
+            }
+    
+    def wait_for_change(self, since: int, timeout: float) -> Dict[str, Any]:
+        """Long-poll: return the state once its version passes since, or after timeout"""
+        with self._lock:
+            self._changed.wait_for(lambda: self.version > since, timeout)
+        return self.state()
+    
+    def next_player(self, mode: Optional[str] = None) -> Dict[str, Any]:
+        with self.locked("next_player") as engine:
+            if engine.bidding_active:
+                raise AuctionError("Current lot is still open!")
+            player = engine.next_player(mode)
+            if player is None:
+                raise AuctionError("No players left to auction!")
+            self._record("next_player", player=player.name, category=player.category, mode=engine.lot_mode)
+        return self.state()
+    
+    def place_bid(self, manager_name: str) -> Dict[str, Any]:
+        with self.locked("place_bid") as engine:
+            if manager_name not in engine.managers:
+                self.bids_rejected.inc()
+                raise AuctionError(f"Unknown manager: {manager_name}")
+            try:
+                amount = engine.place_bid(manager_name)
+            except AuctionError:
+                self.bids_rejected.inc()
+                raise
+            self._record("bid", manager=manager_name, amount=amount)
+        
+        self.bids_total.inc(manager=manager_name)
+        with self._bid_times_lock:
+            self._bid_times.append(time.monotonic())
+        return self.state()
+    
+    def set_proxy_bid(self, manager_name: str, max_amount: int) -> Dict[str, Any]:
+        with self.locked("set_proxy_bid") as engine:
+            before = (engine.current_bid, engine.highest_bidder)
+            try:
+                engine.set_proxy_bid(manager_name, max_amount)
+            except AuctionError:
+                self.bids_rejected.inc()
+                raise
+            self._record("proxy", manager=manager_name, max_amount=max_amount,
+                         amount=engine.current_bid, leader=engine.highest_bidder)
+            changed = (engine.current_bid, engine.highest_bidder) != before
+            leader = engine.highest_bidder
+        
+        if changed:
+            self.bids_total.inc(manager=leader)
+            with self._bid_times_lock:
+                self._bid_times.append(time.monotonic())
+        return self.state()
+    
+    def submit_sealed_bid(self, manager_name: str, amount: int) -> Dict[str, Any]:
+        with self.locked("submit_sealed_bid") as engine:
+            try:
+                engine.submit_sealed_bid(manager_name, amount)
+            except AuctionError:
+                self.bids_rejected.inc()
+                raise
+            self._record("sealed_bid", manager=manager_name, amount=amount)
+        
+        self.bids_total.inc(manager=manager_name)
+        with self._bid_times_lock:
+            self._bid_times.append(time.monotonic())
+        return self.state()
+    
+    def resolve_sealed_lot(self) -> Dict[str, Any]:
+        with self.locked("resolve_sealed_lot") as engine:
+            player = engine.resolve_sealed_lot()
+            if player.is_sold:
+                self._record("sell", player=player.name, category=player.category,
+                             manager=player.sold_to, price=player.sold_price)
+            else:
+                self._record("unsold", player=player.name)
+        return self.state()
+    
+    def sell_player(self) -> Dict[str, Any]:
+        with self.locked("sell_player") as engine:
+            player = engine.sell_player()
+            self._record("sell", player=player.name, category=player.category,
+                         manager=player.sold_to, price=player.sold_price)
+        return self.state()
+    
+    def mark_unsold(self) -> Dict[str, Any]:
+        with self.locked("mark_unsold") as engine:
+            player = engine.mark_unsold()
+            self._record("unsold", player=player.name)
+        return self.state()
+    
+    def open_batch(self, size: int) -> Dict[str, Any]:
+        with self.locked("open_batch") as engine:
+            players = engine.open_batch(size)
+            if not players:
+                raise AuctionError("No players left to auction!")
+            self._record("open_batch", players=[player.name for player in players])
+        return self.state()
+    
+    def batch_bid(self, player_name: str, manager_name: str) -> Dict[str, Any]:
+        with self.locked("batch_bid") as engine:
+            try:
+                amount = engine.batch_bid(player_name, manager_name)
+            except AuctionError:
+                self.bids_rejected.inc()
+                raise
+            self._record("batch_bid", player=player_name, manager=manager_name, amount=amount)
+        
+        self.bids_total.inc(manager=manager_name)
+        with self._bid_times_lock:
+            self._bid_times.append(time.monotonic())
+        return self.state()
+    
+    def settle_batch(self) -> Dict[str, Any]:
+        with self.locked("settle_batch") as engine:
+            sold, unsold = engine.settle_batch()
+            self._record("settle_batch",
+                         sold=[{"player": p.name, "category": p.category, "manager": p.sold_to, "price": p.sold_price}
+                               for p in sold],
+                         unsold=[p.name for p in unsold])
+        return self.state()
+    
+    def fast_fill(self) -> Dict[str, Any]:
+        with self.locked("fast_fill") as engine:
+            sold = engine.fast_fill()
+            self._record("fast_fill",
+                         sold=[{"player": p.name, "category": p.category, "manager": p.sold_to, "price": p.sold_price}
+                               for p in sold])
+        return self.state()
+    
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._changed.notify_all()
+        if self._timer_thread is not None:
+            self._timer_thread.join(timeout=5)
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if self._store is not None:
+            self._store.close()
+            self._store = None
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Auction Configuration Loader
+Validates auction config files against a schema once and caches the
+parsed AuctionConfig keyed by file mtime/size and content hash
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+from lot_ordering import ORDER_STRATEGIES
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration does not match the schema"""
+
+
+# Field name -> (type, default, minimum). A default of None marks the field as required.
+CONFIG_SCHEMA: Dict[str, Any] = {
+    'title': (str, None, None),
+    'total_budget': (int, 2000, 1),
+    'bid_increment': (int, 10, 1),
+    'max_players': (int, 7, 1),
+    # Timed lots: 0 leaves closing the lot to the auctioneer
+    'lot_seconds': (int, 0, 0),
+    'bid_extension_seconds': (int, 0, 0),
+    'lot_mode': (str, 'open', None),
+    'player_order': (str, 'random', None),
+    # Optional model from scripts/fit_prices.py; expected prices are shown next to each lot
+    'price_model': (str, '', None),
+    'teams': {
+        'team_name': (str, None, None),
+        'manager_name': (str, None, None),
+    },
+    'categories': {
+        'name': (str, None, None),
+        'max_per_team': (int, 3, 0),
+        # Every team must end with at least min_per_team players of the category;
+        # base_price is what the rules reserve per still-required player
+        'min_per_team': (int, 0, 0),
+        'base_price': (int, 0, 0),
+    },
+    'players': {
+        'name': (str, None, None),
+        'category': (str, None, None),
+        'price': (int, None, 10),
+    },
+}
+
+# open: ascending outcry; sealed: first-price sealed bid; vickrey: second-price sealed bid
+LOT_MODES = ('open', 'sealed', 'vickrey')
+
+_ITEM_LABELS = {'teams': 'team', 'categories': 'category', 'players': 'player'}
+
+
+class AuctionConfig:
+    """Configuration for the auction"""
+    
+    def __init__(self):
+        self.title = "Sports Auction"
+        self.total_budget = 2000
+        self.bid_increment = 10
+        self.max_players = 7
+        self.lot_seconds = 0
+        self.bid_extension_seconds = 0
+        self.lot_mode = 'open'
+        self.player_order = 'random'
+        self.price_model = ''
+        self.teams: List[Dict[str, str]] = []
+        self.categories: List[Dict[str, Any]] = []
+        self.players: List[Dict[str, Any]] = []
+        self.is_configured = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the JSON config file layout"""
+        return {
+            'title': self.title,
+            'total_budget': self.total_budget,
+            'bid_increment': self.bid_increment,
+            'max_players': self.max_players,
+            'lot_seconds': self.lot_seconds,
+            'bid_extension_seconds': self.bid_extension_seconds,
+            'lot_mode': self.lot_mode,
+            'player_order': self.player_order,
+            'price_model': self.price_model,
+            'teams': self.teams,
+            'categories': self.categories,
+            'players': list(self.players)
+        }
+
+
+def _check_value(value: Any, spec: Tuple[type, Any, Optional[int]], where: str) -> Any:
+    """Validate a single scalar against its (type, default, minimum) spec"""
+    expected, default, minimum = spec
+    
+    if value is None:
+        if default is None:
+            raise ConfigError(f"Missing required field '{where}'.")
+        return default
+    
+    if expected is int:
+        # bool is a subclass of int; numeric strings come from hand-edited files
+        if isinstance(value, bool):
+            raise ConfigError(f"Field '{where}' must be a number.")
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise ConfigError(f"Field '{where}' must be a number.")
+        if minimum is not None and value < minimum:
+            raise ConfigError(f"Field '{where}' must be at least {minimum}.")
+        return value
+    
+    if not isinstance(value, str):
+        raise ConfigError(f"Field '{where}' must be text.")
+    value = value.strip()
+    if not value and default is None:
+        raise ConfigError(f"Field '{where}' cannot be empty.")
+    return value
+
+
+def _check_list(data: Dict[str, Any], key: str, item_schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Validate a list of objects against an item schema"""
+    items = data.get(key)
+    if not isinstance(items, list) or not items:
+        raise ConfigError(f"Please add at least one {_ITEM_LABELS.get(key, key)}.")
+    
+    result = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ConfigError(f"Entry {index + 1} in '{key}' must be an object.")
+        
+        entry = dict(item)  # Keep unknown keys so newer configs round-trip
+        for field, spec in item_schema.items():
+            entry[field] = _check_value(item.get(field), spec, f"{key}[{index}].{field}")
+        result.append(entry)
+    
+    return result
+
+
+def validate_config(data: Any) -> AuctionConfig:
+    """Validate raw config data and build a typed AuctionConfig"""
+    if not isinstance(data, dict):
+        raise ConfigError("Configuration must be a JSON object.")
+    
+    config = AuctionConfig()
+    for field, spec in CONFIG_SCHEMA.items():
+        if isinstance(spec, dict):
+            setattr(config, field, _check_list(data, field, spec))
+        else:
+            setattr(config, field, _check_value(data.get(field), spec, field))
+    
+    # Cross-field checks
+    config.lot_mode = config.lot_mode.lower()
+    if config.lot_mode not in LOT_MODES:
+        raise ConfigError(f"Field 'lot_mode' must be one of: {', '.join(LOT_MODES)}.")
+    config.player_order = config.player_order.lower()
+    if config.player_order not in ORDER_STRATEGIES:
+        raise ConfigError(f"Field 'player_order' must be one of: {', '.join(ORDER_STRATEGIES)}.")
+    
+    manager_names = [team['manager_name'] for team in config.teams]
+    if len(set(manager_names)) != len(manager_names):
+        raise ConfigError("Manager names must be unique.")
+    
+    category_names = {cat['name'] for cat in config.categories}
+    if len(category_names) != len(config.categories):
+        raise ConfigError("Category names must be unique.")
+    
+    for cat in config.categories:
+        if cat['min_per_team'] > cat['max_per_team']:
+            raise ConfigError(f"Category '{cat['name']}': minimum per team ({cat['min_per_team']}) "
+                              f"cannot be greater than maximum per team ({cat['max_per_team']}).")
+    if sum(cat['min_per_team'] for cat in config.categories) > config.max_players:
+        raise ConfigError("Category minimums add up to more than the maximum players per team.")
+    if sum(cat['min_per_team'] * cat['base_price'] for cat in config.categories) > config.total_budget:
+        raise ConfigError("Category minimums at base price cost more than the budget per team.")
+    
+    seen_players = set()
+    for player in config.players:
+        key = player['name'].lower()
+        if key in seen_players:
+            raise ConfigError(f"A player named '{player['name']}' appears more than once.")
+        seen_players.add(key)
+        
+        if player['category'] not in category_names:
+            raise ConfigError(f"Player '{player['name']}' has unknown category '{player['category']}'.")
+    
+    config.is_configured = True
+    return config
+
+
+# Binary snapshots (see config_snapshot) are recognised by their suffix
+SNAPSHOT_SUFFIX = '.aucsnap'
+
+# Absolute path -> (mtime_ns, size, sha256 hex digest, parsed config)
+_CONFIG_CACHE: Dict[str, Tuple[int, int, str, AuctionConfig]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def load_config_file(filename: str) -> AuctionConfig:
+    """Load and validate a config file, reusing the cached parse when unchanged
+    
+    The returned config is shared between callers and must be treated as read-only.
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    
+    with _CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(path)
+    
+    # Fast path: same mtime and size means no need to even read the file
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[3]
+    
+    if path.endswith(SNAPSHOT_SUFFIX):
+        # Imported here: config_snapshot builds on this module
+        from config_snapshot import load_snapshot
+        
+        # Snapshots are not parsed, so a hash would save nothing
+        config = load_snapshot(path)
+        with _CACHE_LOCK:
+            _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, '', config)
+        return config
+    
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    
+    # File was touched or copied but the content is identical
+    if cached and cached[2] == digest:
+        config = cached[3]
+    else:
+        try:
+            data = json.loads(raw.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ConfigError(f"Invalid JSON in {filename}: {e}")
+        config = validate_config(data)
+    
+    with _CACHE_LOCK:
+        _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, digest, config)
+    
+    return config
+
+
+def clear_config_cache():
+    """Drop all cached configs"""
+    with _CACHE_LOCK:
+        _CONFIG_CACHE.clear()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Config Snapshots
+Compact binary form of a validated auction config for very large player
+pools. Players are fixed-width records (name offset and length into a
+UTF-8 string table, category index, price) behind a small JSON header
+holding everything else. Loading is one read of the file and a header
+check; records are decoded from those bytes on access, so a 100k-player
+pool skips json.load, schema validation and one dict per player. The file
+is not kept open, so it can be replaced while a loaded config is in use.
+
+Layout (little-endian):
+    header   HEADER struct: magic, format version, counts and section offsets
+    settings UTF-8 JSON of the config without its players
+    records  RECORD struct per player
+    strings  player names, concatenated UTF-8
+"""
+
+import json
+import struct
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, Tuple
+
+from config_loader import AuctionConfig, ConfigError, validate_config
+
+MAGIC = b'AUCSNAP\x00'
+FORMAT_VERSION = 1
+
+# magic, version, category count, player count, settings offset/length, records offset, strings offset/length
+HEADER = struct.Struct('<8sHHIQQQQQ')
+# name offset, name length, category index, price
+RECORD = struct.Struct('<IHHI')
+
+
+class SnapshotPlayers(Sequence):
+    """Read-only view of a snapshot's player records as config player dicts"""
+    
+    def __init__(self, buffer, count: int, records_offset: int, strings_offset: int, categories):
+        self._buffer = buffer
+        self._count = count
+        self._records_offset = records_offset
+        self._strings_offset = strings_offset
+        self._categories = categories
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("player index out of range")
+        name_offset, name_length, category, price = RECORD.unpack_from(
+            self._buffer, self._records_offset + index * RECORD.size)
+        start = self._strings_offset + name_offset
+        name = self._buffer[start:start + name_length].decode('utf-8')
+        return {'name': name, 'category': self._categories[category], 'price': price}
+    
+    def rows(self) -> Iterator[Tuple[str, str, int]]:
+        """(name, category, price) for every player in one pass over the records"""
+        end = self._records_offset + self._count * RECORD.size
+        records = memoryview(self._buffer)[self._records_offset:end]
+        strings = self._strings_offset
+        buffer = self._buffer
+        categories = self._categories
+        try:
+            for name_offset, name_length, category, price in RECORD.iter_unpack(records):
+                start = strings + name_offset
+                yield buffer[start:start + name_length].decode('utf-8'), categories[category], price
+        finally:
+            records.release()
+
+
+def player_rows(players) -> Iterator[Tuple[str, str, int]]:
+    """(name, category, price) for config players, whether dicts or snapshot records"""
+    if isinstance(players, SnapshotPlayers):
+        return players.rows()
+    return ((player['name'], player['category'], player['price']) for player in players)
+
+
+def write_snapshot(data: Dict[str, Any], path: str) -> AuctionConfig:
+    """Validate raw config data and write it as a snapshot; returns the validated config"""
+    config = validate_config(data)
+    settings = config.to_dict()
+    players = settings.pop('players')
+    category_index = {category['name']: index for index, category in enumerate(config.categories)}
+    
+    names = bytearray()
+    records = bytearray(RECORD.size * len(players))
+    for index, player in enumerate(players):
+        encoded = player['name'].encode('utf-8')
+        if len(encoded) > 0xFFFF or player['price'] > 0xFFFFFFFF:
+            raise ConfigError(f"Player '{player['name']}' does not fit the snapshot format.")
+        RECORD.pack_into(records, index * RECORD.size, len(names), len(encoded),
+                         category_index[player['category']], player['price'])
+        names += encoded
+    
+    settings_bytes = json.dumps(settings, ensure_ascii=False).encode('utf-8')
+    settings_offset = HEADER.size
+    records_offset = settings_offset + len(settings_bytes)
+    strings_offset = records_offset + len(records)
+    
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(config.categories), len(players),
+                            settings_offset, len(settings_bytes), records_offset, strings_offset, len(names)))
+        f.write(settings_bytes)
+        f.write(records)
+        f.write(names)
+    return config
+
+
+def load_snapshot(path: str) -> AuctionConfig:
+    """Load a snapshot as an AuctionConfig whose players are decoded on access
+    
+    The snapshot was validated when written, so only the header is checked.
+    Raises ConfigError for files that are not snapshots of this format.
+    """
+    with open(path, 'rb') as f:
+        buffer = f.read()
+    
+    if not buffer:
+        raise ConfigError(f"{path} is empty, not an auction snapshot.")
+    if len(buffer) < HEADER.size:
+        raise ConfigError(f"{path} is not an auction snapshot.")
+    (magic, version, category_count, player_count, settings_offset, settings_length,
+     records_offset, strings_offset, strings_length) = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ConfigError(f"{path} is not an auction snapshot.")
+    if version != FORMAT_VERSION:
+        raise ConfigError(f"{path} uses snapshot format {version}; this version reads format {FORMAT_VERSION}.")
+    if strings_offset + strings_length > len(buffer) or records_offset + player_count * RECORD.size > strings_offset:
+        raise ConfigError(f"{path} is truncated.")
+    
+    settings = json.loads(buffer[settings_offset:settings_offset + settings_length].decode('utf-8'))
+    config = AuctionConfig()
+    for field, value in settings.items():
+        setattr(config, field, value)
+    categories = [category['name'] for category in config.categories]
+    if len(categories) != category_count:
+        raise ConfigError(f"{path} is corrupt: category count does not match.")
+    
+    config.players = SnapshotPlayers(buffer, player_count, records_offset, strings_offset, categories)
+    config.is_configured = True
+    return config
+
+
+def snapshot_to_dict(path: str) -> Dict[str, Any]:
+    """Config file layout of a snapshot (for converting back to JSON)"""
+    return load_snapshot(path).to_dict()
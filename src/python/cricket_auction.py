@@ -5,123 +5,160 @@ A tkinter-based auction system for fantasy sports player drafts
 Supports customizable teams, categories, and player configurations
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, simpledialog
-import random
-import csv
+import argparse
+import functools
 import json
-from datetime import datetime
-from typing import List, Dict, Optional, Any
+import math
+import time
+from typing import List, Dict, Optional, Any, Tuple
 
-# Optional pygame import for sound effects
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
+from config_loader import AuctionConfig, ConfigError, LOT_MODES, load_config_file, validate_config
+from lot_ordering import ORDER_STRATEGIES
+from auction_engine import AuctionEngine, AuctionError, BidError, Manager, Player, write_csv, write_text
+from instrumentation import Instrumentation
+from io_worker import IOWorker
+from profiling import Profiler
+from season_store import SeasonStore, auction_rows
+from valuation import PriceModel
 
+# tkinter and pygame are imported lazily so the model and engine can be used
+# on display-less hosts (server, simulations, benchmarks) without paying for them
+tk = ttk = messagebox = filedialog = simpledialog = None
+_pygame = None
+_pygame_checked = False
 
-class Player:
-    """Represents a player in the auction"""
-    
-    def __init__(self, name: str, base_price: int, category: str):
-        self.name = name
-        self.base_price = base_price
-        self.category = category
-        self.sold_price = 0
-        self.sold_to = None
-        self.is_sold = False
-    
-    def __repr__(self):
-        return f"Player({self.name}, {self.base_price}, {self.category})"
+# Longest wait at exit for queued background writes (seconds)
+IO_CLOSE_SECONDS = 10
 
+# Remaining player search: category choice meaning "no filter", and rows shown
+ALL_CATEGORIES = "All"
+SEARCH_RESULT_LIMIT = 200
 
-class Manager:
-    """Represents a team manager"""
-    
-    def __init__(self, name: str, team_name: str, budget: int, max_players: int, category_limits: Dict[str, int]):
-        self.name = name
-        self.team_name = team_name
-        self.budget = budget
-        self.initial_budget = budget
-        self.max_players = max_players
-        self.category_limits = category_limits.copy()
-        self.players: List[Player] = []
-        self.category_counts: Dict[str, int] = {cat: 0 for cat in category_limits.keys()}
-    
-    def can_bid(self, amount: int, category: str) -> bool:
-        """Check if manager can place this bid"""
-        if amount > self.budget:
-            return False
-        
-        # Check player limit
-        if len(self.players) >= self.max_players:
-            return False
-        
-        # Check category limit
-        if category in self.category_limits:
-            if self.category_counts[category] >= self.category_limits[category]:
-                return False
-        
-        return True
-    
-    def add_player(self, player: Player):
-        """Add a player to the manager's team"""
-        self.players.append(player)
-        self.budget -= player.sold_price
-        
-        if player.category in self.category_counts:
-            self.category_counts[player.category] += 1
+
+def load_gui():
+    """Import tkinter on first use and bind the module-level GUI names"""
+    global tk, ttk, messagebox, filedialog, simpledialog
+    if tk is None:
+        import tkinter as tk
+        from tkinter import ttk, messagebox, filedialog, simpledialog
+
+
+def load_pygame():
+    """Import pygame on first use, returning None when it is not installed"""
+    global _pygame, _pygame_checked
+    if not _pygame_checked:
+        _pygame_checked = True
+        try:
+            import pygame as _pygame
+        except ImportError:
+            _pygame = None
+    return _pygame
+
+
+def visible_row_range(offset: float, viewport_height: float, row_height: int,
+                      total_rows: int, overscan: int = 2) -> Tuple[int, int]:
+    """Return the [start, end) slice of rows that intersect the viewport"""
+    if total_rows <= 0 or row_height <= 0:
+        return 0, 0
     
-    def remove_player(self, player: Player):
-        """Remove a player from the manager's team"""
-        if player in self.players:
-            self.players.remove(player)
-            self.budget += player.sold_price
-            
-            if player.category in self.category_counts:
-                self.category_counts[player.category] -= 1
+    first = max(0, int(offset // row_height))
+    visible = int(-(-max(viewport_height, 0) // row_height))  # ceil division
+    start = max(0, first - overscan)
+    end = min(total_rows, first + visible + overscan)
+    return start, max(start, end)
+
+
+class VirtualList:
+    """Scrollable text list that only draws the rows currently in view
     
-    def get_budget_left(self) -> int:
-        return self.budget
+    A small pool of canvas text items is re-used as the list scrolls, so the
+    cost of a redraw depends on the viewport height rather than the row count.
+    """
     
-    def get_total_spent(self) -> int:
-        return self.initial_budget - self.budget
+    ROW_HEIGHT = 18
     
-    def get_team_summary(self) -> str:
-        """Get formatted team summary"""
-        summary = f"{self.team_name}\nManager: {self.name}\n€{self.budget} left\n"
+    def __init__(self, parent, height: int = 12, width: int = 240,
+                 font=("Arial", 10), bg='white', fg='black'):
+        self.font = font
+        self.fg = fg
+        self.rows: List[str] = []
+        self.offset = 0
+        self._items: List[int] = []
+        
+        self.frame = tk.Frame(parent, bg=bg)
+        self.canvas = tk.Canvas(
+            self.frame,
+            bg=bg,
+            highlightthickness=0,
+            height=height * self.ROW_HEIGHT,
+            width=width
+        )
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.yview)
         
-        # Category counts
-        for category, count in self.category_counts.items():
-            limit = self.category_limits.get(category, 0)
-            summary += f"{category}: {count}/{limit}, "
-        summary = summary.rstrip(", ") + "\n\n"
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        for player in self.players:
-            summary += f"{player.name} ({player.category}) - €{player.sold_price}\n"
+        self.canvas.bind('<Configure>', lambda e: self.render())
+        self.canvas.bind('<MouseWheel>', self._on_mousewheel)
+    
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+    
+    def set_rows(self, rows: List[str]):
+        """Replace the list contents and redraw the visible window"""
+        self.rows = rows
+        self._clamp_offset()
+        self.render()
+    
+    def yview(self, *args):
+        """Scrollbar callback supporting 'moveto' and 'scroll' commands"""
+        viewport = self.canvas.winfo_height()
+        if args and args[0] == 'moveto':
+            self.offset = float(args[1]) * len(self.rows) * self.ROW_HEIGHT
+        elif args and args[0] == 'scroll':
+            step = self.ROW_HEIGHT if args[2] == 'units' else viewport
+            self.offset += int(args[1]) * step
+        self._clamp_offset()
+        self.render()
+    
+    def render(self):
+        """Draw only the rows that intersect the viewport"""
+        viewport = self.canvas.winfo_height()
+        start, end = visible_row_range(self.offset, viewport, self.ROW_HEIGHT, len(self.rows))
+        
+        # Grow the item pool only when the viewport needs more rows than ever before
+        while len(self._items) < end - start:
+            self._items.append(self.canvas.create_text(6, 0, anchor='nw', font=self.font, fill=self.fg))
+        
+        for i, item in enumerate(self._items):
+            row = start + i
+            if row < end:
+                self.canvas.itemconfigure(item, text=self.rows[row], state=tk.NORMAL)
+                self.canvas.coords(item, 6, row * self.ROW_HEIGHT - self.offset)
+            else:
+                self.canvas.itemconfigure(item, state=tk.HIDDEN)
         
-        return summary
-
-
-class AuctionConfig:
-    """Configuration for the auction"""
-    
-    def __init__(self):
-        self.title = "Sports Auction"
-        self.total_budget = 2000
-        self.bid_increment = 10
-        self.max_players = 7
-        self.teams: List[Dict[str, str]] = []
-        self.categories: List[Dict[str, Any]] = []
-        self.players: List[Dict[str, Any]] = []
-        self.is_configured = False
+        total = len(self.rows) * self.ROW_HEIGHT
+        if total <= viewport or total == 0:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + viewport) / total))
+    
+    def _clamp_offset(self):
+        viewport = self.canvas.winfo_height()
+        max_offset = max(0, len(self.rows) * self.ROW_HEIGHT - viewport)
+        self.offset = min(max(0, self.offset), max_offset)
+    
+    def _on_mousewheel(self, event):
+        self.yview('scroll', int(-1 * (event.delta / 120)), 'units')
+        return "break"
 
 
 class SetupWindow:
     """Setup configuration window for the auction"""
     
     def __init__(self, parent):
+        load_gui()
         self.parent = parent
         self.config = AuctionConfig()
         
@@ -268,6 +305,51 @@ class SetupWindow:
         self.max_players_var = tk.IntVar(value=7)
         players_spin = tk.Spinbox(config_frame, from_=5, to=15, textvariable=self.max_players_var, font=("Arial", 12), width=28)
         players_spin.grid(row=3, column=1, padx=10, pady=5)
+        
+        # Timed lots (0 = auctioneer closes every lot manually)
+        tk.Label(config_frame, text="Lot Timer (seconds, 0 = off):", font=("Arial", 12), fg='white', bg='#1a1a3a').grid(row=4, column=0, sticky='w', pady=5)
+        self.lot_seconds_var = tk.IntVar(value=0)
+        lot_spin = tk.Spinbox(config_frame, from_=0, to=600, increment=5, textvariable=self.lot_seconds_var, font=("Arial", 12), width=28)
+        lot_spin.grid(row=4, column=1, padx=10, pady=5)
+        
+        tk.Label(config_frame, text="Bid Extension (seconds):", font=("Arial", 12), fg='white', bg='#1a1a3a').grid(row=5, column=0, sticky='w', pady=5)
+        self.bid_extension_var = tk.IntVar(value=0)
+        extension_spin = tk.Spinbox(config_frame, from_=0, to=120, textvariable=self.bid_extension_var, font=("Arial", 12), width=28)
+        extension_spin.grid(row=5, column=1, padx=10, pady=5)
+        
+        # Lot format
+        tk.Label(config_frame, text="Lot Mode:", font=("Arial", 12), fg='white', bg='#1a1a3a').grid(row=6, column=0, sticky='w', pady=5)
+        self.lot_mode_var = tk.StringVar(value='open')
+        lot_mode_combo = ttk.Combobox(config_frame, textvariable=self.lot_mode_var, values=LOT_MODES, state='readonly', font=("Arial", 12), width=27)
+        lot_mode_combo.grid(row=6, column=1, padx=10, pady=5)
+        
+        # Order players come up in (random draws, or a fixed sequence)
+        tk.Label(config_frame, text="Player Order:", font=("Arial", 12), fg='white', bg='#1a1a3a').grid(row=7, column=0, sticky='w', pady=5)
+        self.player_order_var = tk.StringVar(value='random')
+        order_combo = ttk.Combobox(config_frame, textvariable=self.player_order_var, values=list(ORDER_STRATEGIES), state='readonly', font=("Arial", 12), width=27)
+        order_combo.grid(row=7, column=1, padx=10, pady=5)
+        
+        # Expected prices learned from past seasons (scripts/fit_prices.py)
+        tk.Label(config_frame, text="Price Model (optional):", font=("Arial", 12), fg='white', bg='#1a1a3a').grid(row=8, column=0, sticky='w', pady=5)
+        self.price_model_entry = tk.Entry(config_frame, font=("Arial", 12), width=30)
+        self.price_model_entry.grid(row=8, column=1, padx=10, pady=5)
+        tk.Button(
+            config_frame,
+            text="Browse...",
+            font=("Arial", 10),
+            bg='#6366f1',
+            fg='white',
+            command=self.browse_price_model
+        ).grid(row=8, column=2, padx=5, pady=5)
+    
+    def browse_price_model(self):
+        filename = filedialog.askopenfilename(
+            title="Select Price Model",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if filename:
+            self.price_model_entry.delete(0, tk.END)
+            self.price_model_entry.insert(0, filename)
     
     def setup_teams_config(self, parent):
         """Setup teams configuration tab"""
@@ -518,7 +600,17 @@ class SetupWindow:
             max_spin = tk.Spinbox(cat_frame, from_=1, to=10, textvariable=max_var, font=("Arial", 10), width=18)
             max_spin.grid(row=2, column=1, padx=5, pady=2)
             
-            self.category_entries.append((cat_entry, max_var))
+            tk.Label(cat_frame, text="Min per Team:", font=("Arial", 10), fg='white', bg='#2d1b69').grid(row=3, column=0, sticky='w', padx=5, pady=2)
+            min_var = tk.IntVar(value=0)
+            min_spin = tk.Spinbox(cat_frame, from_=0, to=10, textvariable=min_var, font=("Arial", 10), width=18)
+            min_spin.grid(row=3, column=1, padx=5, pady=2)
+            
+            tk.Label(cat_frame, text="Base Price (€):", font=("Arial", 10), fg='white', bg='#2d1b69').grid(row=4, column=0, sticky='w', padx=5, pady=2)
+            base_var = tk.IntVar(value=0)
+            base_spin = tk.Spinbox(cat_frame, from_=0, to=10000, increment=5, textvariable=base_var, font=("Arial", 10), width=18)
+            base_spin.grid(row=4, column=1, padx=5, pady=2)
+            
+            self.category_entries.append((cat_entry, max_var, min_var, base_var))
         
         # Update player category dropdown
         self.update_player_categories()
@@ -527,7 +619,7 @@ class SetupWindow:
         """Update the player category dropdown"""
         if hasattr(self, 'player_category_combo'):
             categories = []
-            for cat_entry, _ in self.category_entries:
+            for cat_entry, *_ in self.category_entries:
                 cat_name = cat_entry.get().strip()
                 if cat_name:
                     categories.append(cat_name)
@@ -596,36 +688,46 @@ class SetupWindow:
         if not filename:
             return
         
-        try:
-            config_data = self.get_current_config()
-            
+        config_data = self.get_current_config()
+        
+        def write():
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(config_data, f, indent=2, ensure_ascii=False)
-            
-            messagebox.showinfo("Success", f"Configuration saved to {filename}")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save configuration: {str(e)}")
+        
+        # The form is read here; only the disk write happens on the I/O thread
+        self.parent.run_io(
+            write,
+            lambda _: messagebox.showinfo("Success", f"Configuration saved to {filename}", parent=self.window),
+            lambda e: messagebox.showerror("Error", f"Failed to save configuration: {str(e)}", parent=self.window)
+        )
     
     def load_config(self):
         """Load configuration from file"""
         filename = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            filetypes=[("JSON files", "*.json"), ("Auction snapshots", "*.aucsnap"), ("All files", "*.*")],
             title="Load Configuration"
         )
         
         if not filename:
             return
         
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            
+        def loaded(config_data):
+            if not self.window.winfo_exists():
+                return
             self.load_config_data(config_data)
-            messagebox.showinfo("Success", f"Configuration loaded from {filename}")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load configuration: {str(e)}")
+            messagebox.showinfo("Success", f"Configuration loaded from {filename}", parent=self.window)
+        
+        def failed(e):
+            if not self.window.winfo_exists():
+                return
+            if isinstance(e, ConfigError):
+                messagebox.showerror("Invalid Configuration", str(e), parent=self.window)
+            else:
+                messagebox.showerror("Error", f"Failed to load configuration: {str(e)}", parent=self.window)
+        
+        # Read, parsed and validated on the I/O thread (cached, so reopening is instant);
+        # the form is filled in back on the Tk thread
+        self.parent.run_io(lambda: load_config_file(filename).to_dict(), loaded, failed)
     
     def get_current_config(self):
         """Get current configuration as dictionary"""
@@ -634,6 +736,11 @@ class SetupWindow:
             'total_budget': self.budget_var.get(),
             'bid_increment': self.increment_var.get(),
             'max_players': self.max_players_var.get(),
+            'lot_seconds': self.lot_seconds_var.get(),
+            'bid_extension_seconds': self.bid_extension_var.get(),
+            'lot_mode': self.lot_mode_var.get(),
+            'player_order': self.player_order_var.get(),
+            'price_model': self.price_model_entry.get(),
             'teams': [],
             'categories': [],
             'players': []
@@ -647,10 +754,12 @@ class SetupWindow:
             })
         
         # Categories
-        for cat_entry, max_var in self.category_entries:
+        for cat_entry, max_var, min_var, base_var in self.category_entries:
             config['categories'].append({
                 'name': cat_entry.get(),
-                'max_per_team': max_var.get()
+                'max_per_team': max_var.get(),
+                'min_per_team': min_var.get(),
+                'base_price': base_var.get()
             })
         
         # Players
@@ -674,6 +783,12 @@ class SetupWindow:
         self.budget_var.set(config_data.get('total_budget', 2000))
         self.increment_var.set(config_data.get('bid_increment', 10))
         self.max_players_var.set(config_data.get('max_players', 7))
+        self.lot_seconds_var.set(config_data.get('lot_seconds', 0))
+        self.bid_extension_var.set(config_data.get('bid_extension_seconds', 0))
+        self.lot_mode_var.set(config_data.get('lot_mode', 'open'))
+        self.player_order_var.set(config_data.get('player_order', 'random'))
+        self.price_model_entry.delete(0, tk.END)
+        self.price_model_entry.insert(0, config_data.get('price_model', ''))
         
         # Teams
         teams_data = config_data.get('teams', [])
@@ -695,10 +810,12 @@ class SetupWindow:
         
         for i, cat_data in enumerate(categories_data):
             if i < len(self.category_entries):
-                cat_entry, max_var = self.category_entries[i]
+                cat_entry, max_var, min_var, base_var = self.category_entries[i]
                 cat_entry.delete(0, tk.END)
                 cat_entry.insert(0, cat_data.get('name', ''))
                 max_var.set(cat_data.get('max_per_team', 3))
+                min_var.set(cat_data.get('min_per_team', 0))
+                base_var.set(cat_data.get('base_price', 0))
         
         # Players
         self.players_tree.delete(*self.players_tree.get_children())
@@ -715,53 +832,197 @@ class SetupWindow:
         # Get current configuration
         config_data = self.get_current_config()
         
-        # Validate
-        if not config_data['title']:
-            messagebox.showerror("Error", "Please enter an auction title.")
+        # Validate against the config schema
+        try:
+            self.config = validate_config(config_data)
+        except ConfigError as e:
+            messagebox.showerror("Error", str(e))
             return
         
-        if not config_data['teams']:
-            messagebox.showerror("Error", "Please add at least one team.")
-            return
+        # Close setup window
+        self.window.destroy()
+
+
+class DebugPanel:
+    """Live table of instrumented action latencies (Ctrl+Shift+D)"""
+    
+    COLUMNS = ('Action', 'Count', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)', 'Max (ms)')
+    REFRESH_MS = 1000
+    
+    def __init__(self, parent, instrumentation: Instrumentation):
+        self.instrumentation = instrumentation
         
-        if not config_data['categories']:
-            messagebox.showerror("Error", "Please add at least one category.")
-            return
+        self.window = tk.Toplevel(parent)
+        self.window.title("Debug - Action Latency")
+        self.window.configure(bg='#1a1a3a')
+        self.window.geometry('760x360')
         
-        if not config_data['players']:
-            messagebox.showerror("Error", "Please add at least one player.")
+        self.tree = ttk.Treeview(self.window, columns=self.COLUMNS, show='headings', height=12)
+        for col in self.COLUMNS:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=220 if col == 'Action' else 100, anchor='w' if col == 'Action' else 'e')
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        button_frame = tk.Frame(self.window, bg='#1a1a3a')
+        button_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        
+        tk.Button(
+            button_frame,
+            text="Export JSON",
+            font=("Arial", 11),
+            bg='#6366f1',
+            fg='white',
+            command=self.export_json
+        ).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(
+            button_frame,
+            text="Reset",
+            font=("Arial", 11),
+            bg='#ef4444',
+            fg='white',
+            command=self.reset
+        ).pack(side=tk.LEFT, padx=5)
+        
+        self.refresh()
+    
+    def refresh(self):
+        """Redraw the table and schedule the next refresh while the window is open"""
+        if not self.window.winfo_exists():
             return
         
-        # Validate team names
-        for team in config_data['teams']:
-            if not team['team_name'].strip() or not team['manager_name'].strip():
-                messagebox.showerror("Error", "Please fill in all team and manager names.")
-                return
+        self.tree.delete(*self.tree.get_children())
+        for name, stats in self.instrumentation.snapshot().items():
+            self.tree.insert('', tk.END, values=(
+                name,
+                stats['count'],
+                f"{stats['p50_ms']:.2f}",
+                f"{stats['p95_ms']:.2f}",
+                f"{stats['p99_ms']:.2f}",
+                f"{stats['max_ms']:.2f}"
+            ))
         
-        # Validate categories
-        for category in config_data['categories']:
-            if not category['name'].strip():
-                messagebox.showerror("Error", "Please fill in all category names.")
-                return
+        self.window.after(self.REFRESH_MS, self.refresh)
+    
+    def export_json(self):
+        filename = filedialog.asksaveasfilename(
+            parent=self.window,
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            title="Export Latency Histograms"
+        )
+        if filename:
+            try:
+                self.instrumentation.export_json(filename)
+            except Exception as e:
+                messagebox.showerror("Export Error", f"Failed to export: {str(e)}", parent=self.window)
+    
+    def reset(self):
+        self.instrumentation.reset()
+        self.refresh()
+
+
+class BatchPanel:
+    """Several lots open at once; bids go to the selected row, Settle All closes them together"""
+    
+    COLUMNS = ('Player', 'Category', 'Base', 'Current Bid', 'Leader')
+    
+    def __init__(self, app: "AuctionApp"):
+        self.app = app
+        self.engine = app.engine
         
-        # Set configuration
-        self.config.title = config_data['title']
-        self.config.total_budget = config_data['total_budget']
-        self.config.bid_increment = config_data['bid_increment']
-        self.config.max_players = config_data['max_players']
-        self.config.teams = config_data['teams']
-        self.config.categories = config_data['categories']
-        self.config.players = config_data['players']
-        self.config.is_configured = True
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Batch Lots")
+        self.window.configure(bg='#1a1a3a')
+        self.window.geometry('720x420')
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Close setup window
+        self.tree = ttk.Treeview(self.window, columns=self.COLUMNS, show='headings', height=10, selectmode='browse')
+        for col in self.COLUMNS:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=200 if col == 'Player' else 120, anchor='w' if col == 'Player' else 'center')
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        bid_frame = tk.Frame(self.window, bg='#1a1a3a')
+        bid_frame.pack(fill=tk.X, padx=10)
+        
+        tk.Label(bid_frame, text="Bid on selected lot:", font=("Arial", 11), bg='#1a1a3a', fg='white').pack(side=tk.LEFT)
+        for name in self.engine.managers:
+            tk.Button(
+                bid_frame,
+                text=name,
+                font=("Arial", 10, "bold"),
+                bg='#00ffff',
+                fg='black',
+                command=lambda n=name: self.bid(n)
+            ).pack(side=tk.LEFT, padx=3)
+        
+        tk.Button(
+            self.window,
+            text="Settle All",
+            font=("Arial", 12, "bold"),
+            bg='#ff8c42',
+            fg='white',
+            command=self.settle
+        ).pack(pady=10)
+        
+        self.refresh()
+    
+    def refresh(self):
+        selected = self.tree.selection()
+        self.tree.delete(*self.tree.get_children())
+        for lot in self.engine.batch_lots.values():
+            self.tree.insert('', tk.END, iid=lot.player.name, values=(
+                lot.player.name,
+                lot.player.category,
+                f"€{lot.player.base_price}",
+                f"€{lot.current_bid}",
+                lot.highest_bidder or "-"
+            ))
+        if selected and self.tree.exists(selected[0]):
+            self.tree.selection_set(selected[0])
+    
+    def bid(self, manager_name):
+        selected = self.tree.selection()
+        if not selected:
+            messagebox.showwarning("No Lot Selected", "Select a player in the batch first!", parent=self.window)
+            return
+        try:
+            self.engine.batch_bid(selected[0], manager_name)
+        except BidError as e:
+            messagebox.showwarning("Cannot Bid", str(e), parent=self.window)
+            return
+        self.refresh()
+    
+    def settle(self):
+        sold, unsold = self.engine.settle_batch()
         self.window.destroy()
+        self.app.on_batch_settled(sold, unsold)
+    
+    def on_close(self):
+        if messagebox.askyesno("Settle Batch", "Close the window and settle every lot now?", parent=self.window):
+            self.settle()
 
 
 class AuctionApp:
     """Main auction application"""
     
-    def __init__(self, root):
+    # Display refreshes timed per call when instrumentation is enabled
+    INSTRUMENTED_METHODS = ('update_display', 'update_bid_buttons', 'update_teams_display')
+    
+    # Countdown label refresh interval for timed lots (ms)
+    COUNTDOWN_REFRESH_MS = 250
+    
+    # Suggested number of lots per batch round
+    BATCH_SIZE = 5
+    
+    # How often finished background I/O is checked for while jobs are outstanding (ms)
+    IO_POLL_MS = 50
+    
+    def __init__(self, root, config: Optional[AuctionConfig] = None,
+                 instrumentation: Optional[Instrumentation] = None,
+                 profiler: Optional[Profiler] = None):
+        load_gui()
         self.root = root
         self.root.title("Universal Sports Auction")
         self.root.configure(bg='#1a1a3a')
@@ -769,29 +1030,73 @@ class AuctionApp:
         # Set window to be resizable and centered
         self.center_main_window()
         
-        # Initialize pygame for sound effects (optional)
-        if PYGAME_AVAILABLE:
-            try:
-                pygame.mixer.init()
-                self.sound_enabled = True
-            except:
-                self.sound_enabled = False
-        else:
-            self.sound_enabled = False
+        # Sound effects are optional; pygame is only loaded when first needed
+        self.sound_enabled = None
+        
+        # Opt-in latency instrumentation; a disabled instance keeps call sites unconditional
+        self.instrumentation = instrumentation or Instrumentation(enabled=False)
+        if self.instrumentation.enabled:
+            self.instrumentation.instrument(self, self.INSTRUMENTED_METHODS, prefix='')
+            self.root.bind('<Control-Shift-D>', lambda e: DebugPanel(self.root, self.instrumentation))
+        
+        # Profiling can be started from the hidden menu even without --profile
+        self.profiler = profiler or Profiler()
+        self.root.bind('<Control-Shift-P>', self.show_debug_menu)
         
         # Initialize auction state
         self.config = None
-        self.managers = {}
-        self.player_pool = []
-        self.current_player = None
-        self.current_bid = 0
-        self.highest_bidder = None
-        self.bidding_active = False
-        self.sold_players = []
-        self.unsold_players = []
-        
-        # Show setup window first
-        self.show_setup()
+        self.engine: Optional[AuctionEngine] = None
+        
+        # Single pending after() job that drives the engine's lot timers
+        self.lot_timer_job = None
+        # Open "buy at base price" manager choice; a timed lot can close under it
+        self.base_price_window: Optional[tk.Toplevel] = None
+        self.batch_panel: Optional[BatchPanel] = None
+        self.price_model: Optional[PriceModel] = None
+        
+        # File reads and writes run here so a slow disk never freezes bidding
+        self.io = IOWorker()
+        self.io_poll_job = None
+        
+        if config is not None and config.is_configured:
+            # Pre-validated config (e.g. loaded from file): skip the setup window
+            self.config = config
+            self.initialize_auction()
+            self.setup_gui()
+        else:
+            # Show setup window first
+            self.show_setup()
+    
+    def show_debug_menu(self, event=None):
+        """Hidden operator menu (Ctrl+Shift+P) for capturing profiles from live drafts"""
+        menu = tk.Menu(self.root, tearoff=0)
+        menu.add_command(
+            label="Stop Profiling" if self.profiler.running else "Start Profiling",
+            command=self.toggle_profiling
+        )
+        menu.add_command(label="Save Profile Now", command=self.dump_profile)
+        if self.instrumentation.enabled:
+            menu.add_separator()
+            menu.add_command(label="Latency Panel", command=lambda: DebugPanel(self.root, self.instrumentation))
+        
+        x = event.x_root if event else self.root.winfo_pointerx()
+        y = event.y_root if event else self.root.winfo_pointery()
+        try:
+            menu.tk_popup(x, y)
+        finally:
+            menu.grab_release()
+    
+    def toggle_profiling(self):
+        running = self.profiler.toggle()
+        title = self.root.title().replace(" [profiling]", "")
+        self.root.title(f"{title} [profiling]" if running else title)
+    
+    def dump_profile(self):
+        paths = self.profiler.dump()
+        if paths is None:
+            messagebox.showinfo("Profiling", "No profile captured yet. Start profiling first.")
+            return
+        messagebox.showinfo("Profile Saved", "Profile written to:\n" + "\n".join(paths))
     
     def center_main_window(self):
         """Center and size the main auction window"""
@@ -818,6 +1123,19 @@ class AuctionApp:
         if screen_width >= 1920 and screen_height >= 1080:
             self.root.state('zoomed')  # Fullscreen on Windows
     
+    def run_io(self, job, on_done=None, on_error=None):
+        """Run job() on the I/O thread; on_done(result) or on_error(exc) runs back on the Tk thread"""
+        self.io.submit(job, on_done, on_error)
+        if self.io_poll_job is None:
+            self.io_poll_job = self.root.after(self.IO_POLL_MS, self.poll_io)
+    
+    def poll_io(self):
+        """Run callbacks of finished I/O jobs; keeps polling only while jobs are outstanding"""
+        self.io_poll_job = None
+        self.io.drain()
+        if self.io.pending:
+            self.io_poll_job = self.root.after(self.IO_POLL_MS, self.poll_io)
+    
     def show_setup(self):
         """Show setup configuration window"""
         setup_window = SetupWindow(self)
@@ -832,37 +1150,30 @@ class AuctionApp:
     
     def initialize_auction(self):
         """Initialize auction with configuration"""
+        self.engine = AuctionEngine(self.config)
+        self.engine.on_lot_expired = self.on_lot_expired
+        self.fast_fill_offered = False
         
-        # Create managers
-        self.managers = {}
-        
-        # Calculate category limits
-        category_limits = {cat['name']: cat['max_per_team'] for cat in self.config.categories}
-        
-        for team in self.config.teams:
-            manager = Manager(
-                name=team['manager_name'],
-                team_name=team['team_name'],
-                budget=self.config.total_budget,
-                max_players=self.config.max_players,
-                category_limits=category_limits
-            )
-            self.managers[team['manager_name']] = manager
-        
-        # Create player pool with Fisher-Yates shuffle for better randomization
-        self.player_pool = []
-        for player_data in self.config.players:
-            player = Player(
-                name=player_data['name'],
-                base_price=player_data['price'],
-                category=player_data['category']
-            )
-            self.player_pool.append(player)
-        
-        # Shuffle with Fisher-Yates algorithm
-        for i in range(len(self.player_pool) - 1, 0, -1):
-            j = random.randint(0, i)
-            self.player_pool[i], self.player_pool[j] = self.player_pool[j], self.player_pool[i]
+        # Loaded once; each lot's expected price is then a dict lookup
+        self.price_model = None
+        if self.config.price_model:
+            try:
+                self.price_model = PriceModel.load(self.config.price_model)
+            except (OSError, ValueError) as e:
+                messagebox.showwarning("Price Model", f"Could not load the price model: {e}")
+    
+    def init_sound(self) -> bool:
+        """Initialize the pygame mixer on first use (optional)"""
+        if self.sound_enabled is None:
+            pygame = load_pygame()
+            self.sound_enabled = False
+            if pygame is not None:
+                try:
+                    pygame.mixer.init()
+                    self.sound_enabled = True
+                except Exception:
+                    pass
+        return self.sound_enabled
     
     def setup_gui(self):
         """Create the main GUI layout"""
@@ -907,6 +1218,9 @@ class AuctionApp:
         # Control buttons
         self.setup_control_buttons()
         
+        # Remaining player search
+        self.setup_search_section()
+        
         # Teams section
         self.setup_teams_section()
         
@@ -949,6 +1263,18 @@ class AuctionApp:
             bg='#2d1b69'
         )
         self.status_label.pack(pady=15)
+        
+        # Dead ends stay listed here until the draft is finishable again
+        self.dead_end_label = tk.Label(
+            self.status_frame,
+            text="",
+            font=("Arial", 11),
+            fg='#ef4444',
+            bg='#2d1b69',
+            justify=tk.LEFT,
+            wraplength=900
+        )
+        self.dead_end_label.pack(pady=(0, 10))
     
     def setup_auction_section(self):
         """Create the current auction display"""
@@ -991,6 +1317,15 @@ class AuctionApp:
         )
         self.current_bid_label.pack()
         
+        self.countdown_label = tk.Label(
+            bid_info_frame,
+            text="",
+            font=("Arial", 16, "bold"),
+            fg='#ff8c42',
+            bg='#2d1b69'
+        )
+        self.countdown_label.pack()
+        
         # Bidding buttons frame
         self.bidding_frame = tk.Frame(self.auction_frame, bg='#2d1b69')
         self.bidding_frame.pack(pady=20)
@@ -1007,10 +1342,10 @@ class AuctionApp:
         self.bid_buttons = {}
         
         # Calculate grid layout
-        num_managers = len(self.managers)
+        num_managers = len(self.engine.managers)
         cols = min(3, num_managers)  # Max 3 columns
         
-        for i, (manager_name, manager) in enumerate(self.managers.items()):
+        for i, (manager_name, manager) in enumerate(self.engine.managers.items()):
             row = i // cols
             col = i % cols
             
@@ -1051,6 +1386,18 @@ class AuctionApp:
             )
             bid_btn.pack(pady=5)
             
+            # Proxy (maximum) bid button
+            proxy_btn = tk.Button(
+                manager_frame,
+                text="Max Bid...",
+                font=("Arial", 10),
+                bg='#6366f1',
+                fg='white',
+                width=18,
+                command=lambda m=manager_name: self.set_proxy_bid(m)
+            )
+            proxy_btn.pack(pady=(0, 5))
+            
             # Pass button
             pass_btn = tk.Button(
                 manager_frame,
@@ -1065,6 +1412,7 @@ class AuctionApp:
             
             self.bid_buttons[manager_name] = {
                 'bid': bid_btn,
+                'proxy': proxy_btn,
                 'pass': pass_btn,
                 'frame': manager_frame
             }
@@ -1081,6 +1429,7 @@ class AuctionApp:
             ("SOLD!", "#ff8c42", self.sell_player),
             ("Buy at Base Price", "#8b5cf6", self.buy_at_base_price),
             ("UNSOLD", "#ef4444", self.mark_unsold),
+            ("Batch Lots", "#0ea5e9", self.open_batch),
             ("Export Results", "#6366f1", self.export_teams),
             ("Back to Setup", "#6b7280", self.back_to_setup)
         ]
@@ -1109,12 +1458,84 @@ class AuctionApp:
                 self.base_price_btn = btn
             elif text == "UNSOLD":
                 self.unsold_btn = btn
+            elif text == "Batch Lots":
+                self.batch_btn = btn
         
         # Initially disable some buttons
         self.sold_btn.config(state=tk.DISABLED)
         self.base_price_btn.config(state=tk.DISABLED)
         self.unsold_btn.config(state=tk.DISABLED)
     
+    def setup_search_section(self):
+        """Create the remaining player search (name prefix, category and price filters)"""
+        
+        search_frame = tk.Frame(self.scrollable_frame, bg='#2d1b69', relief=tk.RAISED, bd=2)
+        search_frame.pack(pady=10, padx=20, fill=tk.X)
+        
+        tk.Label(
+            search_frame,
+            text="🔍 Find Remaining Player",
+            font=("Arial", 16, "bold"),
+            fg='#ffd700',
+            bg='#2d1b69'
+        ).pack(pady=(10, 5))
+        
+        fields_frame = tk.Frame(search_frame, bg='#2d1b69')
+        fields_frame.pack(pady=5)
+        
+        self.search_var = tk.StringVar()
+        self.search_category_var = tk.StringVar(value=ALL_CATEGORIES)
+        self.search_min_var = tk.StringVar()
+        self.search_max_var = tk.StringVar()
+        
+        tk.Label(fields_frame, text="Name:", font=("Arial", 12), fg='white', bg='#2d1b69').grid(row=0, column=0, padx=5)
+        tk.Entry(fields_frame, textvariable=self.search_var, font=("Arial", 12), width=24).grid(row=0, column=1, padx=5)
+        
+        tk.Label(fields_frame, text="Category:", font=("Arial", 12), fg='white', bg='#2d1b69').grid(row=0, column=2, padx=5)
+        categories = [ALL_CATEGORIES] + [cat['name'] for cat in self.config.categories]
+        ttk.Combobox(fields_frame, textvariable=self.search_category_var, values=categories, state='readonly',
+                     font=("Arial", 12), width=14).grid(row=0, column=3, padx=5)
+        
+        tk.Label(fields_frame, text="Price €:", font=("Arial", 12), fg='white', bg='#2d1b69').grid(row=0, column=4, padx=5)
+        tk.Entry(fields_frame, textvariable=self.search_min_var, font=("Arial", 12), width=7).grid(row=0, column=5)
+        tk.Label(fields_frame, text="to", font=("Arial", 12), fg='white', bg='#2d1b69').grid(row=0, column=6, padx=3)
+        tk.Entry(fields_frame, textvariable=self.search_max_var, font=("Arial", 12), width=7).grid(row=0, column=7)
+        
+        self.search_count_label = tk.Label(search_frame, text="", font=("Arial", 11), fg='#a0a9c0', bg='#2d1b69')
+        self.search_count_label.pack()
+        
+        self.search_results = VirtualList(search_frame, height=8, width=520, font=("Arial", 11),
+                                          bg='#1a1a3a', fg='white')
+        self.search_results.pack(pady=(5, 10))
+        
+        # Every keystroke re-runs the (sub-millisecond) index search
+        for var in (self.search_var, self.search_category_var, self.search_min_var, self.search_max_var):
+            var.trace_add('write', lambda *args: self.update_search_results())
+    
+    def update_search_results(self):
+        """Show the remaining players matching the search fields"""
+        
+        def price(var):
+            text = var.get().strip()
+            return int(text) if text.isdigit() else None
+        
+        prefix = self.search_var.get().strip()
+        category = self.search_category_var.get()
+        category = None if category == ALL_CATEGORIES else category
+        players = self.engine.search_players(prefix, category, price(self.search_min_var),
+                                             price(self.search_max_var), limit=SEARCH_RESULT_LIMIT)
+        
+        unsold = self.engine.unsold_index
+        self.search_results.set_rows([
+            f"{'🔄 ' if player in unsold.players(player.category) else ''}{player.name} | "
+            f"{player.category} | €{player.base_price}"
+            for player in players
+        ])
+        if len(players) == SEARCH_RESULT_LIMIT:
+            self.search_count_label.config(text=f"First {SEARCH_RESULT_LIMIT} matching players - type more to narrow")
+        else:
+            self.search_count_label.config(text=f"{len(players)} remaining player(s) match")
+    
     def setup_teams_section(self):
         """Create the teams display"""
         
@@ -1136,10 +1557,10 @@ class AuctionApp:
         self.team_frames = {}
         
         # Calculate grid layout for teams
-        num_teams = len(self.managers)
+        num_teams = len(self.engine.managers)
         cols = min(3, num_teams)  # Max 3 columns
         
-        for i, (manager_name, manager) in enumerate(self.managers.items()):
+        for i, (manager_name, manager) in enumerate(self.engine.managers.items()):
             row = i // cols
             col = i % cols
             
@@ -1203,66 +1624,53 @@ class AuctionApp:
             players_frame = tk.Frame(team_frame, bg='#2d1b69')
             players_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
             
-            # Create scrollable text widget for players
-            players_text = tk.Text(
-                players_frame,
-                font=("Arial", 10),
-                bg='white',
-                fg='black',
-                height=12,
-                width=30,
-                wrap=tk.WORD
-            )
-            
-            players_scrollbar = ttk.Scrollbar(players_frame, orient=tk.VERTICAL, command=players_text.yview)
-            players_text.configure(yscrollcommand=players_scrollbar.set)
-            
-            players_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            players_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            # Virtualized roster list: only visible rows are drawn
+            players_list = VirtualList(players_frame, height=12, width=240)
+            players_list.pack(fill=tk.BOTH, expand=True)
+            players_list.set_rows(self.get_roster_rows(manager))
             
             self.team_frames[manager_name] = {
                 'frame': team_frame,
                 'budget_label': budget_label,
                 'category_label': category_label,
-                'players_text': players_text
+                'players_list': players_list
             }
     
+    def get_roster_rows(self, manager: Manager) -> List[str]:
+        """Format a manager's roster as one display row per player"""
+        if not manager.players:
+            return ["No players yet"]
+        return [
+            f"{i}. {player.name} ({player.category}) - €{player.sold_price}"
+            for i, player in enumerate(manager.players, 1)
+        ]
+    
     def next_player(self):
         """Select the next player for auction"""
         
+        # Offer fast fill once, when only re-auctions of unsold players are left
+        only_unsold_left = self.engine.unsold_players and not self.engine.player_pool
+        lots_closed = not (self.engine.bidding_active or self.engine.batch_lots)
+        if only_unsold_left and lots_closed and not self.fast_fill_offered:
+            self.fast_fill_offered = True
+            if self.offer_fast_fill():
+                return
+        
         try:
-            current_player = None
+            current_player = self.engine.next_player()
             
-            # First prioritize regular players from the main pool
-            if self.player_pool:
-                # Select random player from main pool
-                random_index = random.randint(0, len(self.player_pool) - 1)
-                current_player = self.player_pool.pop(random_index)
-            elif self.unsold_players:
-                # Only after all regular players are done, re-auction unsold players randomly
-                random_index = random.randint(0, len(self.unsold_players) - 1)
-                current_player = self.unsold_players.pop(random_index)
-            else:
+            if current_player is None:
                 # Check if all teams have enough players
-                all_teams_complete = all(
-                    len(manager.players) >= manager.max_players 
-                    for manager in self.managers.values()
-                )
-                if all_teams_complete:
+                if self.engine.all_teams_complete():
                     messagebox.showinfo("Auction Complete", "🎉 All teams are complete! Auction finished!")
                 else:
                     messagebox.showinfo("Players Needed", "Some teams still need players, but no more players available!")
                 return
             
-            # Set current player
-            self.current_player = current_player
-            self.current_bid = current_player.base_price
-            self.highest_bidder = None
-            self.bidding_active = True
-            
             # Update display
             self.update_display()
             self.update_bid_buttons()
+            self.schedule_lot_timer()
             
             # Enable control buttons
             self.sold_btn.config(state=tk.NORMAL)
@@ -1275,65 +1683,145 @@ class AuctionApp:
     def place_bid(self, manager_name):
         """Place a bid for a manager"""
         
-        if not self.bidding_active or not self.current_player:
+        if not self.engine.bidding_active or not self.engine.current_player:
             return
         
-        manager = self.managers[manager_name]
-        new_bid = self.current_bid + self.config.bid_increment
+        if self.engine.lot_mode != 'open':
+            self.submit_sealed_bid(manager_name)
+            return
         
-        if manager.can_bid(new_bid, self.current_player.category):
-            self.current_bid = new_bid
-            self.highest_bidder = manager_name
-            
-            self.update_display()
-            self.update_bid_buttons()
-            
-            # Play sound effect if available
-            if self.sound_enabled:
-                try:
-                    # You can add a sound file here if desired
-                    pass
-                except:
-                    pass
-        else:
+        start = time.perf_counter()
+        try:
+            self.engine.place_bid(manager_name)
+        except BidError as e:
             # Provide feedback why bid failed
-            if new_bid > manager.budget:
-                messagebox.showwarning("Cannot Bid", f"{manager_name} doesn't have enough budget!")
-            elif len(manager.players) >= manager.max_players:
-                messagebox.showwarning("Cannot Bid", f"{manager_name}'s team is full!")
-            else:
-                category_limit = manager.category_limits.get(self.current_player.category, 0)
-                current_count = manager.category_counts.get(self.current_player.category, 0)
-                messagebox.showwarning("Cannot Bid", 
-                    f"{manager_name} has reached the {self.current_player.category} limit ({current_count}/{category_limit})!")
+            messagebox.showwarning("Cannot Bid", str(e))
+            return
+        
+        self.update_display()
+        self.update_bid_buttons()
+        self.schedule_lot_timer()
+        
+        # Bid click to UI updated
+        self.instrumentation.record('place_bid', time.perf_counter() - start)
+        
+        # Play sound effect if available
+        if self.init_sound():
+            try:
+                # You can add a sound file here if desired
+                pass
+            except:
+                pass
+    
+    def set_proxy_bid(self, manager_name):
+        """Ask for a manager's maximum and let the engine bid on their behalf"""
+        
+        if not self.engine.bidding_active or not self.engine.current_player:
+            return
+        
+        next_bid = self.engine.current_bid + self.config.bid_increment
+        max_amount = simpledialog.askinteger(
+            "Maximum Bid",
+            f"Highest amount {manager_name} will pay for {self.engine.current_player.name}\n"
+            f"(bids are placed automatically, one increment at a time):",
+            parent=self.root,
+            minvalue=self.engine.current_bid,
+            initialvalue=self.engine.proxy_bids.get(manager_name, next_bid)
+        )
+        if max_amount is None:
+            return
+        
+        try:
+            self.engine.set_proxy_bid(manager_name, max_amount)
+        except AuctionError as e:
+            messagebox.showwarning("Cannot Bid", str(e))
+            return
+        
+        self.update_display()
+        self.update_bid_buttons()
+        self.schedule_lot_timer()
     
     def pass_bid(self, manager_name):
         """Manager passes on current bid"""
-        print(f"{manager_name} passed on {self.current_player.name if self.current_player else 'current player'}")
+        reason = self.engine.pass_rejection_reason(manager_name)
+        if reason:
+            messagebox.showwarning("Cannot Pass", reason)
+            return
+        print(f"{manager_name} passed on {self.engine.current_player.name if self.engine.current_player else 'current player'}")
+    
+    def submit_sealed_bid(self, manager_name):
+        """Collect one sealed bid from a manager; amounts stay hidden until the lot is resolved"""
+        
+        player = self.engine.current_player
+        # Masked entry so other managers in the room cannot read the amount
+        answer = simpledialog.askstring(
+            "Sealed Bid",
+            f"{manager_name}: your sealed bid for {player.name}\n(one bid only, minimum €{player.base_price}):",
+            parent=self.root,
+            show='*'
+        )
+        if answer is None:
+            return
+        
+        try:
+            amount = int(answer.strip().lstrip('€'))
+        except ValueError:
+            messagebox.showwarning("Cannot Bid", "Please enter a whole number.")
+            return
+        
+        try:
+            self.engine.submit_sealed_bid(manager_name, amount)
+        except AuctionError as e:
+            messagebox.showwarning("Cannot Bid", str(e))
+            return
+        
+        self.update_display()
+        self.update_bid_buttons()
+    
+    def resolve_sealed_lot(self):
+        """Open the sealed envelopes and settle the lot in one step"""
+        
+        player = self.engine.resolve_sealed_lot()
+        
+        self.update_display()
+        self.update_teams_display()
+        
+        # Disable control buttons
+        self.sold_btn.config(state=tk.DISABLED)
+        self.base_price_btn.config(state=tk.DISABLED)
+        self.unsold_btn.config(state=tk.DISABLED)
+        self.update_bid_buttons()
+        
+        if player.is_sold:
+            messagebox.showinfo("Player Sold!", f"🎉 {player.name} sold to {player.sold_to} for €{player.sold_price}!")
+        else:
+            messagebox.showinfo("Player Unsold", f"No valid sealed bids - {player.name} will be re-auctioned later!")
     
     def sell_player(self):
         """Sell the current player to highest bidder or at base price"""
         
-        if not self.current_player:
+        if not self.engine.current_player:
             messagebox.showwarning("No Player", "No player to sell!")
             return
         
+        # Sealed lots open the envelopes; Buy at Base Price sets the buyer directly
+        if self.engine.lot_mode != 'open' and self.engine.highest_bidder is None:
+            self.resolve_sealed_lot()
+            return
+        
         # If no one has bid yet, check eligible managers for base price
-        if self.highest_bidder is None:
-            eligible_managers = []
-            for manager in self.managers.values():
-                if manager.can_bid(self.current_player.base_price, self.current_player.category):
-                    eligible_managers.append(manager)
+        if self.engine.highest_bidder is None:
+            eligible_managers = self.engine.eligible_managers(self.engine.current_player.base_price)
             
             if len(eligible_managers) == 0:
                 messagebox.showwarning("No Eligible Managers", "No manager can afford this player!")
                 return
             elif len(eligible_managers) == 1:
                 # Only one manager can afford - sell at base price
-                self.highest_bidder = eligible_managers[0].name
-                self.current_bid = self.current_player.base_price
+                self.engine.highest_bidder = eligible_managers[0].name
+                self.engine.current_bid = self.engine.current_player.base_price
                 messagebox.showinfo("Base Price Sale", 
-                    f"{self.current_player.name} sold to {self.highest_bidder} at base price €{self.current_bid}!")
+                    f"{self.engine.current_player.name} sold to {self.engine.highest_bidder} at base price €{self.engine.current_bid}!")
             else:
                 # Multiple managers can afford - they need to bid
                 messagebox.showwarning("Multiple Bidders Possible", 
@@ -1341,24 +1829,8 @@ class AuctionApp:
                 return
         
         # Finalize the sale
-        self.current_player.sold_price = self.current_bid
-        self.current_player.sold_to = self.highest_bidder
-        self.current_player.is_sold = True
-        
-        manager = self.managers[self.highest_bidder]
-        manager.add_player(self.current_player)
-        self.sold_players.append(self.current_player)
-        
-        # Store sale info for message
-        sold_player_name = self.current_player.name
-        sold_to = self.highest_bidder
-        sold_price = self.current_bid
-        
-        # Reset auction state
-        self.bidding_active = False
-        self.current_player = None
-        self.current_bid = 0
-        self.highest_bidder = None
+        start = time.perf_counter()
+        sold_player = self.engine.sell_player()
         
         # Update displays
         self.update_display()
@@ -1370,33 +1842,35 @@ class AuctionApp:
         self.unsold_btn.config(state=tk.DISABLED)
         self.update_bid_buttons()
         
-        messagebox.showinfo("Player Sold!", f"🎉 {sold_player_name} sold to {sold_to} for €{sold_price}!")
+        # Sale to team cards refreshed (excludes the confirmation dialog)
+        self.instrumentation.record('sell_player', time.perf_counter() - start)
+        
+        messagebox.showinfo("Player Sold!", f"🎉 {sold_player.name} sold to {sold_player.sold_to} for €{sold_player.sold_price}!")
     
     def buy_at_base_price(self):
         """Buy current player at base price"""
         
-        if not self.current_player:
+        if not self.engine.current_player:
             messagebox.showwarning("No Player", "No player to buy!")
             return
         
-        eligible_managers = []
-        for manager in self.managers.values():
-            if manager.can_bid(self.current_player.base_price, self.current_player.category):
-                eligible_managers.append(manager)
+        eligible_managers = self.engine.eligible_managers(self.engine.current_player.base_price)
         
         if len(eligible_managers) == 0:
             messagebox.showwarning("No Eligible Managers", "No manager can afford this player at base price!")
             return
         elif len(eligible_managers) == 1:
-            self.highest_bidder = eligible_managers[0].name
-            self.current_bid = self.current_player.base_price
+            self.engine.highest_bidder = eligible_managers[0].name
+            self.engine.current_bid = self.engine.current_player.base_price
             self.sell_player()
         else:
             # Show selection dialog
             manager_names = [m.name for m in eligible_managers]
+            player = self.engine.current_player
             
             # Create selection window
             selection_window = tk.Toplevel(self.root)
+            self.base_price_window = selection_window
             selection_window.title("Select Manager")
             selection_window.configure(bg='#1a1a3a')
             selection_window.geometry('400x300')
@@ -1404,7 +1878,7 @@ class AuctionApp:
             
             tk.Label(
                 selection_window,
-                text=f"Who wants to buy {self.current_player.name}\nat base price €{self.current_player.base_price}?",
+                text=f"Who wants to buy {player.name}\nat base price €{player.base_price}?",
                 font=("Arial", 14, "bold"),
                 fg='white',
                 bg='#1a1a3a'
@@ -1425,9 +1899,13 @@ class AuctionApp:
                 ).pack(pady=5)
             
             def confirm_selection():
-                if selected_manager.get():
-                    self.highest_bidder = selected_manager.get()
-                    self.current_bid = self.current_player.base_price
+                # grab_set() does not hold back after() jobs, so the lot may have timed out
+                if self.engine.current_player is not player:
+                    selection_window.destroy()
+                    messagebox.showwarning("Lot Closed", f"{player.name} is no longer up for auction.")
+                elif selected_manager.get():
+                    self.engine.highest_bidder = selected_manager.get()
+                    self.engine.current_bid = player.base_price
                     selection_window.destroy()
                     self.sell_player()
                 else:
@@ -1451,22 +1929,70 @@ class AuctionApp:
                 command=selection_window.destroy
             ).pack()
     
+    def schedule_lot_timer(self):
+        """Wake up at the next lot deadline (or countdown refresh) with one after() job"""
+        if self.lot_timer_job is not None:
+            self.root.after_cancel(self.lot_timer_job)
+            self.lot_timer_job = None
+        
+        if self.engine is None:
+            return
+        remaining = self.engine.scheduler.time_until_next()
+        if remaining is None:
+            return
+        delay_ms = min(int(math.ceil(remaining * 1000)), self.COUNTDOWN_REFRESH_MS)
+        self.lot_timer_job = self.root.after(delay_ms, self.on_lot_timer)
+    
+    def on_lot_timer(self):
+        self.lot_timer_job = None
+        if self.engine is None:
+            return
+        self.engine.tick()
+        self.update_countdown()
+        self.schedule_lot_timer()
+    
+    def on_lot_expired(self, player):
+        """Engine closed a timed lot: refresh like a manual sale or unsold"""
+        if self.base_price_window is not None and self.base_price_window.winfo_exists():
+            self.base_price_window.destroy()
+        self.base_price_window = None
+        
+        self.update_display()
+        self.update_teams_display()
+        
+        # Disable control buttons
+        self.sold_btn.config(state=tk.DISABLED)
+        self.base_price_btn.config(state=tk.DISABLED)
+        self.unsold_btn.config(state=tk.DISABLED)
+        self.update_bid_buttons()
+        
+        if player.is_sold:
+            result = f"🔨 Sold! {player.name} to {player.sold_to} for €{player.sold_price}"
+        else:
+            result = f"⌛ Time's up - {player.name} unsold, will be re-auctioned later"
+        self.countdown_label.config(text=result)
+    
+    def update_countdown(self):
+        """Show the time left on a timed lot with a going once/twice call near the end"""
+        remaining = self.engine.time_remaining()
+        if remaining is None:
+            return
+        
+        text = f"⏱️ {int(math.ceil(remaining))}s"
+        call = self.engine.countdown_call()
+        if call:
+            text += f"  {call}"
+        self.countdown_label.config(text=text)
+    
     def mark_unsold(self):
         """Mark current player as unsold and add to unsold players list"""
         
-        if not self.current_player:
+        if not self.engine.current_player:
             messagebox.showwarning("No Player", "No player to mark as unsold!")
             return
         
         # Add player back to unsold list for re-auction
-        self.unsold_players.append(self.current_player)
-        player_name = self.current_player.name
-        
-        # Reset auction state
-        self.bidding_active = False
-        self.current_player = None
-        self.current_bid = 0
-        self.highest_bidder = None
+        player_name = self.engine.mark_unsold().name
         
         # Update display
         self.update_display()
@@ -1479,20 +2005,78 @@ class AuctionApp:
         
         messagebox.showinfo("Player Unsold", f"{player_name} will be re-auctioned later!")
     
+    def offer_fast_fill(self) -> bool:
+        """Offer to hand the unsold players out at base price; returns True if the fill ran"""
+        
+        if not messagebox.askyesno(
+            "Fast Fill",
+            "The main pool is exhausted. Assign the remaining unsold players to "
+            "incomplete teams at base price instead of re-auctioning them?"
+        ):
+            return False
+        
+        sold = self.engine.fast_fill()
+        
+        self.update_display()
+        self.update_bid_buttons()
+        self.update_teams_display()
+        
+        lines = [f"🎉 {p.name} → {p.sold_to} (€{p.sold_price})" for p in sold] or ["No remaining player fits any team."]
+        if self.engine.unsold_players:
+            lines.append(f"\n{len(self.engine.unsold_players)} player(s) still unsold")
+        messagebox.showinfo("Fast Fill Complete", "\n".join(lines))
+        return True
+    
+    def open_batch(self):
+        """Auction several leftover players at once in a BatchPanel"""
+        
+        if self.batch_panel is not None and self.batch_panel.window.winfo_exists():
+            self.batch_panel.window.lift()
+            return
+        if self.engine.bidding_active:
+            messagebox.showwarning("Lot Open", "Sell or pass the current player before opening a batch!")
+            return
+        
+        size = simpledialog.askinteger(
+            "Batch Lots",
+            "How many players should be auctioned at once?",
+            parent=self.root,
+            initialvalue=self.BATCH_SIZE,
+            minvalue=1
+        )
+        if size is None:
+            return
+        
+        if not self.engine.open_batch(size):
+            messagebox.showinfo("No Players", "No players left to auction!")
+            return
+        self.batch_panel = BatchPanel(self)
+        self.update_display()
+    
+    def on_batch_settled(self, sold: List[Player], unsold: List[Player]):
+        self.batch_panel = None
+        self.update_display()
+        self.update_teams_display()
+        
+        lines = [f"🎉 {p.name} → {p.sold_to} (€{p.sold_price})" for p in sold]
+        lines += [f"↩️ {p.name} unsold" for p in unsold]
+        messagebox.showinfo("Batch Settled", "\n".join(lines))
+    
     def update_display(self):
         """Update the main auction display"""
         
         # Update status
-        total_budget_left = sum(manager.budget for manager in self.managers.values())
-        total_spent = sum(manager.get_total_spent() for manager in self.managers.values())
+        total_budget_left = self.engine.total_budget_left()
+        total_spent = self.engine.total_spent()
         
-        status_text = f"Players Remaining: {len(self.player_pool)} | Unsold: {len(self.unsold_players)} | "
+        status_text = f"Players Remaining: {len(self.engine.player_pool)} | Unsold: {len(self.engine.unsold_players)} | "
         status_text += f"Total Budget Left: €{total_budget_left} | Total Spent: €{total_spent}"
         self.status_label.config(text=status_text)
+        self.dead_end_label.config(text="\n".join(f"⚠️ {warning}" for warning in self.engine.feasibility.warnings()))
         
         # Update current player display
-        if self.current_player:
-            self.player_name_label.config(text=self.current_player.name, fg='white')
+        if self.engine.current_player:
+            self.player_name_label.config(text=self.engine.current_player.name, fg='white')
             
             category_colors = {
                 'Premium': '#ff8c42',
@@ -1501,55 +2085,100 @@ class AuctionApp:
                 'Veteran': '#ffa500',
                 'International': '#ff69b4'
             }
-            category_color = category_colors.get(self.current_player.category, '#ffd700')
-            
-            self.player_details_label.config(
-                text=f"Category: {self.current_player.category} | Base Price: €{self.current_player.base_price}",
-                fg=category_color
-            )
-            
-            bidder_text = f" - {self.highest_bidder}" if self.highest_bidder else ""
-            self.current_bid_label.config(text=f"Current Bid: €{self.current_bid}{bidder_text}")
+            category_color = category_colors.get(self.engine.current_player.category, '#ffd700')
+            
+            details_text = f"Category: {self.engine.current_player.category} | Base Price: €{self.engine.current_player.base_price}"
+            if self.price_model is not None:
+                expected = self.price_model.expected_price(self.engine.current_player.name, self.engine.current_player.category)
+                if expected is not None:
+                    details_text += f" | Expected: €{expected}"
+            self.player_details_label.config(text=details_text, fg=category_color)
+            
+            if self.engine.lot_mode != 'open':
+                mode_name = "Sealed Bid" if self.engine.lot_mode == 'sealed' else "Vickrey (second price)"
+                submitted = len(self.engine.sealed_bids)
+                self.current_bid_label.config(
+                    text=f"{mode_name}: {submitted}/{len(self.engine.managers)} bids in - press SOLD! to open"
+                )
+            else:
+                bidder_text = f" - {self.engine.highest_bidder}" if self.engine.highest_bidder else ""
+                self.current_bid_label.config(text=f"Current Bid: €{self.engine.current_bid}{bidder_text}")
         else:
             self.player_name_label.config(text="Click 'Next Player' to continue auction", fg='#a0a9c0')
             self.player_details_label.config(text="")
             self.current_bid_label.config(text="")
+        
+        self.countdown_label.config(text="")
+        self.update_countdown()
+        
+        # Draws, sales and unsold players change which players the search finds
+        self.update_search_results()
     
     def update_bid_buttons(self):
         """Update bid button states"""
         
-        if not self.current_player or not self.bidding_active:
+        if not self.engine.current_player or not self.engine.bidding_active:
             # Disable all bid buttons
             for manager_name, buttons in self.bid_buttons.items():
                 buttons['bid'].config(state=tk.DISABLED, text="No Auction")
+                buttons['proxy'].config(state=tk.DISABLED, text="Max Bid...")
                 buttons['pass'].config(state=tk.DISABLED)
                 buttons['frame'].config(bg='#6b7280')  # Gray out
             return
         
-        next_bid = self.current_bid + self.config.bid_increment
+        if self.engine.lot_mode != 'open':
+            self.update_sealed_bid_buttons()
+            return
+        
+        next_bid = self.engine.current_bid + self.config.bid_increment
+        eligibility = self.engine.eligibility()
         
         for manager_name, buttons in self.bid_buttons.items():
-            manager = self.managers[manager_name]
-            
-            can_bid = manager.can_bid(next_bid, self.current_player.category)
+            can_bid = eligibility[manager_name]['can_bid']
             
             if can_bid:
                 buttons['bid'].config(
                     state=tk.NORMAL,
                     text=f"Bid €{next_bid}",
-                    bg='#10b981' if self.highest_bidder != manager_name else '#ffd700'
+                    bg='#10b981' if self.engine.highest_bidder != manager_name else '#ffd700'
                 )
                 buttons['pass'].config(state=tk.NORMAL)
-                buttons['frame'].config(bg='#4f46e5' if self.highest_bidder != manager_name else '#ff8c42')
+                buttons['frame'].config(bg='#4f46e5' if self.engine.highest_bidder != manager_name else '#ff8c42')
             else:
                 buttons['bid'].config(state=tk.DISABLED, text="Cannot Bid", bg='#6b7280')
                 buttons['pass'].config(state=tk.DISABLED)
                 buttons['frame'].config(bg='#6b7280')
+            
+            # The leader may still raise their own maximum
+            proxy_max = self.engine.proxy_bids.get(manager_name)
+            buttons['proxy'].config(
+                state=tk.NORMAL if can_bid or self.engine.highest_bidder == manager_name else tk.DISABLED,
+                text=f"Max €{proxy_max}" if proxy_max else "Max Bid..."
+            )
+    
+    def update_sealed_bid_buttons(self):
+        """One sealed bid per manager; the button locks once they have submitted"""
+        
+        player = self.engine.current_player
+        for manager_name, buttons in self.bid_buttons.items():
+            manager = self.engine.managers[manager_name]
+            buttons['proxy'].config(state=tk.DISABLED, text="Max Bid...")
+            buttons['pass'].config(state=tk.DISABLED)
+            
+            if manager_name in self.engine.sealed_bids:
+                buttons['bid'].config(state=tk.DISABLED, text="Bid Sealed ✓", bg='#ffd700')
+                buttons['frame'].config(bg='#ff8c42')
+            elif self.engine.rules.bid_rejection_reason(manager, player.base_price, player.category) is None:
+                buttons['bid'].config(state=tk.NORMAL, text="Sealed Bid...", bg='#10b981')
+                buttons['frame'].config(bg='#4f46e5')
+            else:
+                buttons['bid'].config(state=tk.DISABLED, text="Cannot Bid", bg='#6b7280')
+                buttons['frame'].config(bg='#6b7280')
     
     def update_teams_display(self):
         """Update all team displays"""
         
-        for manager_name, manager in self.managers.items():
+        for manager_name, manager in self.engine.managers.items():
             team_data = self.team_frames[manager_name]
             
             # Update budget
@@ -1562,111 +2191,61 @@ class AuctionApp:
                 category_text += f" | {cat_name}: {count}/{limit}"
             team_data['category_label'].config(text=category_text)
             
-            # Update players list
-            players_text = team_data['players_text']
-            players_text.delete('1.0', tk.END)
-            
-            if manager.players:
-                for i, player in enumerate(manager.players, 1):
-                    players_text.insert(tk.END, f"{i}. {player.name}\n")
-                    players_text.insert(tk.END, f"   ({player.category}) - €{player.sold_price}\n\n")
-            else:
-                players_text.insert(tk.END, "No players yet")
+            # Update players list (only the visible window is redrawn)
+            team_data['players_list'].set_rows(self.get_roster_rows(manager))
+        
+        self.warn_dead_ends()
+    
+    def warn_dead_ends(self):
+        """Tell the operator as soon as a sale leaves some roster impossible to complete"""
+        dead_ends = self.engine.take_new_dead_ends()
+        if dead_ends:
+            self.dead_end_label.config(text="\n".join(f"⚠️ {warning}" for warning in self.engine.feasibility.warnings()))
+            messagebox.showwarning("Roster Dead End", "\n\n".join(dead_ends))
     
     def export_teams(self):
         """Export team data to file"""
         
         filename = filedialog.asksaveasfilename(
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"),
+                       ("Season history", "*.db"), ("All files", "*.*")],
             title="Export Auction Results"
         )
         
         if not filename:
             return
         
-        try:
-            if filename.endswith('.csv'):
-                self.export_csv(filename)
-            else:
-                self.export_text(filename)
-            
-            messagebox.showinfo("Export Complete", f"Auction results exported to {filename}")
-            
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
-    
-    def export_text(self, filename):
-        """Export as formatted text file"""
+        if filename.endswith('.db'):
+            season = simpledialog.askstring(
+                "Season History",
+                "Record this auction as season:",
+                parent=self.root,
+                initialvalue=f"{self.config.title} {time.strftime('%Y')}"
+            )
+            if not season:
+                return
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"{self.config.title.upper()} - AUCTION RESULTS\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 50 + "\n\n")
-            
-            # Team summaries
-            f.write("TEAM SUMMARY\n")
-            f.write("=" * 30 + "\n\n")
-            
-            for manager in self.managers.values():
-                total_spent = manager.get_total_spent()
-                f.write(f"{manager.team_name.upper()}\n")
-                f.write(f"Manager: {manager.name}\n")
-                f.write(f"Budget Left: €{manager.budget}\n")
-                f.write(f"Total Spent: €{total_spent}\n")
-                f.write(f"Players: {len(manager.players)}/{manager.max_players}\n")
-                
-                # Category counts
-                for cat_name, count in manager.category_counts.items():
-                    limit = manager.category_limits.get(cat_name, 0)
-                    f.write(f"{cat_name}: {count}/{limit} ")
-                f.write("\n\nPLAYERS:\n")
+        # Results are copied out of the engine here, so bids placed while the
+        # I/O thread writes them cannot change what is exported. Copy and
+        # write are timed separately; 'export' is the write on the I/O thread
+        with self.instrumentation.timer('export_snapshot'):
+            if filename.endswith('.db'):
+                rows = auction_rows(self.engine)
                 
-                for player in manager.players:
-                    f.write(f"  • {player.name} ({player.category}) - €{player.sold_price}\n")
-                f.write("\n" + "-" * 40 + "\n\n")
-            
-            # Statistics
-            f.write("AUCTION STATISTICS\n")
-            f.write("=" * 30 + "\n")
-            f.write(f"Remaining Players: {len(self.player_pool)}\n")
-            f.write(f"Unsold Players: {len(self.unsold_players)}\n")
-            f.write(f"Total Budget Used: €{sum(manager.get_total_spent() for manager in self.managers.values())}\n")
-    
-    def export_csv(self, filename):
-        """Export as CSV file"""
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Write header
-            writer.writerow(["Team", "Manager", "Budget Left", "Total Spent", "Player", "Category", "Price"])
-            
-            # Write team data
-            for manager in self.managers.values():
-                total_spent = manager.get_total_spent()
-                
-                if manager.players:
-                    for player in manager.players:
-                        writer.writerow([
-                            manager.team_name,
-                            manager.name,
-                            manager.budget,
-                            total_spent,
-                            player.name,
-                            player.category,
-                            player.sold_price
-                        ])
-                else:
-                    writer.writerow([
-                        manager.team_name,
-                        manager.name,
-                        manager.budget,
-                        total_spent,
-                        "No players",
-                        "",
-                        ""
-                    ])
+                def write():
+                    with SeasonStore(filename) as store:
+                        store.record_rows(season.strip(), rows)
+            elif filename.endswith('.csv'):
+                write = functools.partial(write_csv, filename, self.engine.results_rows())
+            else:
+                write = functools.partial(write_text, filename, self.engine.results_text())
+        
+        self.run_io(
+            self.instrumentation.wrap('export', write),
+            lambda _: messagebox.showinfo("Export Complete", f"Auction results exported to {filename}"),
+            lambda e: messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+        )
     
     def back_to_setup(self):
         """Return to setup configuration"""
@@ -1678,29 +2257,44 @@ class AuctionApp:
         
         if result:
             # Reset auction state
+            if self.lot_timer_job is not None:
+                self.root.after_cancel(self.lot_timer_job)
+                self.lot_timer_job = None
+            if self.batch_panel is not None and self.batch_panel.window.winfo_exists():
+                self.batch_panel.window.destroy()
+            self.batch_panel = None
             self.config = None
-            self.managers = {}
-            self.player_pool = []
-            self.current_player = None
-            self.current_bid = 0
-            self.highest_bidder = None
-            self.bidding_active = False
-            self.sold_players = []
-            self.unsold_players = []
+            self.engine = None
             
             # Show setup again
             self.show_setup()
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main function to run the application"""
+    parser = argparse.ArgumentParser(description="Universal Sports Auction")
+    parser.add_argument("config", nargs="?", help="JSON config or .aucsnap snapshot to start the auction with directly")
+    parser.add_argument("--instrument", action="store_true",
+                        help="Record action latency histograms (Ctrl+Shift+D opens the debug panel)")
+    parser.add_argument("--profile", nargs="?", const=".", metavar="DIR",
+                        help="Run under cProfile and tracemalloc; writes .pstats and allocation reports to DIR on exit")
+    args = parser.parse_args(argv)
+    
+    profiler = Profiler(args.profile or ".")
+    if args.profile:
+        profiler.start()
+    
+    load_gui()
     root = tk.Tk()
     
     # Set window icon and properties
     root.withdraw()  # Hide initially until setup is complete
     
+    app = None
     try:
-        app = AuctionApp(root)
+        config = load_config_file(args.config) if args.config else None
+        instrumentation = Instrumentation() if args.instrument else None
+        app = AuctionApp(root, config, instrumentation, profiler)
         
         # Show window if auction was configured
         if app.config and app.config.is_configured:
@@ -1712,6 +2306,16 @@ def main():
     except Exception as e:
         messagebox.showerror("Application Error", f"An error occurred: {str(e)}")
         root.quit()
+    finally:
+        # Let queued saves and exports reach the disk before exiting
+        if app is not None and not app.io.close(timeout=IO_CLOSE_SECONDS):
+            print("⚠️ Some file writes were still running at exit")
+        
+        # Anything captured (from --profile or the hidden menu) is saved on exit
+        paths = profiler.dump()
+        if paths:
+            print(f"📊 Profile written to {paths[0]}")
+            print(f"📊 Top allocations written to {paths[1]}")
 
 
 if __name__ == "__main__":
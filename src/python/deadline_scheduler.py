@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Deadline Scheduler
+Single min-heap of timers driven by an external tick, so any number of
+countdowns costs one wake-up at the earliest deadline instead of one
+Tk after() or thread per timer
+"""
+
+import heapq
+import itertools
+import time
+from typing import Any, Callable, List, Optional
+
+
+class Timer:
+    """Handle for a scheduled callback; cancel() is O(1)"""
+    
+    __slots__ = ('deadline', 'callback', 'args', 'cancelled')
+    
+    def __init__(self, deadline: float, callback: Callable, args: tuple):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+    
+    def cancel(self):
+        self.cancelled = True
+
+
+class DeadlineScheduler:
+    """Min-heap of timers keyed by deadline on a monotonic clock"""
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._heap: List[list] = []
+        self._sequence = itertools.count()
+        self._cancelled = 0
+    
+    def __len__(self) -> int:
+        return len(self._heap) - self._cancelled
+    
+    def schedule(self, delay: float, callback: Callable, *args: Any) -> Timer:
+        """Run callback(*args) once delay seconds have passed"""
+        return self.schedule_at(self.clock() + delay, callback, *args)
+    
+    def schedule_at(self, deadline: float, callback: Callable, *args: Any) -> Timer:
+        timer = Timer(deadline, callback, args)
+        heapq.heappush(self._heap, [deadline, next(self._sequence), timer])
+        return timer
+    
+    def cancel(self, timer: Optional[Timer]):
+        """Cancel a timer lazily; it is dropped when it reaches the top of the heap"""
+        if timer is None or timer.cancelled:
+            return
+        timer.cancel()
+        self._cancelled += 1
+        
+        # Compact once dead entries dominate so repeated re-arming cannot grow the heap
+        if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+    
+    def next_deadline(self) -> Optional[float]:
+        """Earliest pending deadline, or None when nothing is scheduled"""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+        return self._heap[0][0] if self._heap else None
+    
+    def time_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest deadline (0 if overdue), or None"""
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - (self.clock() if now is None else now))
+    
+    def run_due(self, now: Optional[float] = None) -> int:
+        """Fire every timer whose deadline has passed; returns how many ran"""
+        now = self.clock() if now is None else now
+        fired = 0
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > now:
+                return fired
+            timer = heapq.heappop(self._heap)[2]
+            # Mark fired timers cancelled so a late cancel() is a no-op
+            timer.cancelled = True
+            timer.callback(*timer.args)
+            fired += 1
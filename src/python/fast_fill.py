@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Fast Fill
+Assigns leftover players to incomplete rosters at base price in one step,
+using augmenting-path matching so an earlier placement can move aside for
+a player that only fits on that team
+"""
+
+from typing import List, Tuple
+
+
+class RosterCapacity:
+    """Open slots, budget and per-category room left on one team while planning"""
+    
+    def __init__(self, manager):
+        self.name = manager.name
+        self.slots = manager.max_players - len(manager.players)
+        self.budget = manager.budget
+        self.category_room = {
+            category: limit - manager.category_counts.get(category, 0)
+            for category, limit in manager.category_limits.items()
+        }
+        self.assigned = []
+    
+    def fits(self, player) -> bool:
+        if self.slots <= 0 or player.base_price > self.budget:
+            return False
+        room = self.category_room.get(player.category)
+        return room is None or room > 0
+    
+    def could_fit(self, player) -> bool:
+        """Whether the player fits once every planned player is moved elsewhere"""
+        if self.slots + len(self.assigned) <= 0:
+            return False
+        if player.base_price > self.budget + sum(p.base_price for p in self.assigned):
+            return False
+        room = self.category_room.get(player.category)
+        if room is None:
+            return True
+        return room + sum(1 for p in self.assigned if p.category == player.category) > 0
+    
+    def add(self, player):
+        self.assigned.append(player)
+        self._adjust(player, -1)
+    
+    def remove(self, player):
+        self.assigned.remove(player)
+        self._adjust(player, 1)
+    
+    def _adjust(self, player, sign: int):
+        self.slots += sign
+        self.budget += sign * player.base_price
+        if player.category in self.category_room:
+            self.category_room[player.category] += sign
+
+
+def _place(player, rosters: List[RosterCapacity], visited: set) -> bool:
+    """Kuhn-style augmenting step: fit player directly, or move one planned player off a team"""
+    # Emptiest rosters first so the fill spreads across teams
+    for roster in sorted(rosters, key=lambda r: -r.slots):
+        # Only rosters the player could join at all are edges of the matching
+        if roster.name in visited or not roster.could_fit(player):
+            continue
+        visited.add(roster.name)
+        
+        if roster.fits(player):
+            roster.add(player)
+            return True
+        
+        for other in list(roster.assigned):
+            roster.remove(other)
+            if roster.fits(player) and _place(other, rosters, visited):
+                roster.add(player)
+                return True
+            roster.add(other)
+    return False
+
+
+def plan_fast_fill(managers, players) -> List[Tuple[object, str]]:
+    """Match players to managers at base price; returns (player, manager name) pairs
+    
+    Every pair respects roster size, category limits and remaining budget,
+    counting the other players planned for the same team. Cheaper players
+    are placed first so tight budgets fill as many slots as possible.
+    """
+    rosters = [roster for roster in map(RosterCapacity, managers) if roster.slots > 0]
+    if not rosters:
+        return []
+    
+    for player in sorted(players, key=lambda p: p.base_price):
+        _place(player, rosters, set())
+    
+    return [(player, roster.name) for roster in rosters for player in roster.assigned]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Roster Feasibility
+Tracks whether every team can still complete a legal roster (its category
+minimums within roster size and budget) from the players not yet sold, so
+the operator hears about a dead end when the sale that causes it happens
+rather than at the end of the draft.
+
+Completing the rosters is a transportation problem: category supplies
+flow to manager shortfalls, bounded by each manager's open slots. Any
+remaining player of a category can fill any manager's shortfall in it,
+so the flow exists exactly when every category's supply covers the summed
+shortfalls and every manager has the slots for its own. Budgets are
+checked against the cheapest remaining players of each category, a lower
+bound on the real cost, so every warning is a genuine dead end.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class FeasibilityTracker:
+    """Dead-end checks kept current sale by sale
+    
+    A sale only changes its category's supply, the buyer's roster and the
+    cheapest prices other managers short in that category can hope for, so
+    record_sale() re-checks just those instead of the whole draft.
+    """
+    
+    def __init__(self, managers: Iterable, rules, players: Iterable):
+        self.managers = {manager.name: manager for manager in managers}
+        self.rules = rules
+        
+        # Category -> base prices of the players not yet sold, ascending
+        self.prices: Dict[str, List[int]] = {}
+        for player in players:
+            if not player.is_sold:
+                self.prices.setdefault(player.category, []).append(player.base_price)
+        for prices in self.prices.values():
+            prices.sort()
+        
+        # Category -> managers below its minimum, and their summed shortfall
+        self.short: Dict[str, Set[str]] = {category: set() for category in rules.min_per_team}
+        self.demand: Dict[str, int] = {category: 0 for category in rules.min_per_team}
+        for manager in self.managers.values():
+            for category in rules.min_per_team:
+                shortfall = self.shortfall(manager, category)
+                if shortfall:
+                    self.short[category].add(manager.name)
+                    self.demand[category] += shortfall
+        
+        # (kind, name) -> message for every dead end currently found
+        self.problems: Dict[Tuple[str, str], str] = {}
+        for category in self.short:
+            self._check_category(category)
+        for manager in self.managers.values():
+            self._check_manager(manager)
+    
+    def shortfall(self, manager, category: str) -> int:
+        return max(0, self.rules.min_per_team.get(category, 0) - manager.category_counts.get(category, 0))
+    
+    def record_sale(self, player, manager) -> List[str]:
+        """Update after player joined manager's roster; returns the dead ends it created"""
+        before = set(self.problems)
+        
+        prices = self.prices.get(player.category)
+        if prices:
+            index = bisect_left(prices, player.base_price)
+            if index < len(prices) and prices[index] == player.base_price:
+                prices.pop(index)
+        
+        category = player.category
+        if category in self.short:
+            # The new player counts already, so it filled a shortfall if the team is at or below the minimum
+            if manager.category_counts.get(category, 0) <= self.rules.min_per_team[category]:
+                self.demand[category] -= 1
+            if not self.shortfall(manager, category):
+                self.short[category].discard(manager.name)
+            self._check_category(category)
+            for name in self.short[category]:
+                self._check_manager(self.managers[name])
+        self._check_manager(manager)
+        
+        return [message for key, message in self.problems.items() if key not in before]
+    
+    def warnings(self) -> List[str]:
+        return list(self.problems.values())
+    
+    def is_feasible(self) -> bool:
+        return not self.problems
+    
+    def _set_problem(self, key: Tuple[str, str], message):
+        if message:
+            self.problems[key] = message
+        else:
+            self.problems.pop(key, None)
+    
+    def _check_category(self, category: str):
+        supply = len(self.prices.get(category, ()))
+        demand = self.demand[category]
+        message = None
+        if demand > supply:
+            message = (f"Only {supply} {category} player(s) remain but teams still need {demand} "
+                       f"to reach the minimum of {self.rules.min_per_team[category]}!")
+        self._set_problem(("category", category), message)
+    
+    def _check_manager(self, manager):
+        # O(1) via the manager's running totals
+        open_slots = manager.max_players - manager.player_count
+        message = None
+        if manager.missing_required > open_slots:
+            message = (f"{manager.name} needs {manager.missing_required} more player(s) for the category "
+                       f"minimums but has only {open_slots} open slot(s)!")
+        self._set_problem(("slots", manager.name), message)
+        
+        cheapest = 0
+        for category in manager.category_minimums if manager.missing_required else ():
+            shortfall = self.shortfall(manager, category)
+            if shortfall:
+                cheapest += sum(self.prices.get(category, [])[:shortfall])
+        message = None
+        if cheapest > manager.budget:
+            message = (f"{manager.name} has €{manager.budget} but the cheapest players left for their "
+                       f"category minimums cost €{cheapest}!")
+        self._set_problem(("budget", manager.name), message)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Auction Instrumentation
+Opt-in latency histograms (p50/p95/p99) for auction actions, exportable
+as JSON and shown in the desktop app's debug panel
+"""
+
+import bisect
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterable, Optional
+
+# Log-scale bucket upper bounds from 10µs to ~10s in 10% steps
+BUCKET_BOUNDS: List[float] = [1e-5 * (1.1 ** i) for i in range(146)]
+
+
+class LatencyHistogram:
+    """Fixed-memory latency histogram with log-scale buckets"""
+    
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float):
+        """Record one observation"""
+        index = bisect.bisect_left(BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+    
+    def percentile(self, p: float) -> float:
+        """Approximate p-th percentile (0-100) in seconds; bucket upper bound, capped at max"""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            rank = max(1, int(round(self.count * p / 100.0)))
+            seen = 0
+            for index, bucket_count in enumerate(self.counts):
+                seen += bucket_count
+                if seen >= rank:
+                    bound = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                    return min(bound, self.max)
+            return self.max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary in milliseconds"""
+        return {
+            'count': self.count,
+            'mean_ms': (self.total / self.count * 1000) if self.count else 0.0,
+            'p50_ms': self.percentile(50) * 1000,
+            'p95_ms': self.percentile(95) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'max_ms': self.max * 1000
+        }
+
+
+class Instrumentation:
+    """Registry of named latency histograms"""
+    
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+    
+    def histogram(self, name: str) -> LatencyHistogram:
+        with self._lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = self.histograms[name] = LatencyHistogram()
+            return hist
+    
+    def record(self, name: str, seconds: float):
+        if self.enabled:
+            self.histogram(name).record(seconds)
+    
+    @contextmanager
+    def timer(self, name: str):
+        """Time the enclosed block into the named histogram"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+    
+    def wrap(self, name: str, func):
+        """Return func wrapped so each call is timed into the named histogram"""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return timed
+    
+    def instrument(self, obj: Any, method_names: Iterable[str], prefix: Optional[str] = None):
+        """Replace methods on an instance with timed wrappers
+        
+        Callers that look the method up at call time (button lambdas,
+        internal self.method() calls) see the wrapper.
+        """
+        prefix = prefix if prefix is not None else type(obj).__name__
+        for method_name in method_names:
+            method = getattr(obj, method_name)
+            name = f"{prefix}.{method_name}" if prefix else method_name
+            setattr(obj, method_name, self.wrap(name, method))
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            items = sorted(self.histograms.items())
+        return {name: hist.to_dict() for name, hist in items}
+    
+    def export_json(self, filename: str):
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+    
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
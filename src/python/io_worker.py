@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Background I/O Worker
+Runs file reads and writes on one daemon thread so a slow disk never
+stalls the thread that owns the UI. Jobs run one at a time in the order
+they were submitted, so ordered writes (an appended journal, a save
+followed by an export) land in that order. Completion callbacks never run
+on the worker: they are queued and run by drain(), which the Tk app calls
+from a root.after() poll while jobs are outstanding.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+# Sentinel asking the worker thread to exit
+_STOP = object()
+
+
+class IOWorker:
+    """Single background thread for blocking I/O with callbacks on the owner's thread"""
+    
+    def __init__(self, name: str = "io-worker"):
+        self._jobs: queue.Queue = queue.Queue()
+        self._done: queue.Queue = queue.Queue()
+        self._pending = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+    
+    @property
+    def pending(self) -> int:
+        """Jobs submitted whose callbacks have not run yet"""
+        return self._pending
+    
+    def submit(self, job: Callable[[], Any], on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None):
+        """Queue job() for the worker; on_done(result) or on_error(exc) runs in a later drain()"""
+        self._pending += 1
+        self._jobs.put((job, on_done, on_error))
+    
+    def drain(self) -> int:
+        """Run the callbacks of finished jobs on the calling thread; returns how many ran"""
+        ran = 0
+        while True:
+            try:
+                callback, value = self._done.get_nowait()
+            except queue.Empty:
+                return ran
+            self._pending -= 1
+            ran += 1
+            if callback is not None:
+                callback(value)
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Finish queued jobs and stop the thread; returns False if it is still busy after timeout
+        
+        Callbacks of jobs finished by then are not run: the UI is going away.
+        """
+        self._jobs.put(_STOP)
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+    
+    def _run(self):
+        while True:
+            item = self._jobs.get()
+            if item is _STOP:
+                return
+            job, on_done, on_error = item
+            try:
+                result = job()
+            except Exception as e:
+                self._done.put((on_error, e))
+            else:
+                self._done.put((on_done, result))
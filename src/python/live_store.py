@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Live State Store
+Optional SQLite copy of a running auction so the server survives a crash
+and other processes can read the live state. The database runs in WAL
+mode with synchronous=NORMAL: a commit appends to the write-ahead log
+without an fsync, readers never block the writer, and every read
+transaction sees one consistent version. Each action writes the lot row,
+its journal entry, new bids and only the players and managers it touched,
+always through the same SQL strings so sqlite3 reuses its prepared
+statements. Commits can be batched (commit_every) at the cost of losing
+up to that many actions in a crash.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+from auction_engine import BatchCommitment, BatchLot, CategoryIndex
+from player_search import PlayerSearchIndex
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS lot (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL,
+    player TEXT,
+    current_bid INTEGER NOT NULL,
+    highest_bidder TEXT,
+    bidding_active INTEGER NOT NULL,
+    lot_mode TEXT NOT NULL,
+    proxy_bids TEXT NOT NULL,
+    sealed_bids TEXT NOT NULL,
+    batch TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    base_price INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    sold_to TEXT,
+    sold_price INTEGER
+);
+CREATE TABLE IF NOT EXISTS managers (
+    name TEXT PRIMARY KEY,
+    team_name TEXT NOT NULL,
+    budget INTEGER NOT NULL,
+    players INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bids (
+    seq INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    manager TEXT NOT NULL,
+    amount INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS actions (
+    version INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    action TEXT NOT NULL,
+    details TEXT NOT NULL
+);
+"""
+
+SAVE_LOT = ("INSERT OR REPLACE INTO lot (id, version, player, current_bid, highest_bidder, bidding_active, "
+            "lot_mode, proxy_bids, sealed_bids, batch) VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+SAVE_ACTION = "INSERT OR REPLACE INTO actions (version, time, action, details) VALUES (?, ?, ?, ?)"
+SAVE_BID = "INSERT OR REPLACE INTO bids (seq, player, manager, amount) VALUES (?, ?, ?, ?)"
+SAVE_PLAYER = ("INSERT OR REPLACE INTO players (name, category, base_price, status, position, sold_to, sold_price) "
+               "VALUES (?, ?, ?, ?, ?, ?, ?)")
+SAVE_MANAGER = "INSERT OR REPLACE INTO managers (name, team_name, budget, players) VALUES (?, ?, ?, ?)"
+
+
+def config_fingerprint(config) -> str:
+    """Identifies the auction a state file belongs to"""
+    return hashlib.sha256(json.dumps(config.to_dict(), sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _touched_players(details: Dict[str, Any]) -> Iterable[str]:
+    """Player names an action's journal details mention"""
+    if 'player' in details:
+        yield details['player']
+    yield from details.get('players', ())
+    for sale in details.get('sold', ()):
+        yield sale['player']
+    yield from details.get('unsold', ())
+
+
+class LiveStateStore:
+    """SQLite (WAL) mirror of one live auction, written by a single AuctionService"""
+    
+    def __init__(self, path: str, commit_every: int = 1):
+        # Transactions are managed here so several actions can share one commit
+        self.connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.commit_every = max(1, commit_every)
+        self._pending = 0
+        self._bids_saved = 0
+        self._sequence = 0
+        self._players = {}
+    
+    def fingerprint(self) -> Optional[str]:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'config'").fetchone()
+        return row[0] if row else None
+    
+    def start(self, engine) -> int:
+        """Attach to engine: restore a saved auction for the same config or save a fresh one
+        
+        Returns the state version to continue from. Raises ValueError when
+        the file holds a different auction.
+        """
+        fingerprint = config_fingerprint(engine.config)
+        stored = self.fingerprint()
+        if stored is not None and stored != fingerprint:
+            raise ValueError("The live state file belongs to a different auction config!")
+        
+        self._players = {player.name: player for player in engine.player_pool}
+        if stored is not None:
+            return self._restore(engine)
+        
+        with self.connection:
+            self.connection.execute("BEGIN")
+            self.connection.execute("INSERT INTO meta (key, value) VALUES ('config', ?)", (fingerprint,))
+            self.connection.executemany(SAVE_PLAYER, [
+                (p.name, p.category, p.base_price, 'pool', position, None, None)
+                for position, p in enumerate(engine.player_pool)
+            ])
+            self.connection.executemany(SAVE_MANAGER, [
+                (m.name, m.team_name, m.budget, len(m.players)) for m in engine.managers.values()
+            ])
+            self._save_lot(engine, 0)
+        return 0
+    
+    def save(self, engine, version: int, action: str, details: Dict[str, Any]):
+        """Persist the effect of one action (caller holds the engine lock)"""
+        if self._pending == 0:
+            self.connection.execute("BEGIN")
+        self.connection.execute(SAVE_ACTION, (version, time.time(), action, json.dumps(details)))
+        self._save_lot(engine, version)
+        
+        if len(engine.bid_history) > self._bids_saved:
+            self.connection.executemany(SAVE_BID, [
+                (seq, *bid) for seq, bid in enumerate(engine.bid_history[self._bids_saved:], self._bids_saved)
+            ])
+            self._bids_saved = len(engine.bid_history)
+        
+        buyers = set()
+        for name in _touched_players(details):
+            player = self._players.get(name)
+            if player is None:
+                continue
+            self._save_player(engine, player)
+            if player.is_sold:
+                buyers.add(player.sold_to)
+        for name in buyers:
+            manager = engine.managers[name]
+            self.connection.execute(SAVE_MANAGER, (manager.name, manager.team_name, manager.budget,
+                                                   len(manager.players)))
+        
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.flush()
+    
+    def flush(self):
+        """Commit any batched actions"""
+        if self._pending:
+            self.connection.execute("COMMIT")
+            self._pending = 0
+    
+    def close(self):
+        self.flush()
+        self.connection.close()
+    
+    def _save_lot(self, engine, version: int):
+        player = engine.current_player
+        batch = {name: [lot.current_bid, lot.highest_bidder] for name, lot in engine.batch_lots.items()}
+        self.connection.execute(SAVE_LOT, (
+            version, player.name if player else None, engine.current_bid, engine.highest_bidder,
+            int(engine.bidding_active), engine.lot_mode, json.dumps(engine.proxy_bids),
+            json.dumps(engine.sealed_bids), json.dumps(batch)
+        ))
+    
+    def _save_player(self, engine, player):
+        if player.is_sold:
+            status = 'sold'
+        elif player is engine.current_player:
+            status = 'current'
+        elif player.name in engine.batch_lots:
+            status = 'batch'
+        elif player in engine.unsold_index.players(player.category):
+            status = 'unsold'
+        else:
+            return  # Still in the pool at its saved position
+        # Sales and unsold players are restored in the order they happened
+        self._sequence += 1
+        self.connection.execute(SAVE_PLAYER, (player.name, player.category, player.base_price, status,
+                                              self._sequence, player.sold_to, player.sold_price))
+    
+    def _restore(self, engine) -> int:
+        """Rebuild engine (freshly initialized from the same config) from the saved rows"""
+        with self.connection:
+            self.connection.execute("BEGIN")
+            rows = self.connection.execute(
+                "SELECT name, status, position, sold_to, sold_price FROM players ORDER BY position").fetchall()
+            lot = self.connection.execute(
+                "SELECT version, player, current_bid, highest_bidder, bidding_active, lot_mode, "
+                "proxy_bids, sealed_bids, batch FROM lot WHERE id = 1").fetchone()
+            bids = self.connection.execute("SELECT player, manager, amount FROM bids ORDER BY seq").fetchall()
+        
+        by_status: Dict[str, List] = {'pool': [], 'unsold': [], 'sold': [], 'current': [], 'batch': []}
+        for name, status, position, sold_to, sold_price in rows:
+            by_status[status].append((self._players[name], sold_to, sold_price))
+            self._sequence = max(self._sequence, position)
+        
+        engine.player_pool = [player for player, _, _ in by_status['pool']]
+        engine.pool_index = CategoryIndex(engine.player_pool)
+        engine.unsold_players = deque(player for player, _, _ in by_status['unsold'])
+        engine.unsold_index = CategoryIndex(engine.unsold_players)
+        engine.search_index = PlayerSearchIndex(engine.player_pool + list(engine.unsold_players))
+        for player, sold_to, sold_price in by_status['sold']:
+            engine._complete_sale(player, sold_to, sold_price)
+        engine.take_new_dead_ends()
+        
+        version, current, current_bid, highest_bidder, active, lot_mode, proxies, sealed, batch = lot
+        engine.current_player = self._players[current] if current else None
+        engine.current_bid = current_bid
+        engine.highest_bidder = highest_bidder
+        engine.bidding_active = bool(active)
+        engine.lot_mode = lot_mode
+        engine.proxy_bids = json.loads(proxies)
+        engine.sealed_bids = json.loads(sealed)
+        engine.batch_lots = {}
+        engine.batch_commitments = {}
+        for name, (amount, leader) in json.loads(batch).items():
+            batch_lot = BatchLot(self._players[name])
+            batch_lot.current_bid = amount
+            batch_lot.highest_bidder = leader
+            engine.batch_lots[name] = batch_lot
+            if leader is not None:
+                engine.batch_commitments.setdefault(leader, BatchCommitment()).add(batch_lot)
+        
+        engine.bid_history = [tuple(bid) for bid in bids]
+        self._bids_saved = len(engine.bid_history)
+        
+        # The deadline itself is not saved: a restored timed lot gets a fresh countdown
+        if engine.bidding_active and engine.config.lot_seconds > 0:
+            engine._arm_lot_timer(engine.scheduler.clock() + engine.config.lot_seconds)
+        return version
+
+
+def read_snapshot(path: str) -> Dict[str, Any]:
+    """Current lot and team budgets from another process, as one consistent version"""
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True, isolation_level=None)
+    try:
+        connection.execute("BEGIN")
+        lot = connection.execute(
+            "SELECT version, player, current_bid, highest_bidder, bidding_active, lot_mode FROM lot WHERE id = 1"
+        ).fetchone()
+        managers = connection.execute("SELECT name, team_name, budget, players FROM managers ORDER BY rowid").fetchall()
+        remaining = connection.execute("SELECT COUNT(*) FROM players WHERE status = 'pool'").fetchone()[0]
+        connection.execute("COMMIT")
+    finally:
+        connection.close()
+    
+    version, player, current_bid, highest_bidder, active, lot_mode = lot
+    return {
+        "version": version,
+        "current_player": player,
+        "current_bid": current_bid,
+        "highest_bidder": highest_bidder,
+        "bidding_active": bool(active),
+        "lot_mode": lot_mode,
+        "remaining_players": remaining,
+        "managers": [
+            {"name": name, "team_name": team_name, "budget": budget, "players": players}
+            for name, team_name, budget, players in managers
+        ],
+    }
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Lot Ordering
+Strategies for the order in which players come up for auction. Each sort
+key is computed once per player (category rank comes from a dict, never a
+list search inside the comparator). src/web/lot_ordering.js mirrors these
+strategies for the web client.
+"""
+
+import random
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Strategy signature: (players, category name -> configured rank, rng) -> players in auction order
+OrderStrategy = Callable[[List[Any], Dict[str, int], random.Random], List[Any]]
+
+
+def shuffled(players, category_rank, rng):
+    """Uniform random order (Fisher-Yates)"""
+    players = list(players)
+    for i in range(len(players) - 1, 0, -1):
+        j = rng.randint(0, i)
+        players[i], players[j] = players[j], players[i]
+    return players
+
+
+def by_category(players, category_rank, rng):
+    """Categories in configured order, players by name within each; unknown categories last"""
+    unknown = len(category_rank)
+    return sorted(players, key=lambda p: (category_rank.get(p.category, unknown), p.name.casefold()))
+
+
+def by_category_name(players, category_rank, rng):
+    return sorted(players, key=lambda p: (p.category.casefold(), p.name.casefold()))
+
+
+def by_price_ascending(players, category_rank, rng):
+    return sorted(players, key=lambda p: (p.base_price, p.name.casefold()))
+
+
+def by_price_descending(players, category_rank, rng):
+    return sorted(players, key=lambda p: (-p.base_price, p.name.casefold()))
+
+
+def stratified(players, category_rank, rng):
+    """Random order that spreads every category evenly across the auction
+    
+    Players are shuffled within their category, then the i-th of n gets a
+    position in the i-th 1/n of the auction (jittered), so any stretch of
+    lots holds each category in proportion to its size.
+    """
+    groups: Dict[str, List[Any]] = {}
+    for player in players:
+        groups.setdefault(player.category, []).append(player)
+    
+    keyed = []
+    for group in groups.values():
+        group = shuffled(group, category_rank, rng)
+        size = len(group)
+        keyed.extend(((i + rng.random()) / size, player) for i, player in enumerate(group))
+    keyed.sort(key=lambda entry: entry[0])
+    return [player for _, player in keyed]
+
+
+# Strategy name -> function; add entries here to offer new orders in both setup screens
+ORDER_STRATEGIES: Dict[str, OrderStrategy] = {
+    'random': shuffled,
+    'category': by_category,
+    'category-asc': by_category_name,
+    'price-asc': by_price_ascending,
+    'price-desc': by_price_descending,
+    'stratified': stratified,
+}
+
+# Orders whose next lot is drawn at random from the pool rather than taken in sequence
+RANDOM_DRAW_ORDERS = ('random',)
+
+
+def order_players(players: Iterable[Any], order: str = 'random',
+                  categories: Iterable[Dict[str, Any]] = (),
+                  rng: Optional[random.Random] = None) -> List[Any]:
+    """Return players (objects with name, category, base_price) in auction order"""
+    strategy = ORDER_STRATEGIES.get(order)
+    if strategy is None:
+        raise ValueError(f"Unknown player order: {order}")
+    category_rank = {category['name']: rank for rank, category in enumerate(categories)}
+    return strategy(list(players), category_rank, rng or random.Random())
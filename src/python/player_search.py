@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Player Search
+Prefix search over the players still to be auctioned. Names are kept in
+sorted arrays of case-folded keys (one overall, one per category), so a
+prefix is a bisect to the first match followed by a walk that stops after
+`limit` results. Category narrows the array searched.
+
+Each array is also split into name-sorted buckets, one per base price. A
+price-bounded query walks whichever is cheaper: the prefix range, checking
+prices on the way, or the prefix range of every bucket inside the price
+bounds, merged by name. A selective price filter therefore never scans
+names it cannot match.
+
+Drawing a player only clears its entry's live mark, so the per-lot cost
+stays O(1) however large the pool is. The arrays are compacted once dead
+entries (mostly sold players, who never return) outnumber live ones,
+which keeps a walk at most about twice as long as its live matches.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Dict, List, Optional
+
+# Sorts after every character a name can contain, closing a prefix range
+_PREFIX_END = chr(0x10FFFF)
+
+# Name entries one bucket's bisect and merge step are worth when choosing a walk
+_BUCKET_COST = 4
+
+
+def search_key(text: str) -> str:
+    return text.casefold()
+
+
+class _SortedNames:
+    """Parallel arrays of sorted name keys and their players"""
+    
+    def __init__(self, players=()):
+        pairs = sorted(((search_key(p.name), p) for p in players), key=lambda pair: pair[0])
+        self.keys = [key for key, _ in pairs]
+        self.players = [player for _, player in pairs]
+    
+    def insert(self, player):
+        key = search_key(player.name)
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.players.insert(index, player)
+    
+    def prefix_range(self, prefix: str):
+        key = search_key(prefix)
+        return bisect_left(self.keys, key), bisect_left(self.keys, key + _PREFIX_END)
+    
+    def entries(self, start: int, end: int):
+        """(key, player) pairs of a range, in name order"""
+        keys, players = self.keys, self.players
+        return ((keys[index], players[index]) for index in range(start, end))
+
+
+class _PricedNames(_SortedNames):
+    """Sorted names plus the same players split into name-sorted buckets by base price"""
+    
+    def __init__(self, players=()):
+        super().__init__(players)
+        by_price: Dict[int, List] = {}
+        for player in self.players:
+            by_price.setdefault(player.base_price, []).append(player)
+        self.prices = sorted(by_price)
+        self.buckets = {price: _SortedNames(members) for price, members in by_price.items()}
+    
+    def insert(self, player):
+        super().insert(player)
+        bucket = self.buckets.get(player.base_price)
+        if bucket is None:
+            insort(self.prices, player.base_price)
+            self.buckets[player.base_price] = _SortedNames([player])
+        else:
+            bucket.insert(player)
+    
+    def price_range(self, low, high) -> List[int]:
+        """Base prices present between low and high inclusive"""
+        return self.prices[bisect_left(self.prices, low):bisect_right(self.prices, high)]
+
+
+class PlayerSearchIndex:
+    """Remaining players searchable by name prefix, category and base price"""
+    
+    def __init__(self, players=()):
+        self.alive = set()
+        # Index entries the last search looked at, live or dead
+        self.last_visited = 0
+        self._build(players)
+    
+    def _build(self, players):
+        players = list(players)
+        self.alive.update(players)
+        self.indexed = set(players)
+        self.all = _PricedNames(players)
+        by_category: Dict[str, List] = {}
+        for player in players:
+            by_category.setdefault(player.category, []).append(player)
+        self.by_category = {category: _PricedNames(members) for category, members in by_category.items()}
+    
+    def __len__(self) -> int:
+        return len(self.alive)
+    
+    def add(self, player):
+        self.alive.add(player)
+        if player in self.indexed:
+            return
+        # Only players dropped by a compaction while off the market get here
+        self.indexed.add(player)
+        self.all.insert(player)
+        names = self.by_category.get(player.category)
+        if names is None:
+            self.by_category[player.category] = _PricedNames([player])
+        else:
+            names.insert(player)
+    
+    def discard(self, player):
+        self.alive.discard(player)
+        if len(self.indexed) > 2 * len(self.alive) + 64:
+            self._build(self.alive)
+    
+    def search(self, prefix: str = '', category: Optional[str] = None, min_price: Optional[int] = None,
+               max_price: Optional[int] = None, limit: int = 50) -> List:
+        """Up to limit players in name order whose name starts with prefix (case-insensitive)"""
+        self.last_visited = 0
+        names = self.all if category is None else self.by_category.get(category)
+        if names is None or limit <= 0:
+            return []
+        start, end = names.prefix_range(prefix)
+        candidates = names.entries(start, end)
+        
+        low = min_price if min_price is not None else float('-inf')
+        high = max_price if max_price is not None else float('inf')
+        if min_price is not None or max_price is not None:
+            prices = names.price_range(low, high)
+            if len(prices) * _BUCKET_COST < end - start:
+                # Fewer buckets than names to walk: merge the buckets' prefix ranges
+                ranges = []
+                for price in prices:
+                    bucket = names.buckets[price]
+                    ranges.append(bucket.entries(*bucket.prefix_range(prefix)))
+                self.last_visited = len(prices)
+                candidates = heapq.merge(*ranges, key=itemgetter(0))
+        
+        alive = self.alive
+        results = []
+        for _, player in candidates:
+            self.last_visited += 1
+            if player in alive and low <= player.base_price <= high:
+                results.append(player)
+                if len(results) == limit:
+                    break
+        return results
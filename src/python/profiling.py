@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Auction Profiling
+cProfile + tracemalloc capture for the desktop app, started with --profile
+or toggled at runtime, written out as a pstats file and an allocation report
+"""
+
+import cProfile
+import os
+import pstats
+import tracemalloc
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+# Frames from the profilers themselves are noise in the allocation report
+_ALLOCATION_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+]
+
+
+class Profiler:
+    """Start/stop wrapper around cProfile and tracemalloc"""
+    
+    def __init__(self, output_dir: str = ".", top_allocations: int = 25):
+        self.output_dir = output_dir
+        self.top_allocations = top_allocations
+        self.profile: Optional[cProfile.Profile] = None
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.running = False
+        self._owns_tracemalloc = False
+    
+    def start(self):
+        """Begin (or resume) collecting; samples accumulate until dump()"""
+        if self.running:
+            return
+        if self.profile is None:
+            self.profile = cProfile.Profile()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self.profile.enable()
+        self.running = True
+    
+    def stop(self):
+        """Pause collecting and keep the latest allocation snapshot"""
+        if not self.running:
+            return
+        self.profile.disable()
+        self.snapshot = tracemalloc.take_snapshot()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+        self.running = False
+    
+    def toggle(self) -> bool:
+        """Start if stopped, stop if running; returns the new running state"""
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+        return self.running
+    
+    def top_allocation_lines(self) -> List[str]:
+        """Top allocation sites by size from the latest snapshot"""
+        snapshot = tracemalloc.take_snapshot() if self.running else self.snapshot
+        if snapshot is None:
+            return []
+        stats = snapshot.filter_traces(_ALLOCATION_FILTERS).statistics('lineno')
+        return [str(stat) for stat in stats[:self.top_allocations]]
+    
+    def dump(self) -> Optional[Tuple[str, str]]:
+        """Write <stamp>.pstats and <stamp>_allocations.txt; returns both paths"""
+        if self.profile is None:
+            return None
+        
+        was_running = self.running
+        self.stop()
+        
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = datetime.now().strftime("auction_profile_%Y%m%d_%H%M%S")
+        stats_path = os.path.join(self.output_dir, f"{stamp}.pstats")
+        allocations_path = os.path.join(self.output_dir, f"{stamp}_allocations.txt")
+        
+        self.profile.dump_stats(stats_path)
+        
+        with open(allocations_path, 'w', encoding='utf-8') as f:
+            f.write(f"Top {self.top_allocations} allocation sites\n")
+            f.write("=" * 40 + "\n")
+            for line in self.top_allocation_lines():
+                f.write(line + "\n")
+            f.write("\nTop functions by cumulative time\n")
+            f.write("=" * 40 + "\n")
+            stats = pstats.Stats(self.profile, stream=f)
+            stats.sort_stats('cumulative').print_stats(self.top_allocations)
+        
+        # Start a fresh capture window if we were mid-run
+        self.profile = None
+        self.snapshot = None
+        if was_running:
+            self.start()
+        
+        return stats_path, allocations_path
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Bidding Rules
+The one implementation of who may bid on or pass a lot: budget, roster
+size, category limits, and the reserve a manager must keep to complete
+the category minimums and the rest of the roster at base price. The
+desktop engine, the live server and the web client (via the server API)
+all ask this module.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+
+class ManagerSnapshot:
+    """Roster state of a manager sent by a client that keeps its own auction state"""
+    
+    def __init__(self, name: str, budget: int, player_count: int, max_players: int,
+                 category_counts: Dict[str, int], missing_required: int = 0, missing_required_cost: int = 0):
+        self.name = name
+        self.budget = budget
+        self.player_count = player_count
+        self.max_players = max_players
+        self.category_counts = category_counts
+        self.missing_required = missing_required
+        self.missing_required_cost = missing_required_cost
+
+
+class RulesEngine:
+    """Bid and pass rules for one auction configuration
+    
+    Managers are duck-typed: name, budget, player_count, max_players,
+    category_counts and the running totals missing_required (players still
+    needed for category minimums) and missing_required_cost (their base
+    price). The engine's Manager keeps those totals current on every sale,
+    so each check is O(1) however many categories there are.
+    """
+    
+    def __init__(self, categories: Iterable[Dict[str, Any]], bid_increment: int):
+        categories = list(categories)
+        self.bid_increment = bid_increment
+        self.max_per_team = {cat['name']: cat['max_per_team'] for cat in categories}
+        self.min_per_team = {cat['name']: cat.get('min_per_team', 0) for cat in categories}
+        self.base_prices = {cat['name']: cat.get('base_price', 0) for cat in categories}
+        self.lowest_base_price = min(self.base_prices.values(), default=0)
+    
+    @classmethod
+    def from_config(cls, config) -> "RulesEngine":
+        return cls(config.categories, config.bid_increment)
+    
+    def requirement_totals(self, category_counts: Dict[str, int]):
+        """(players still required by minimums, their base-price cost) for a roster; O(categories)"""
+        missing = cost = 0
+        for category, minimum in self.min_per_team.items():
+            short = max(0, minimum - category_counts.get(category, 0))
+            missing += short
+            cost += short * self.base_prices[category]
+        return missing, cost
+    
+    def reserve_needed(self, manager, extra_category: Optional[str] = None) -> int:
+        """Budget needed to buy the still-required players at base price
+        
+        Open slots beyond the category minimums are reserved at the lowest
+        category base price. extra_category counts one more player in that
+        category (the lot being bid on), matching the web client's
+        canManagerAffordBid.
+        """
+        missing = manager.missing_required
+        cost = manager.missing_required_cost
+        player_count = manager.player_count
+        
+        if extra_category is not None:
+            player_count += 1
+            if manager.category_counts.get(extra_category, 0) < self.min_per_team.get(extra_category, 0):
+                missing -= 1
+                cost -= self.base_prices[extra_category]
+        
+        additional = max(0, manager.max_players - player_count - missing)
+        return cost + additional * self.lowest_base_price
+    
+    def available_budget(self, manager) -> int:
+        """Budget left after reserving for the required roster (may be negative)"""
+        return manager.budget - self.reserve_needed(manager)
+    
+    def max_bid(self, manager, category: str) -> int:
+        """Highest amount the reserve allows for a player of category (limits not checked)"""
+        return manager.budget - self.reserve_needed(manager, category)
+    
+    def bid_rejection_reason(self, manager, amount: int, category: str) -> Optional[str]:
+        """Why the manager may not bid amount on a player of category, or None if allowed"""
+        if amount > manager.budget:
+            return f"{manager.name} doesn't have enough budget!"
+        if manager.player_count >= manager.max_players:
+            return f"{manager.name}'s team is full!"
+        
+        limit = self.max_per_team.get(category)
+        count = manager.category_counts.get(category, 0)
+        if limit is not None and count >= limit:
+            return f"{manager.name} has reached the {category} limit ({count}/{limit})!"
+        
+        max_bid = self.max_bid(manager, category)
+        if amount > max_bid:
+            return (f"{manager.name} must keep €{manager.budget - max_bid} to complete the required "
+                    f"players but would have €{manager.budget - amount} left!")
+        return None
+    
+    def pass_rejection_reason(self, manager, category: str, players_left: int) -> Optional[str]:
+        """Why the manager may not pass on a player, or None if allowed
+        
+        players_left counts the category's players still to come, excluding this lot.
+        """
+        needed = self.min_per_team.get(category, 0) - manager.category_counts.get(category, 0)
+        if needed > 0 and players_left < needed:
+            return (f"{manager.name} needs {needed} more {category} player(s) for the minimum of "
+                    f"{self.min_per_team[category]} and only {players_left} remain after this one!")
+        return None
+    
+    def eligibility(self, managers: Iterable[Any], category: str, next_bid: int,
+                    players_left: int) -> Dict[str, Dict[str, Any]]:
+        """Per-manager table for the current lot: bid/pass permission, reasons and spare budget"""
+        table = {}
+        for manager in managers:
+            bid_reason = self.bid_rejection_reason(manager, next_bid, category)
+            pass_reason = self.pass_rejection_reason(manager, category, players_left)
+            table[manager.name] = {
+                "can_bid": bid_reason is None,
+                "next_bid": next_bid,
+                "bid_reason": bid_reason,
+                "can_pass": pass_reason is None,
+                "pass_reason": pass_reason,
+                "available_budget": self.available_budget(manager)
+            }
+        return table
+
+
+def evaluate_snapshot(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Eligibility table for a client-held auction state
+    
+    payload = {"rules": {"bid_increment", "max_players", "categories": [{"name",
+    "max_per_team", "min_per_team", "base_price"}]}, "lot": {"category",
+    "current_bid", "players_left", "managers": [{"name", "budget", "players",
+    "category_counts"}]}}. Raises ValueError when the payload is malformed.
+    """
+    try:
+        config = payload["rules"]
+        lot = payload["lot"]
+        # Cast here: a string limit would otherwise only fail mid-check with a TypeError
+        categories = [{"name": str(cat["name"]), "max_per_team": int(cat["max_per_team"]),
+                       "min_per_team": int(cat.get("min_per_team", 0)), "base_price": int(cat.get("base_price", 0))}
+                      for cat in config["categories"]]
+        rules = RulesEngine(categories, int(config["bid_increment"]))
+        max_players = int(config["max_players"])
+        managers = []
+        for entry in lot["managers"]:
+            counts = {str(name): int(count) for name, count in entry.get("category_counts", {}).items()}
+            managers.append(ManagerSnapshot(str(entry["name"]), int(entry["budget"]), int(entry["players"]),
+                                            max_players, counts, *rules.requirement_totals(counts)))
+        category = str(lot["category"])
+        next_bid = int(lot["current_bid"]) + rules.bid_increment
+        players_left = int(lot.get("players_left", 0))
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Malformed rules request: {e}") from e
+    return rules.eligibility(managers, category, next_bid, players_left)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Season History Store
+Embedded SQLite database of completed auctions: teams, lots, bids and
+sales across seasons. Each auction is written in one transaction with
+executemany, and lots are indexed on player, team, category and season so
+cross-season questions ("average Premium price over the last 5 seasons")
+are answered from the indexes in milliseconds.
+"""
+
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    id INTEGER PRIMARY KEY,
+    season TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS teams (
+    season_id INTEGER NOT NULL,
+    manager TEXT NOT NULL,
+    team TEXT NOT NULL,
+    budget_left INTEGER NOT NULL,
+    PRIMARY KEY (season_id, manager)
+);
+CREATE TABLE IF NOT EXISTS lots (
+    id INTEGER PRIMARY KEY,
+    season_id INTEGER NOT NULL,
+    player TEXT NOT NULL COLLATE NOCASE,
+    category TEXT NOT NULL,
+    base_price INTEGER NOT NULL,
+    team TEXT,
+    manager TEXT,
+    price INTEGER
+);
+CREATE TABLE IF NOT EXISTS bids (
+    season_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    player TEXT NOT NULL COLLATE NOCASE,
+    manager TEXT NOT NULL,
+    amount INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lots_player ON lots (player);
+CREATE INDEX IF NOT EXISTS idx_lots_team ON lots (team);
+CREATE INDEX IF NOT EXISTS idx_lots_category ON lots (category, season_id, price);
+CREATE INDEX IF NOT EXISTS idx_lots_season ON lots (season_id);
+CREATE INDEX IF NOT EXISTS idx_bids_season_player ON bids (season_id, player);
+"""
+
+
+def auction_rows(engine) -> Dict[str, Any]:
+    """Everything record_rows() stores for an auction, copied out of the engine
+    
+    Lots cover every player: sold ones with their buyer and price, the rest
+    (unsold or never drawn) without. Bids come from engine.bid_history.
+    """
+    team_names = {manager.name: manager.team_name for manager in engine.managers.values()}
+    
+    unsold = list(engine.unsold_players) + list(engine.player_pool)
+    if engine.current_player is not None:
+        unsold.append(engine.current_player)
+    unsold.extend(lot.player for lot in engine.batch_lots.values())
+    lots = [(p.name, p.category, p.base_price, team_names.get(p.sold_to), p.sold_to, p.sold_price)
+            for p in engine.sold_players]
+    lots += [(p.name, p.category, p.base_price, None, None, None) for p in unsold]
+    
+    return {
+        "title": engine.config.title,
+        "teams": [(manager.name, manager.team_name, manager.budget) for manager in engine.managers.values()],
+        "lots": lots,
+        "bids": list(engine.bid_history),
+    }
+
+
+class SeasonStore:
+    """Past auctions in one SQLite file; use as a context manager or call close()"""
+    
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+    
+    def close(self):
+        self.connection.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def record_auction(self, season: str, engine) -> int:
+        """Store a completed auction under a season label, replacing any earlier
+        recording of that season; returns the season id
+        """
+        return self.record_rows(season, auction_rows(engine))
+    
+    def record_rows(self, season: str, rows: Dict[str, Any]) -> int:
+        """Store rows gathered by auction_rows(), replacing any earlier recording of season"""
+        with self.connection:
+            self._delete_season(season)
+            season_id = self.connection.execute(
+                "INSERT INTO seasons (season, title, recorded_at) VALUES (?, ?, ?)",
+                (season, rows["title"], datetime.now().isoformat(timespec="seconds"))
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT INTO teams (season_id, manager, team, budget_left) VALUES (?, ?, ?, ?)",
+                [(season_id,) + row for row in rows["teams"]]
+            )
+            self.connection.executemany(
+                "INSERT INTO lots (season_id, player, category, base_price, team, manager, price) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(season_id,) + row for row in rows["lots"]]
+            )
+            self.connection.executemany(
+                "INSERT INTO bids (season_id, seq, player, manager, amount) VALUES (?, ?, ?, ?, ?)",
+                [(season_id, seq) + tuple(bid) for seq, bid in enumerate(rows["bids"])]
+            )
+        return season_id
+    
+    def _delete_season(self, season: str):
+        row = self.connection.execute("SELECT id FROM seasons WHERE season = ?", (season,)).fetchone()
+        if row is None:
+            return
+        for table in ("teams", "lots", "bids"):
+            self.connection.execute(f"DELETE FROM {table} WHERE season_id = ?", (row["id"],))
+        self.connection.execute("DELETE FROM seasons WHERE id = ?", (row["id"],))
+    
+    def seasons(self) -> List[str]:
+        """Season labels in the order they were recorded"""
+        return [row["season"] for row in self.connection.execute("SELECT season FROM seasons ORDER BY id")]
+    
+    def _recent_season_ids(self, last: Optional[int]) -> Optional[Tuple[int, ...]]:
+        if last is None:
+            return None
+        rows = self.connection.execute("SELECT id FROM seasons ORDER BY id DESC LIMIT ?", (last,))
+        return tuple(row["id"] for row in rows)
+    
+    def average_price(self, category: str, last: Optional[int] = None) -> Optional[float]:
+        """Average sale price of a category, over the last N seasons if given"""
+        query = "SELECT AVG(price) FROM lots WHERE category = ? AND price IS NOT NULL"
+        params: List[Any] = [category]
+        season_ids = self._recent_season_ids(last)
+        if season_ids is not None:
+            if not season_ids:
+                return None
+            query += f" AND season_id IN ({', '.join('?' * len(season_ids))})"
+            params.extend(season_ids)
+        return self.connection.execute(query, params).fetchone()[0]
+    
+    def category_prices_by_season(self, category: str) -> List[Dict[str, Any]]:
+        """Per season: players sold, average and top price for a category"""
+        rows = self.connection.execute(
+            "SELECT s.season, COUNT(l.price) AS sold, AVG(l.price) AS average, MAX(l.price) AS top "
+            "FROM lots l JOIN seasons s ON s.id = l.season_id "
+            "WHERE l.category = ? AND l.price IS NOT NULL GROUP BY s.id ORDER BY s.id",
+            (category,)
+        )
+        return [dict(row) for row in rows]
+    
+    def player_history(self, player: str) -> List[Dict[str, Any]]:
+        """Every season a player (case-insensitive) was auctioned, with buyer and price"""
+        rows = self.connection.execute(
+            "SELECT s.season, l.category, l.base_price, l.team, l.manager, l.price "
+            "FROM lots l JOIN seasons s ON s.id = l.season_id WHERE l.player = ? ORDER BY s.id",
+            (player,)
+        )
+        return [dict(row) for row in rows]
+    
+    def team_history(self, team: str) -> List[Dict[str, Any]]:
+        """Per season: players bought and money spent by a team"""
+        rows = self.connection.execute(
+            "SELECT s.season, COUNT(*) AS players, SUM(l.price) AS spent "
+            "FROM lots l JOIN seasons s ON s.id = l.season_id WHERE l.team = ? GROUP BY s.id ORDER BY s.id",
+            (team,)
+        )
+        return [dict(row) for row in rows]
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Synthetic League Generator
+Builds valid auction configs of arbitrary size for benchmarks and load tests
+"""
+
+import random
+from typing import Dict, Any, Optional
+
+CATEGORY_NAMES = ["Premium", "Standard", "Budget", "Special", "Reserve"]
+
+
+def make_league_config(num_players: int, num_teams: int, num_categories: int = 3,
+                       max_players: Optional[int] = None, seed: int = 0) -> Dict[str, Any]:
+    """Return a raw config dict (config-file layout) for a synthetic league"""
+    rng = random.Random(seed)
+    num_categories = max(1, min(num_categories, len(CATEGORY_NAMES)))
+    
+    if max_players is None:
+        max_players = max(1, min(25, num_players // max(1, num_teams)))
+    
+    categories = [
+        {"name": CATEGORY_NAMES[i], "max_per_team": max_players}
+        for i in range(num_categories)
+    ]
+    
+    players = []
+    for i in range(num_players):
+        category = CATEGORY_NAMES[i % num_categories]
+        players.append({
+            "name": f"Player {i + 1:06d}",
+            "category": category,
+            "price": 10 * rng.randint(1, 20)
+        })
+    
+    return {
+        "title": f"Synthetic League {num_players}x{num_teams}",
+        "total_budget": max_players * 400,
+        "bid_increment": 10,
+        "max_players": max_players,
+        "teams": [
+            {"team_name": f"Team {i + 1}", "manager_name": f"Manager {i + 1}"}
+            for i in range(num_teams)
+        ],
+        "categories": categories,
+        "players": players
+    }
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Price Valuation
+Learns expected sale prices from past seasons' CSV exports and server
+journals. Prices are modelled as a category level plus a per-player
+adjustment shrunk towards zero (ridge regression on one-hot category and
+player features), so a player seen once moves only part of the way from
+the category average. Players are nested in categories, so the fit is
+weighted category means followed by a ridge solve on the residuals whose
+normal equations are diagonal: a couple of passes over the sales, and
+lookups are dict reads.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Journal actions that carry completed sales: action -> how to list them
+_JOURNAL_SALES = {
+    'sell': lambda entry: [entry],
+    'settle_batch': lambda entry: entry.get('sold', []),
+    'fast_fill': lambda entry: entry.get('sold', []),
+}
+
+
+class Sale:
+    """One historical sale; weight falls off for older seasons"""
+    
+    def __init__(self, player: str, category: Optional[str], price: int, weight: float = 1.0):
+        self.player = player
+        self.category = category
+        self.price = price
+        self.weight = weight
+
+
+def _player_key(name: str) -> str:
+    return name.strip().casefold()
+
+
+def read_csv_export(path) -> List[Sale]:
+    """Sales from AuctionEngine.export_csv (teams without players are skipped)"""
+    sales = []
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            price = (row.get('Price') or '').strip()
+            if not price or not row.get('Category'):
+                continue
+            sales.append(Sale(row['Player'], row['Category'], int(price)))
+    return sales
+
+
+def read_journal(path) -> List[Sale]:
+    """Sales from an AuctionService journal (one JSON action per line)
+    
+    Older journals have no category on sale entries; it is taken from the
+    player's next_player entry when present and otherwise left for
+    fit_price_model() to fill in from other files.
+    """
+    sales = []
+    categories: Dict[str, str] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            action = entry.get('action')
+            if action == 'next_player' and entry.get('category'):
+                categories[_player_key(entry['player'])] = entry['category']
+            for sale in _JOURNAL_SALES.get(action, lambda entry: [])(entry):
+                category = sale.get('category') or categories.get(_player_key(sale['player']))
+                sales.append(Sale(sale['player'], category, int(sale['price'])))
+    return sales
+
+
+def read_history(path) -> List[Sale]:
+    """Sales from a CSV export or a .jsonl journal, chosen by extension"""
+    if Path(path).suffix.lower() in ('.jsonl', '.journal'):
+        return read_journal(path)
+    return read_csv_export(path)
+
+
+class PriceModel:
+    """Expected sale price per player, falling back to the category average"""
+    
+    def __init__(self, category_prices: Dict[str, float], player_prices: Dict[str, Tuple[str, float]],
+                 seasons: int = 0, sales: int = 0):
+        self.category_prices = category_prices
+        # Player key -> (category, expected price)
+        self.player_prices = player_prices
+        self.seasons = seasons
+        self.sales = sales
+    
+    def expected_price(self, player_name: str, category: str) -> Optional[int]:
+        """Expected sale price, or None when the category was never sold"""
+        known = self.player_prices.get(_player_key(player_name))
+        if known is not None and known[0] == category:
+            return round(known[1])
+        level = self.category_prices.get(category)
+        return round(level) if level is not None else None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'seasons': self.seasons,
+            'sales': self.sales,
+            'categories': self.category_prices,
+            'players': {key: {'category': category, 'expected': price}
+                        for key, (category, price) in self.player_prices.items()},
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PriceModel":
+        try:
+            players = {key: (entry['category'], float(entry['expected']))
+                       for key, entry in data.get('players', {}).items()}
+            categories = {name: float(price) for name, price in data['categories'].items()}
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ValueError(f"Invalid price model: {e}") from e
+        return cls(categories, players, int(data.get('seasons', 0)), int(data.get('sales', 0)))
+    
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+    
+    @classmethod
+    def load(cls, path) -> "PriceModel":
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def fit_price_model(seasons: Iterable[List[Sale]], shrinkage: float = 1.0, decay: float = 0.7) -> PriceModel:
+    """Fit a PriceModel to sales grouped by season, oldest season first
+    
+    shrinkage is the ridge penalty on player adjustments, in units of
+    sale weight: a player with that much history lands halfway between
+    the category average and their own average. Each season back
+    multiplies sale weights by decay.
+    """
+    seasons = [list(season) for season in seasons]
+    sales = []
+    for index, season in enumerate(seasons):
+        for sale in season:
+            sale.weight = decay ** (len(seasons) - 1 - index)
+            sales.append(sale)
+    
+    # Sales without a category borrow it from another sale of the same player
+    known = {_player_key(sale.player): sale.category for sale in sales if sale.category}
+    for sale in sales:
+        sale.category = sale.category or known.get(_player_key(sale.player))
+    sales = [sale for sale in sales if sale.category]
+    
+    # Category levels: weighted means
+    totals: Dict[str, List[float]] = {}
+    for sale in sales:
+        total = totals.setdefault(sale.category, [0.0, 0.0])
+        total[0] += sale.weight * sale.price
+        total[1] += sale.weight
+    category_prices = {category: amount / weight for category, (amount, weight) in totals.items()}
+    
+    # Player adjustments: ridge solution of the diagonal normal equations
+    residuals: Dict[Tuple[str, str], List[float]] = {}
+    for sale in sales:
+        total = residuals.setdefault((_player_key(sale.player), sale.category), [0.0, 0.0])
+        total[0] += sale.weight * (sale.price - category_prices[sale.category])
+        total[1] += sale.weight
+    
+    # A player who changed category keeps their most recent one
+    latest = {_player_key(sale.player): sale.category for sale in sales}
+    player_prices = {
+        key: (category, category_prices[category] + residual / (weight + shrinkage))
+        for (key, category), (residual, weight) in residuals.items()
+        if latest[key] == category
+    }
+    
+    return PriceModel(category_prices, player_prices, len(seasons), len(sales))
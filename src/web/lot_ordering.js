@@ -0,0 +1,99 @@
+/*
+ * Lot Ordering
+ * Strategies for the order in which players come up for auction, mirroring
+ * src/python/lot_ordering.py. Sort keys are computed once per player (the
+ * category rank comes from a Map, never a findIndex inside the comparator).
+ */
+(function (global) {
+    'use strict';
+
+    function byName(a, b) {
+        return a.player.name.localeCompare(b.player.name);
+    }
+
+    // Decorate-sort-undecorate: keyOf runs once per player, not once per comparison
+    function sortByKey(players, keyOf, compareKeys) {
+        return players
+            .map(player => ({ player, key: keyOf(player) }))
+            .sort((a, b) => compareKeys(a.key, b.key) || byName(a, b))
+            .map(entry => entry.player);
+    }
+
+    function compareNumbers(a, b) {
+        return a - b;
+    }
+
+    function shuffled(players, categoryRank, random) {
+        // Fisher-Yates
+        const result = [...players];
+        for (let i = result.length - 1; i > 0; i--) {
+            const j = Math.floor(random() * (i + 1));
+            [result[i], result[j]] = [result[j], result[i]];
+        }
+        return result;
+    }
+
+    function byCategory(players, categoryRank) {
+        // Categories in configured order; unknown categories last
+        const unknown = categoryRank.size;
+        return sortByKey(players, p => categoryRank.has(p.category) ? categoryRank.get(p.category) : unknown, compareNumbers);
+    }
+
+    function byCategoryName(players) {
+        return sortByKey(players, p => p.category, (a, b) => a.localeCompare(b));
+    }
+
+    function byPriceAscending(players) {
+        return sortByKey(players, p => p.price, compareNumbers);
+    }
+
+    function byPriceDescending(players) {
+        return sortByKey(players, p => -p.price, compareNumbers);
+    }
+
+    function stratified(players, categoryRank, random) {
+        // Shuffle within each category, then place the i-th of n players in
+        // the i-th 1/n of the auction so every stretch mixes all categories
+        const groups = new Map();
+        players.forEach(player => {
+            if (!groups.has(player.category)) groups.set(player.category, []);
+            groups.get(player.category).push(player);
+        });
+
+        const keyed = [];
+        groups.forEach(group => {
+            shuffled(group, categoryRank, random).forEach((player, i, all) => {
+                keyed.push({ player, key: (i + random()) / all.length });
+            });
+        });
+        return keyed.sort((a, b) => a.key - b.key).map(entry => entry.player);
+    }
+
+    // Strategy name -> function; add entries here to offer new orders
+    const ORDER_STRATEGIES = {
+        'random': shuffled,
+        'category': byCategory,
+        'category-asc': byCategoryName,
+        'price-asc': byPriceAscending,
+        'price-desc': byPriceDescending,
+        'stratified': stratified
+    };
+
+    // Orders whose next lot is drawn at random rather than taken in sequence
+    const RANDOM_DRAW_ORDERS = ['random'];
+
+    function orderPlayers(players, order, categories, random) {
+        const strategy = ORDER_STRATEGIES[order];
+        if (!strategy) return [...players];
+        const categoryRank = new Map((categories || []).map((category, rank) => [category.name, rank]));
+        return strategy([...players], categoryRank, random || Math.random);
+    }
+
+    const LotOrdering = { ORDER_STRATEGIES, RANDOM_DRAW_ORDERS, orderPlayers };
+
+    if (typeof module !== 'undefined' && module.exports) {
+        module.exports = LotOrdering;
+    } else {
+        global.LotOrdering = LotOrdering;
+    }
+})(typeof window !== 'undefined' ? window : this);
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Tests for the GUI-free auction engine
+"""
+
+import sys
+import json
+import random
+import subprocess
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine, AuctionError, BidError
+
+# Headless import of the desktop module must stay well under this (seconds)
+IMPORT_TIME_BUDGET = 0.5
+
+
+class TestAuctionEngine(unittest.TestCase):
+    """Test lot flow through the engine without tkinter"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config = validate_config(json.load(f))
+        self.engine = AuctionEngine(self.config, rng=random.Random(42))
+    
+    def test_initialize_builds_managers_and_pool(self):
+        self.assertEqual(len(self.engine.managers), 3)
+        self.assertEqual(len(self.engine.player_pool), 5)
+        self.assertEqual(self.engine.total_budget_left(), 3 * 1500)
+    
+    def test_bid_and_sell(self):
+        player = self.engine.next_player()
+        self.assertEqual(self.engine.current_bid, player.base_price)
+        
+        self.engine.place_bid("John Doe")
+        new_bid = self.engine.place_bid("Jane Smith")
+        self.assertEqual(new_bid, player.base_price + 2 * self.config.bid_increment)
+        
+        sold = self.engine.sell_player()
+        self.assertIs(sold, player)
+        self.assertEqual(sold.sold_to, "Jane Smith")
+        self.assertEqual(self.engine.managers["Jane Smith"].budget, 1500 - new_bid)
+        self.assertIsNone(self.engine.current_player)
+        self.assertFalse(self.engine.bidding_active)
+    
+    def test_bid_rejected_when_over_budget(self):
+        self.engine.next_player()
+        self.engine.managers["John Doe"].budget = 0
+        
+        with self.assertRaises(BidError) as ctx:
+            self.engine.place_bid("John Doe")
+        self.assertIn("budget", str(ctx.exception))
+    
+    def test_unsold_players_are_reauctioned_last(self):
+        first = self.engine.next_player()
+        self.engine.mark_unsold()
+        
+        drawn = [self.engine.next_player() for _ in range(5)]
+        self.assertNotIn(first, drawn[:-1])
+        self.assertIs(drawn[-1], first)
+        self.assertIsNone(self.engine.next_player())
+    
+    def test_players_left_tracks_pool_and_unsold(self):
+        def left():
+            return sum(self.engine.players_left(cat['name']) for cat in self.config.categories)
+        
+        self.assertEqual(left(), 5)
+        player = self.engine.next_player()
+        self.assertEqual(left(), 4)
+        self.engine.mark_unsold()
+        self.assertEqual(self.engine.players_left(player.category),
+                         sum(1 for p in self.engine.player_pool + list(self.engine.unsold_players) if p.category == player.category))
+        self.assertEqual(left(), 5)
+        
+        self.engine.next_player()
+        self.engine.place_bid("John Doe")
+        self.engine.sell_player()
+        self.assertEqual(left(), 4)
+    
+    def test_can_pass_needs_enough_players_left_for_minimum(self):
+        player = self.engine.next_player()
+        self.assertTrue(self.engine.can_pass("John Doe"))
+        
+        left = self.engine.players_left(player.category)
+        self.engine.rules.min_per_team[player.category] = left
+        self.assertTrue(self.engine.can_pass("John Doe"))
+        self.engine.rules.min_per_team[player.category] = left + 1
+        self.assertFalse(self.engine.can_pass("John Doe"))
+    
+    def test_bid_rejected_when_it_breaks_category_reserve(self):
+        data = json.loads((project_root / "test_data" / "sample_config.json").read_text(encoding='utf-8'))
+        for cat in data['categories']:
+            cat.update(min_per_team=1, base_price=400)
+        engine = AuctionEngine(validate_config(data), rng=random.Random(42))
+        
+        player = engine.next_player()
+        manager = engine.managers["John Doe"]
+        # Three required categories at 400, this lot covers one; three open slots at 400
+        self.assertEqual(engine.rules.max_bid(manager, player.category), 1500 - 2 * 400 - 3 * 400)
+        manager.budget = 2 * 400 + 3 * 400 + player.base_price + engine.config.bid_increment
+        engine.place_bid("John Doe")
+        with self.assertRaises(BidError) as ctx:
+            engine.place_bid("John Doe")
+        self.assertIn("must keep", str(ctx.exception))
+    
+    def test_actions_without_lot_raise(self):
+        with self.assertRaises(AuctionError):
+            self.engine.place_bid("John Doe")
+        with self.assertRaises(AuctionError):
+            self.engine.sell_player()
+        with self.assertRaises(AuctionError):
+            self.engine.mark_unsold()
+    
+    def test_headless_import_budget(self):
+        """Importing the desktop module must not load tkinter or pygame"""
+        code = (
+            "import sys, time\n"
+            f"sys.path.insert(0, {str(project_root / 'src' / 'python')!r})\n"
+            "start = time.perf_counter()\n"
+            "import cricket_auction\n"
+            "elapsed = time.perf_counter() - start\n"
+            "print(elapsed, 'tkinter' in sys.modules, 'pygame' in sys.modules)\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        elapsed, tk_loaded, pygame_loaded = output.split()
+        
+        self.assertEqual(tk_loaded, "False")
+        self.assertEqual(pygame_loaded, "False")
+        self.assertLess(float(elapsed), IMPORT_TIME_BUDGET)
+
+
+
+class TestProxyBids(unittest.TestCase):
+    """Proxy bids settle in one step at the runner-up's maximum plus one increment"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config = validate_config(json.load(f))
+        self.engine = AuctionEngine(self.config, rng=random.Random(42))
+        self.player = self.engine.next_player()
+        self.start = self.player.base_price
+        self.inc = self.config.bid_increment
+    
+    def test_single_proxy_bids_once(self):
+        self.engine.set_proxy_bid("John Doe", self.start + 10 * self.inc)
+        self.assertEqual(self.engine.highest_bidder, "John Doe")
+        self.assertEqual(self.engine.current_bid, self.start + self.inc)
+    
+    def test_competing_proxies_resolve_to_second_price(self):
+        self.engine.set_proxy_bid("Bob Wilson", self.start + 2 * self.inc)
+        self.engine.set_proxy_bid("John Doe", self.start + 4 * self.inc)
+        self.engine.set_proxy_bid("Jane Smith", self.start + 7 * self.inc)
+        
+        self.assertEqual(self.engine.highest_bidder, "Jane Smith")
+        self.assertEqual(self.engine.current_bid, self.start + 5 * self.inc)
+    
+    def test_tie_goes_to_standing_leader(self):
+        self.engine.set_proxy_bid("John Doe", self.start + 3 * self.inc)
+        self.engine.set_proxy_bid("Jane Smith", self.start + 3 * self.inc)
+        
+        self.assertEqual(self.engine.highest_bidder, "John Doe")
+        self.assertEqual(self.engine.current_bid, self.start + 3 * self.inc)
+    
+    def test_manual_bid_triggers_proxy_response(self):
+        self.engine.set_proxy_bid("John Doe", self.start + 5 * self.inc)
+        self.engine.place_bid("Jane Smith")
+        
+        self.assertEqual(self.engine.highest_bidder, "John Doe")
+        self.assertEqual(self.engine.current_bid, self.start + 3 * self.inc)
+    
+    def test_proxy_capped_by_budget(self):
+        self.engine.managers["John Doe"].budget = self.start + 2 * self.inc
+        self.engine.set_proxy_bid("John Doe", self.start + 10 * self.inc)
+        self.engine.set_proxy_bid("Jane Smith", self.start + 6 * self.inc)
+        
+        self.assertEqual(self.engine.highest_bidder, "Jane Smith")
+        self.assertEqual(self.engine.current_bid, self.start + 3 * self.inc)
+    
+    def test_matches_sequential_reference(self):
+        """Closed form agrees with classic proxy bidding applied one registration at a time"""
+        rng = random.Random(5)
+        names = list(self.engine.managers)
+        for _ in range(200):
+            engine = AuctionEngine(self.config, rng=random.Random(42))
+            engine.next_player()
+            price, leader, leader_max = engine.current_bid, None, None
+            
+            for name in rng.sample(names, len(names)):
+                max_amount = self.start + rng.randint(0, 12) * self.inc
+                if max_amount < engine.current_bid + self.inc:
+                    continue
+                engine.set_proxy_bid(name, max_amount)
+                
+                # Reference: the higher maximum leads at one increment over the lower one
+                if leader is None:
+                    price, leader, leader_max = price + self.inc, name, max_amount
+                elif max_amount > leader_max:
+                    price, leader, leader_max = min(max_amount, leader_max + self.inc), name, max_amount
+                else:
+                    price = min(leader_max, max_amount + self.inc)
+                
+                self.assertEqual((engine.current_bid, engine.highest_bidder), (price, leader))
+    
+    def test_proxy_below_next_bid_rejected(self):
+        with self.assertRaises(BidError):
+            self.engine.set_proxy_bid("John Doe", self.start)
+
+
+
+class TestSealedLots(unittest.TestCase):
+    """Sealed first-price and Vickrey lots settle in one pass"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config_data = json.load(f)
+    
+    def make_engine(self, mode):
+        self.config_data["lot_mode"] = mode
+        engine = AuctionEngine(validate_config(self.config_data), rng=random.Random(42))
+        return engine, engine.next_player()
+    
+    def test_sealed_first_price(self):
+        engine, player = self.make_engine("sealed")
+        engine.submit_sealed_bid("John Doe", player.base_price + 100)
+        engine.submit_sealed_bid("Jane Smith", player.base_price + 300)
+        engine.submit_sealed_bid("Bob Wilson", player.base_price + 50)
+        
+        sold = engine.resolve_sealed_lot()
+        self.assertEqual((sold.sold_to, sold.sold_price), ("Jane Smith", player.base_price + 300))
+        self.assertFalse(engine.bidding_active)
+    
+    def test_vickrey_charges_second_price(self):
+        engine, player = self.make_engine("vickrey")
+        engine.submit_sealed_bid("John Doe", player.base_price + 100)
+        engine.submit_sealed_bid("Jane Smith", player.base_price + 300)
+        
+        sold = engine.resolve_sealed_lot()
+        self.assertEqual((sold.sold_to, sold.sold_price), ("Jane Smith", player.base_price + 100))
+    
+    def test_vickrey_single_bidder_pays_base(self):
+        engine, player = self.make_engine("vickrey")
+        engine.submit_sealed_bid("Bob Wilson", player.base_price + 200)
+        self.assertEqual(engine.resolve_sealed_lot().sold_price, player.base_price)
+    
+    def test_ineligible_bid_skipped_at_resolution(self):
+        engine, player = self.make_engine("sealed")
+        engine.submit_sealed_bid("John Doe", player.base_price + 400)
+        engine.submit_sealed_bid("Jane Smith", player.base_price + 10)
+        engine.managers["John Doe"].budget = 0
+        
+        self.assertEqual(engine.resolve_sealed_lot().sold_to, "Jane Smith")
+    
+    def test_no_bids_marks_unsold(self):
+        engine, player = self.make_engine("sealed")
+        engine.resolve_sealed_lot()
+        self.assertIn(player, engine.unsold_players)
+    
+    def test_one_bid_per_manager_and_no_open_bidding(self):
+        engine, player = self.make_engine("sealed")
+        engine.submit_sealed_bid("John Doe", player.base_price)
+        with self.assertRaises(BidError):
+            engine.submit_sealed_bid("John Doe", player.base_price + 50)
+        with self.assertRaises(AuctionError):
+            engine.place_bid("Jane Smith")
+    
+    def test_mode_override_per_lot(self):
+        engine = AuctionEngine(validate_config(self.config_data), rng=random.Random(42))
+        engine.next_player(mode="vickrey")
+        self.assertEqual(engine.lot_mode, "vickrey")
+        engine.mark_unsold()
+        engine.next_player()
+        self.assertEqual(engine.lot_mode, "open")
+
+
+class TestBatchLots(unittest.TestCase):
+    """Concurrent batch lots hold each leader's budget and slots until settle_batch()"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config = validate_config(json.load(f))
+        self.engine = AuctionEngine(self.config, rng=random.Random(42))
+        self.inc = self.config.bid_increment
+        self.first, self.second, self.third = self.engine.open_batch(3)
+    
+    def test_open_batch_draws_lots_and_blocks_single_lots(self):
+        self.assertEqual(len(self.engine.batch_lots), 3)
+        self.assertEqual(len(self.engine.player_pool), 2)
+        with self.assertRaises(AuctionError):
+            self.engine.next_player()
+        with self.assertRaises(AuctionError):
+            self.engine.open_batch(2)
+    
+    def test_budget_committed_across_lots(self):
+        john = self.engine.managers["John Doe"]
+        john.budget = self.first.base_price + self.inc + self.second.base_price
+        self.engine.batch_bid(self.first.name, "John Doe")
+        
+        with self.assertRaises(BidError) as ctx:
+            self.engine.batch_bid(self.second.name, "John Doe")
+        self.assertIn("committed", str(ctx.exception))
+        
+        # Being outbid releases the commitment
+        self.engine.batch_bid(self.first.name, "Jane Smith")
+        self.assertEqual(self.engine.batch_bid(self.second.name, "John Doe"), self.second.base_price + self.inc)
+    
+    def test_roster_slots_committed_across_lots(self):
+        self.engine.managers["Bob Wilson"].max_players = 1
+        self.engine.batch_bid(self.first.name, "Bob Wilson")
+        with self.assertRaises(BidError):
+            self.engine.batch_bid(self.second.name, "Bob Wilson")
+        with self.assertRaises(BidError):
+            self.engine.batch_bid(self.first.name, "Bob Wilson")
+    
+    def test_reserve_counts_lots_already_led(self):
+        data = json.loads((project_root / "test_data" / "sample_config.json").read_text(encoding='utf-8'))
+        for cat in data['categories']:
+            cat.update(min_per_team=1, base_price=400)
+        for player in data['players']:
+            player['price'] = 400
+        engine = AuctionEngine(validate_config(data), rng=random.Random(42))
+        first, second, _ = engine.open_batch(3)
+        john = engine.managers["John Doe"]
+        bid = 400 + engine.config.bid_increment
+        # Five players still to buy at 400 after this lot
+        john.budget = 5 * 400 + bid
+        self.assertIsNone(engine.rules.bid_rejection_reason(john, bid, second.category))
+        
+        engine.batch_bid(first.name, "John Doe")
+        with self.assertRaises(BidError) as ctx:
+            engine.batch_bid(second.name, "John Doe")
+        self.assertIn("must keep", str(ctx.exception))
+    
+    def test_settle_sells_led_lots_together(self):
+        self.engine.batch_bid(self.first.name, "John Doe")
+        self.engine.batch_bid(self.first.name, "Jane Smith")
+        self.engine.batch_bid(self.second.name, "John Doe")
+        
+        sold, unsold = self.engine.settle_batch()
+        self.assertEqual([(p.name, p.sold_to) for p in sold],
+                         [(self.first.name, "Jane Smith"), (self.second.name, "John Doe")])
+        self.assertEqual(unsold, [self.third])
+        self.assertIn(self.third, self.engine.unsold_players)
+        self.assertEqual(self.engine.managers["Jane Smith"].budget, 1500 - (self.first.base_price + 2 * self.inc))
+        self.assertEqual(self.engine.batch_lots, {})
+        self.assertIsNotNone(self.engine.next_player())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the startup benchmark harness
+"""
+
+import sys
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src and scripts directories to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+import benchmark_startup
+from config_loader import validate_config
+from synthetic_league import make_league_config
+
+
+class TestStartupBenchmark(unittest.TestCase):
+    """Run the harness on tiny leagues and check the JSON report"""
+    
+    def test_synthetic_league_is_valid(self):
+        config = validate_config(make_league_config(500, 64))
+        self.assertEqual(len(config.players), 500)
+        self.assertEqual(len(config.teams), 64)
+    
+    def test_report_written(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = str(Path(tmp_dir) / "startup.json")
+            benchmark_startup.main(["--players", "100", "--teams", "2", "4",
+                                    "--repeat", "1", "--no-gui", "--output", output])
+            
+            with open(output, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+        
+        self.assertGreater(report["import_s"], 0)
+        self.assertEqual([(r["players"], r["teams"]) for r in report["results"]], [(100, 2), (100, 4)])
+        for result in report["results"]:
+            self.assertGreater(result["config_parse_s"], 0)
+            self.assertGreater(result["initialize_auction_s"], 0)
+            self.assertIsNone(result["setup_gui_s"])
+
+
+if __name__ == "__main__":
+    unittest.main()
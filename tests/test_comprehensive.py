@@ -155,6 +155,21 @@ class TestAuctionPlatform(unittest.TestCase):
         except ImportError as e:
             self.fail(f"Failed to import Manager class: {e}")
     
+    def test_virtual_list_window(self):
+        """Test that virtualized lists only materialize visible rows"""
+        from cricket_auction import visible_row_range
+
+        # Top of a large list: viewport rows plus overscan only
+        self.assertEqual(visible_row_range(0, 180, 18, 50000), (0, 12))
+
+        # Scrolled into the middle: window moves, size stays constant
+        start, end = visible_row_range(18 * 1000, 180, 18, 50000)
+        self.assertEqual((start, end), (998, 1012))
+
+        # Clamped at the end and for empty lists
+        self.assertEqual(visible_row_range(18 * 49995, 180, 18, 50000)[1], 50000)
+        self.assertEqual(visible_row_range(0, 180, 18, 0), (0, 0))
+
     def test_web_application_files(self):
         """Test web application file existence and structure"""
         web_dir = project_root / "src" / "web"
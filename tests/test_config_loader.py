@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the schema-validated, cached configuration loader
+"""
+
+import os
+import sys
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import ConfigError, validate_config, load_config_file, clear_config_cache
+
+
+class TestConfigLoader(unittest.TestCase):
+    """Test config validation and caching"""
+    
+    def setUp(self):
+        clear_config_cache()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp_dir.name, "config.json")
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config_data = json.load(f)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def write_config(self, data):
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    
+    def test_validate_builds_typed_config(self):
+        """Numeric strings are coerced and defaults are filled in"""
+        self.config_data["total_budget"] = "1500"
+        del self.config_data["bid_increment"]
+        
+        config = validate_config(self.config_data)
+        
+        self.assertEqual(config.total_budget, 1500)
+        self.assertEqual(config.bid_increment, 10)
+        self.assertEqual(len(config.players), 5)
+        self.assertTrue(config.is_configured)
+    
+    def test_validate_rejects_bad_configs(self):
+        """Schema and cross-field errors raise ConfigError"""
+        bad_configs = [
+            dict(self.config_data, teams=[]),
+            dict(self.config_data, title="  "),
+            dict(self.config_data, max_players="lots"),
+            dict(self.config_data, lot_mode="dutch"),
+            dict(self.config_data, lot_seconds=-5),
+            dict(self.config_data, players=[{"name": "X", "category": "Unknown", "price": 50}]),
+            dict(self.config_data, teams=[{"team_name": "A", "manager_name": "Same"},
+                                          {"team_name": "B", "manager_name": "Same"}]),
+            dict(self.config_data, categories=[dict(cat, min_per_team=cat['max_per_team'] + 1)
+                                               for cat in self.config_data['categories']]),
+            dict(self.config_data, categories=[dict(cat, min_per_team=cat['max_per_team'], base_price=10000)
+                                               for cat in self.config_data['categories']]),
+        ]
+        
+        for data in bad_configs:
+            with self.assertRaises(ConfigError):
+                validate_config(data)
+    
+    def test_load_uses_cache_until_file_changes(self):
+        """Unchanged files return the cached parse; edits are picked up"""
+        self.write_config(self.config_data)
+        
+        first = load_config_file(self.config_path)
+        self.assertIs(load_config_file(self.config_path), first)
+        
+        # Touching the file without changing content keeps the cached parse
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIs(load_config_file(self.config_path), first)
+        
+        self.config_data["title"] = "Changed Title"
+        self.write_config(self.config_data)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        
+        reloaded = load_config_file(self.config_path)
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded.title, "Changed Title")
+    
+    def test_invalid_json_raises_config_error(self):
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write("{not json")
+        
+        with self.assertRaises(ConfigError):
+            load_config_file(self.config_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the binary config snapshots
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from config_loader import ConfigError, clear_config_cache, load_config_file, validate_config
+from config_snapshot import SnapshotPlayers, load_snapshot, snapshot_to_dict, write_snapshot
+from auction_engine import AuctionEngine
+from synthetic_league import make_league_config
+import convert_snapshot
+
+
+class TestConfigSnapshot(unittest.TestCase):
+    """Snapshots hold the same config as the JSON they came from"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.data = json.load(f)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = str(Path(self.tmp.name) / "league.aucsnap")
+        self.addCleanup(clear_config_cache)
+    
+    def test_round_trip(self):
+        self.data['players'][0]['name'] = "Zoë Ångström"
+        config = write_snapshot(self.data, self.path)
+        self.assertEqual(snapshot_to_dict(self.path), config.to_dict())
+    
+    def test_players_decoded_on_access(self):
+        config = validate_config(make_league_config(500, 4, seed=1))
+        write_snapshot(config.to_dict(), self.path)
+        
+        snapshot = load_snapshot(self.path)
+        self.assertIsInstance(snapshot.players, SnapshotPlayers)
+        self.assertEqual(len(snapshot.players), 500)
+        self.assertEqual(snapshot.players[-1], config.players[-1])
+        self.assertEqual(snapshot.players[10:13], config.players[10:13])
+        with self.assertRaises(IndexError):
+            snapshot.players[500]
+    
+    def test_engine_from_snapshot_matches_json(self):
+        write_snapshot(self.data, self.path)
+        from_json = AuctionEngine(validate_config(self.data), rng=random.Random(4))
+        from_snapshot = AuctionEngine(load_config_file(self.path), rng=random.Random(4))
+        
+        self.assertEqual([(p.name, p.base_price, p.category) for p in from_snapshot.player_pool],
+                         [(p.name, p.base_price, p.category) for p in from_json.player_pool])
+        self.assertEqual(sorted(from_snapshot.managers), sorted(from_json.managers))
+    
+    def test_file_not_held_open_after_load(self):
+        write_snapshot(self.data, self.path)
+        config = load_config_file(self.path)
+        maps = Path("/proc/self/maps")
+        if maps.exists():
+            self.assertNotIn(self.path, maps.read_text())
+        
+        # The cached config outlives the file, and a rewrite is picked up
+        os.remove(self.path)
+        self.assertEqual(config.players[0]['name'], self.data['players'][0]['name'])
+        self.data['players'][0]['name'] = "Renamed"
+        write_snapshot(self.data, self.path)
+        self.assertEqual(load_config_file(self.path).players[0]['name'], "Renamed")
+    
+    def test_invalid_files_rejected(self):
+        Path(self.path).write_bytes(b'{"title": "not a snapshot"}' + b' ' * 80)
+        with self.assertRaises(ConfigError):
+            load_snapshot(self.path)
+        
+        Path(self.path).write_bytes(b'')
+        with self.assertRaises(ConfigError):
+            load_snapshot(self.path)
+        
+        with self.assertRaises(ConfigError):
+            write_snapshot(dict(self.data, players=[]), self.path)
+    
+    def test_converter_script(self):
+        source = Path(self.tmp.name) / "league.json"
+        source.write_text(json.dumps(self.data), encoding='utf-8')
+        self.assertEqual(convert_snapshot.main([str(source)]), 0)
+        self.assertEqual(convert_snapshot.main(["--to-json", self.path, str(Path(self.tmp.name) / "back.json")]), 0)
+        
+        back = json.loads((Path(self.tmp.name) / "back.json").read_text(encoding='utf-8'))
+        self.assertEqual(back, validate_config(self.data).to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the deadline scheduler and timed lots
+"""
+
+import sys
+import json
+import time
+import random
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine
+from auction_service import AuctionService
+from deadline_scheduler import DeadlineScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+    """Test heap ordering, cancellation and compaction"""
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = DeadlineScheduler(self.clock)
+        self.fired = []
+    
+    def test_fires_in_deadline_order(self):
+        self.scheduler.schedule(3, self.fired.append, "c")
+        self.scheduler.schedule(1, self.fired.append, "a")
+        self.scheduler.schedule(2, self.fired.append, "b")
+        
+        self.clock.now += 2
+        self.assertEqual(self.scheduler.run_due(), 2)
+        self.assertEqual(self.fired, ["a", "b"])
+        self.assertAlmostEqual(self.scheduler.time_until_next(), 1)
+    
+    def test_cancel(self):
+        timer = self.scheduler.schedule(1, self.fired.append, "x")
+        self.scheduler.cancel(timer)
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertIsNone(self.scheduler.next_deadline())
+        
+        self.clock.now += 5
+        self.assertEqual(self.scheduler.run_due(), 0)
+        self.assertEqual(self.fired, [])
+    
+    def test_rearming_does_not_grow_heap(self):
+        timer = None
+        for i in range(1000):
+            self.scheduler.cancel(timer)
+            timer = self.scheduler.schedule(10 + i, self.fired.append, i)
+        
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertLess(len(self.scheduler._heap), 200)
+
+
+class TestTimedLots(unittest.TestCase):
+    """Lots close through sell_player/mark_unsold when the clock runs out"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config_data = json.load(f)
+        self.config_data.update(lot_seconds=30, bid_extension_seconds=10)
+        self.clock = FakeClock()
+        self.engine = AuctionEngine(validate_config(self.config_data), rng=random.Random(1), clock=self.clock)
+        self.closed = []
+        self.engine.on_lot_expired = self.closed.append
+    
+    def test_expiry_sells_to_highest_bidder(self):
+        player = self.engine.next_player()
+        self.engine.place_bid("John Doe")
+        
+        self.clock.now += 29
+        self.assertEqual(self.engine.tick(), 0)
+        self.assertEqual(self.engine.countdown_call(), "Going twice...")
+        
+        self.clock.now += 1
+        self.assertEqual(self.engine.tick(), 1)
+        self.assertEqual(self.closed, [player])
+        self.assertEqual(player.sold_to, "John Doe")
+        self.assertIsNone(self.engine.time_remaining())
+    
+    def test_expiry_without_bids_marks_unsold(self):
+        player = self.engine.next_player()
+        self.clock.now += 30
+        self.engine.tick()
+        self.assertIn(player, self.engine.unsold_players)
+        self.assertFalse(player.is_sold)
+    
+    def test_late_bid_extends_deadline(self):
+        self.engine.next_player()
+        self.clock.now += 25
+        self.engine.place_bid("Jane Smith")
+        self.assertAlmostEqual(self.engine.time_remaining(), 10)
+        
+        self.clock.now += 5
+        self.assertEqual(self.engine.tick(), 0)
+        self.clock.now += 5
+        self.assertEqual(self.engine.tick(), 1)
+    
+    def test_manual_sale_cancels_timer(self):
+        self.engine.next_player()
+        self.engine.place_bid("John Doe")
+        self.engine.sell_player()
+        self.assertIsNone(self.engine.scheduler.next_deadline())
+    
+    def test_service_closes_lot_in_background(self):
+        self.config_data.update(lot_seconds=1, bid_extension_seconds=0)
+        service = AuctionService(validate_config(self.config_data))
+        try:
+            service.next_player()
+            service.place_bid("John Doe")
+            state = service.wait_for_change(service.version, timeout=5)
+            self.assertFalse(state["bidding_active"])
+            self.assertEqual(sum(m["players"] for m in state["managers"]), 1)
+        finally:
+            service.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
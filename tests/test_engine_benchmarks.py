@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Engine Micro-Benchmarks
+timeit-style throughput checks for the bid, sell, next-player and export
+hot paths on synthetic leagues of increasing size. Per-operation cost
+must stay flat as the pool grows, which catches accidental O(n^2) paths
+(list pops, full rescans) that correctness tests do not notice.
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine
+from synthetic_league import make_league_config
+
+SMALL_POOL = 5000
+LARGE_POOL = 50000
+
+# Per-op time on the large pool may be at most this many times the small-pool time.
+# O(1) paths stay near 1x; an O(n) step per op shows up as ~10x.
+MAX_SCALING_RATIO = 3.0
+
+# Conservative floors (operations per second) so slow CI machines still pass
+MIN_OPS_PER_SECOND = {
+    'can_bid': 200000,
+    'place_bid': 50000,
+    'next_player': 20000,
+    'sell_player': 20000,
+    'export': 20000,
+}
+
+
+def make_engine(num_players, num_teams=64):
+    config = validate_config(make_league_config(num_players, num_teams))
+    return AuctionEngine(config, rng=random.Random(7))
+
+
+def best_seconds_per_op(setup, run, ops, repeat=5):
+    """Best-of-N seconds per operation; setup() builds fresh state outside the timer"""
+    best = float('inf')
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        best = min(best, (time.perf_counter() - start) / ops)
+    return best
+
+
+class TestEngineBenchmarks(unittest.TestCase):
+    """Throughput and scaling assertions for engine hot paths"""
+    
+    def assert_throughput(self, name, small_per_op, large_per_op):
+        ops_per_second = 1.0 / large_per_op
+        print(f"\n  {name}: {ops_per_second:,.0f} ops/s on {LARGE_POOL} players "
+              f"(scaling x{large_per_op / small_per_op:.2f})")
+        self.assertGreater(ops_per_second, MIN_OPS_PER_SECOND[name])
+        self.assertLess(large_per_op / small_per_op, MAX_SCALING_RATIO)
+    
+    def measure_both(self, setup_for, run, ops):
+        small = best_seconds_per_op(lambda: setup_for(SMALL_POOL), run, ops)
+        large = best_seconds_per_op(lambda: setup_for(LARGE_POOL), run, ops)
+        return small, large
+    
+    def test_can_bid(self):
+        ops = 100000
+        
+        def setup(size):
+            engine = make_engine(size)
+            return list(engine.managers.values())
+        
+        def run(managers):
+            count = len(managers)
+            for i in range(ops):
+                managers[i % count].can_bid(100, "Premium")
+        
+        self.assert_throughput('can_bid', *self.measure_both(setup, run, ops))
+    
+    def test_place_bid(self):
+        ops = 400
+        
+        def setup(size):
+            engine = make_engine(size)
+            engine.next_player()
+            return engine
+        
+        def run(engine):
+            bidders = ["Manager 1", "Manager 2"]
+            for i in range(ops):
+                engine.place_bid(bidders[i % 2])
+        
+        self.assert_throughput('place_bid', *self.measure_both(setup, run, ops))
+    
+    def test_next_player(self):
+        ops = 4000
+        
+        def run(engine):
+            for _ in range(ops):
+                engine.next_player()
+                engine.mark_unsold()
+        
+        self.assert_throughput('next_player', *self.measure_both(make_engine, run, ops))
+    
+    def test_sell_player(self):
+        ops = 1500  # 64 teams x 25 roster spots = 1600 available
+        
+        def run(engine):
+            names = list(engine.managers)
+            for i in range(ops):
+                player = engine.next_player()
+                engine.sell_player(names[i % len(names)], player.base_price)
+        
+        self.assert_throughput('sell_player', *self.measure_both(make_engine, run, ops))
+    
+    def test_export(self):
+        sold = 1500
+        
+        def setup(size):
+            engine = make_engine(size)
+            names = list(engine.managers)
+            for i in range(sold):
+                player = engine.next_player()
+                engine.sell_player(names[i % len(names)], player.base_price)
+            return engine
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            def run(engine):
+                engine.export_text(os.path.join(tmp_dir, "results.txt"))
+                engine.export_csv(os.path.join(tmp_dir, "results.csv"))
+            
+            # One op = one sold player written in both formats
+            self.assert_throughput('export', *self.measure_both(setup, run, sold))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for fast-fill matching of leftover players to incomplete rosters
+"""
+
+import sys
+import json
+import random
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine, AuctionError, Manager, Player
+from fast_fill import plan_fast_fill
+
+
+class TestPlanFastFill(unittest.TestCase):
+    """Matching respects slots, category limits and budgets"""
+    
+    def test_augmenting_path_moves_earlier_placement(self):
+        # Greedy would put the cheap Pro on Alpha and leave the Elite nowhere to go
+        alpha = Manager("Alpha", "A", 100, 1, {"Elite": 1, "Pro": 1})
+        beta = Manager("Beta", "B", 100, 1, {"Elite": 0, "Pro": 1})
+        pro, elite = Player("Pro", 10, "Pro"), Player("Elite", 20, "Elite")
+        
+        plan = dict((player.name, manager) for player, manager in plan_fast_fill([alpha, beta], [elite, pro]))
+        self.assertEqual(plan, {"Pro": "Beta", "Elite": "Alpha"})
+    
+    def test_budget_limits_fill_cheapest_first(self):
+        manager = Manager("Alpha", "A", 50, 3, {"Pro": 3})
+        players = [Player(f"P{price}", price, "Pro") for price in (40, 20, 25)]
+        
+        plan = plan_fast_fill([manager], players)
+        self.assertEqual(sorted(player.base_price for player, _ in plan), [20, 25])
+    
+    def test_full_rosters_get_nothing(self):
+        manager = Manager("Alpha", "A", 100, 0, {"Pro": 3})
+        self.assertEqual(plan_fast_fill([manager], [Player("P", 10, "Pro")]), [])
+
+
+class TestEngineFastFill(unittest.TestCase):
+    """AuctionEngine.fast_fill sells the matched unsold players at base price"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config = validate_config(json.load(f))
+        self.engine = AuctionEngine(self.config, rng=random.Random(42))
+    
+    def test_requires_exhausted_pool(self):
+        with self.assertRaises(AuctionError):
+            self.engine.fast_fill()
+    
+    def test_fills_rosters_within_limits(self):
+        while self.engine.next_player():
+            self.engine.mark_unsold()
+            if not self.engine.player_pool:
+                break
+        
+        sold = self.engine.fast_fill()
+        self.assertEqual(len(sold), 5)
+        self.assertEqual(list(self.engine.unsold_players), [])
+        for manager in self.engine.managers.values():
+            self.assertGreaterEqual(manager.budget, 0)
+            for category, count in manager.category_counts.items():
+                self.assertLessEqual(count, manager.category_limits[category])
+            for player in manager.players:
+                self.assertEqual(player.sold_price, player.base_price)
+
+
+if __name__ == "__main__":
+    unittest.main()
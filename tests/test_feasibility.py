@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental roster dead-end checks
+"""
+
+import sys
+import random
+import time
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from auction_engine import Manager, Player
+from feasibility import FeasibilityTracker
+from rules import RulesEngine
+
+CATEGORIES = [
+    {'name': 'Elite', 'max_per_team': 2, 'min_per_team': 1, 'base_price': 100},
+    {'name': 'Rookie', 'max_per_team': 3, 'min_per_team': 1, 'base_price': 20},
+    {'name': 'Pro', 'max_per_team': 3, 'min_per_team': 0, 'base_price': 50},
+]
+
+# Allowed setup time growth for 10x the players
+MAX_SETUP_SCALING = 30
+
+
+class TestFeasibilityTracker(unittest.TestCase):
+    """Each kind of dead end is reported by the sale that causes it"""
+    
+    def setUp(self):
+        self.rules = RulesEngine(CATEGORIES, 10)
+    
+    def league(self, players, budget=1000, max_players=3, teams=("Ann", "Ben")):
+        limits = {cat['name']: cat['max_per_team'] for cat in CATEGORIES}
+        managers = [Manager(name, name, budget, max_players, limits, self.rules.min_per_team,
+                            self.rules.base_prices) for name in teams]
+        players = [Player(f"{category}{i}", price, category) for i, (category, price) in enumerate(players)]
+        return managers, players, FeasibilityTracker(managers, self.rules, players)
+    
+    def sell(self, tracker, player, manager, price=None):
+        player.sold_price = player.base_price if price is None else price
+        player.is_sold = True
+        manager.add_player(player)
+        return tracker.record_sale(player, manager)
+    
+    def test_category_runs_out(self):
+        (ann, ben), players, tracker = self.league([('Elite', 100), ('Elite', 100), ('Rookie', 20), ('Rookie', 20)])
+        self.assertTrue(tracker.is_feasible())
+        
+        self.assertEqual(self.sell(tracker, players[0], ann), [])
+        new = self.sell(tracker, players[1], ann)
+        self.assertEqual(len(new), 1)
+        self.assertIn("Only 0 Elite", new[0])
+    
+    def test_roster_slots_run_out(self):
+        (ann, _), players, tracker = self.league([('Pro', 50), ('Pro', 50), ('Elite', 100), ('Elite', 100),
+                                                  ('Rookie', 20), ('Rookie', 20)])
+        self.assertEqual(self.sell(tracker, players[0], ann), [])
+        new = self.sell(tracker, players[1], ann)
+        self.assertTrue(any("open slot" in message for message in new))
+    
+    def test_budget_below_cheapest_remaining(self):
+        (ann, _), players, tracker = self.league([('Pro', 50), ('Elite', 300), ('Elite', 300),
+                                                  ('Rookie', 20), ('Rookie', 20)], budget=500)
+        new = self.sell(tracker, players[0], ann, price=190)
+        self.assertEqual(len(new), 1)
+        self.assertIn("Ann has €310", new[0])
+        
+        # The problem clears once the roster is finishable again
+        self.sell(tracker, players[3], ann)
+        self.assertFalse(tracker.is_feasible())
+        ann.budget += 100
+        self.sell(tracker, players[1], ann)
+        self.assertTrue(tracker.is_feasible())
+    
+    def test_incremental_matches_full_recompute(self):
+        rng = random.Random(7)
+        draft = [(cat['name'], rng.choice((20, 50, 100))) for cat in CATEGORIES for _ in range(4)]
+        managers, players, tracker = self.league(draft, budget=400, max_players=4, teams=("Ann", "Ben", "Cat"))
+        
+        rng.shuffle(players)
+        for player in players:
+            buyers = [m for m in managers if m.player_count < m.max_players
+                      and m.category_counts[player.category] < m.category_limits[player.category]]
+            if not buyers:
+                continue
+            self.sell(tracker, player, rng.choice(buyers), price=player.base_price + rng.choice((0, 10, 40)))
+            fresh = FeasibilityTracker(managers, self.rules, players)
+            self.assertEqual(tracker.problems, fresh.problems)
+            self.assertEqual(tracker.demand, fresh.demand)
+
+    
+    def test_setup_scales_linearly(self):
+        def build_seconds(count):
+            rng = random.Random(count)
+            players = [Player(f"P{i}", rng.randrange(20, 500), CATEGORIES[i % 3]['name']) for i in range(count)]
+            managers, _, _ = self.league([])
+            best = float('inf')
+            for _ in range(3):
+                start = time.perf_counter()
+                FeasibilityTracker(managers, self.rules, players)
+                best = min(best, time.perf_counter() - start)
+            return best
+        
+        # 10x the players: ~10x the time when linear, ~100x when each insert shifts the list
+        self.assertLess(build_seconds(200000) / build_seconds(20000), MAX_SETUP_SCALING)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for action latency instrumentation
+"""
+
+import sys
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from instrumentation import Instrumentation, LatencyHistogram
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test histogram percentiles, method wrapping and export"""
+    
+    def test_histogram_percentiles(self):
+        hist = LatencyHistogram()
+        for ms in range(1, 101):
+            hist.record(ms / 1000.0)
+        
+        stats = hist.to_dict()
+        self.assertEqual(stats['count'], 100)
+        self.assertAlmostEqual(stats['max_ms'], 100.0)
+        # Log buckets are 10% wide, so percentiles are within ~10% of the exact value
+        self.assertAlmostEqual(stats['p50_ms'], 50.0, delta=5.0)
+        self.assertAlmostEqual(stats['p95_ms'], 95.0, delta=9.5)
+        self.assertLessEqual(stats['p99_ms'], stats['max_ms'])
+    
+    def test_instrument_wraps_instance_methods(self):
+        class Widget:
+            def refresh(self, value):
+                return value * 2
+        
+        widget = Widget()
+        instrumentation = Instrumentation()
+        instrumentation.instrument(widget, ('refresh',), prefix='')
+        
+        self.assertEqual(widget.refresh(21), 42)
+        self.assertEqual(instrumentation.snapshot()['refresh']['count'], 1)
+        
+        # Other instances are untouched
+        Widget().refresh(1)
+        self.assertEqual(instrumentation.snapshot()['refresh']['count'], 1)
+    
+    def test_disabled_records_nothing(self):
+        instrumentation = Instrumentation(enabled=False)
+        with instrumentation.timer('export'):
+            pass
+        instrumentation.record('place_bid', 0.001)
+        self.assertEqual(instrumentation.snapshot(), {})
+    
+    def test_export_json_and_reset(self):
+        instrumentation = Instrumentation()
+        instrumentation.record('place_bid', 0.002)
+        instrumentation.record('sell_player', 0.004)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "latency.json"
+            instrumentation.export_json(str(path))
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        
+        self.assertEqual(sorted(data), ['place_bid', 'sell_player'])
+        self.assertEqual(data['place_bid']['count'], 1)
+        
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the background I/O worker used by the desktop app
+"""
+
+import sys
+import json
+import random
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine, write_csv
+from io_worker import IOWorker
+from valuation import read_csv_export
+
+
+class TestIOWorker(unittest.TestCase):
+    """Jobs run off the calling thread; their callbacks run only in drain()"""
+    
+    def setUp(self):
+        self.worker = IOWorker()
+        self.addCleanup(self.worker.close, 5)
+    
+    def wait_for(self, count: int):
+        """Drain like the Tk poll does until count callbacks have run"""
+        deadline = time.monotonic() + 5
+        while len(self.results) < count:
+            self.assertLess(time.monotonic(), deadline, "I/O jobs did not finish")
+            self.worker.drain()
+            time.sleep(0.001)
+        return self.results
+    
+    def test_jobs_run_in_order_with_callbacks_on_caller_thread(self):
+        self.results = []
+        caller = threading.get_ident()
+        threads = []
+        
+        def job(i):
+            threads.append(threading.get_ident())
+            return i
+        
+        def done(value):
+            self.assertEqual(threading.get_ident(), caller)
+            self.results.append(value)
+        
+        for i in range(20):
+            self.worker.submit(lambda i=i: job(i), done)
+        self.assertEqual(self.wait_for(20), list(range(20)))
+        self.assertNotIn(caller, threads)
+        self.assertEqual(self.worker.pending, 0)
+    
+    def test_errors_go_to_on_error(self):
+        self.results = []
+        self.worker.submit(lambda: open(Path(tempfile.gettempdir()) / "missing" / "x.json"),
+                           self.results.append, self.results.append)
+        self.worker.submit(lambda: "ok", self.results.append)
+        errors, ok = self.wait_for(2)
+        self.assertIsInstance(errors, OSError)
+        self.assertEqual(ok, "ok")
+    
+    def test_slow_job_does_not_block_submit(self):
+        release = threading.Event()
+        self.results = []
+        self.worker.submit(release.wait, self.results.append)
+        self.worker.submit(lambda: "after", self.results.append)
+        
+        # Still stuck on the first job: nothing finished, and the caller was not held up
+        self.assertEqual(self.worker.drain(), 0)
+        self.assertEqual(self.worker.pending, 2)
+        release.set()
+        self.assertEqual(self.wait_for(2), [True, "after"])
+    
+    def test_close_finishes_queued_writes(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            engine = AuctionEngine(validate_config(json.load(f)), rng=random.Random(1))
+        engine.next_player()
+        engine.place_bid("John Doe")
+        engine.sell_player()
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "results.csv")
+            rows = engine.results_rows()
+            worker = IOWorker()
+            worker.submit(lambda: write_csv(path, rows))
+            self.assertTrue(worker.close(timeout=5))
+            
+            sales = read_csv_export(path)
+            self.assertEqual([(sale.player, sale.price) for sale in sales],
+                             [(p.name, p.sold_price) for p in engine.sold_players])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite (WAL) live auction state
+"""
+
+import sys
+import json
+import random
+import statistics
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine
+from auction_service import AuctionService
+from live_store import LiveStateStore, read_snapshot
+from synthetic_league import make_league_config
+import benchmark_live_store
+
+# Median write + commit per bid must stay well under a millisecond
+MAX_SAVE_SECONDS_PER_BID = 0.0005
+
+
+class TestLiveStateStore(unittest.TestCase):
+    """A service restarted on the same state file resumes where it stopped"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.data = json.load(f)
+        self.config = validate_config(self.data)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = str(Path(self.tmp.name) / "live.db")
+    
+    def service(self, seed: int, config=None) -> AuctionService:
+        config = config or self.config
+        service = AuctionService(config, state_path=self.path,
+                                 engine=AuctionEngine(config, rng=random.Random(seed)))
+        self.addCleanup(service.close)
+        return service
+    
+    @staticmethod
+    def engine_state(engine):
+        return {
+            "pool": [p.name for p in engine.player_pool],
+            "unsold": [p.name for p in engine.unsold_players],
+            "sold": [(p.name, p.sold_to, p.sold_price) for p in engine.sold_players],
+            "budgets": {m.name: m.budget for m in engine.managers.values()},
+            "bids": engine.bid_history,
+            "search": [p.name for p in engine.search_players(limit=10 ** 6)],
+        }
+    
+    def test_resume_after_crash(self):
+        first = self.service(1)
+        first.next_player()
+        first.place_bid("John Doe")
+        first.place_bid("Jane Smith")
+        first.sell_player()
+        first.next_player()
+        first.mark_unsold()
+        first.next_player()
+        first.set_proxy_bid("Bob Wilson", first.engine.current_bid + 100)
+        first.place_bid("John Doe")
+        expected = first.state()
+        expected_engine = self.engine_state(first.engine)
+        
+        # No close(): the second service sees only what was committed
+        second = self.service(2)
+        self.assertEqual(second.version, first.version)
+        self.assertEqual(second.state(), expected)
+        self.assertEqual(self.engine_state(second.engine), expected_engine)
+        self.assertEqual(second.engine.proxy_bids, first.engine.proxy_bids)
+        
+        # Both continue identically from the restored lot
+        self.assertEqual(second.place_bid("Jane Smith")["current_bid"],
+                         first.place_bid("Jane Smith")["current_bid"])
+    
+    def test_resume_open_batch(self):
+        first = self.service(1)
+        players = [lot["name"] for lot in first.open_batch(2)["batch_lots"]]
+        first.batch_bid(players[0], "John Doe")
+        
+        second = self.service(2)
+        self.assertEqual(second.state()["batch_lots"], first.state()["batch_lots"])
+        self.assertEqual(second.engine.batch_commitments["John Doe"].lots, 1)
+        sold, unsold = second.engine.settle_batch()
+        self.assertEqual([p.name for p in sold], players[:1])
+    
+    def test_other_config_rejected(self):
+        self.service(1)
+        other = validate_config(dict(self.data, title="Another League"))
+        with self.assertRaises(ValueError):
+            self.service(1, other)
+    
+    def test_reader_sees_committed_state(self):
+        service = self.service(1)
+        service.next_player()
+        service.place_bid("John Doe")
+        
+        snapshot = read_snapshot(self.path)
+        state = service.state()
+        self.assertEqual(snapshot["version"], state["version"])
+        self.assertEqual(snapshot["current_player"], state["current_player"]["name"])
+        self.assertEqual(snapshot["current_bid"], state["current_bid"])
+        self.assertEqual(snapshot["remaining_players"], state["remaining_players"])
+        self.assertEqual([m["budget"] for m in snapshot["managers"]], [m["budget"] for m in state["managers"]])
+    
+    def test_save_cost_per_bid(self):
+        config = validate_config(make_league_config(2000, 2, max_players=25, seed=3))
+        engine = AuctionEngine(config, rng=random.Random(3))
+        engine.managers["Manager 1"].budget = engine.managers["Manager 2"].budget = 10 ** 9
+        store = LiveStateStore(self.path)
+        self.addCleanup(store.close)
+        store.start(engine)
+        engine.next_player()
+        
+        samples = []
+        for version in range(1, 501):
+            manager = "Manager 1" if version % 2 else "Manager 2"
+            amount = engine.place_bid(manager)
+            start = time.perf_counter()
+            store.save(engine, version, "bid", {"manager": manager, "amount": amount})
+            samples.append(time.perf_counter() - start)
+        
+        self.assertLess(statistics.median(samples), MAX_SAVE_SECONDS_PER_BID)
+    
+    def test_benchmark_script(self):
+        output = Path(self.tmp.name) / "bench.json"
+        report = benchmark_live_store.main(["--bids", "200", "--players", "50", "--commit-every", "1", "10",
+                                            "--output", str(output)])
+        self.assertEqual([run["commit_every"] for run in report["results"]], [1, 10])
+        self.assertEqual(json.loads(output.read_text(encoding='utf-8'))["benchmark"], "live_store")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the server load-testing harness
+"""
+
+import sys
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src and scripts directories to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+import load_test
+
+
+class TestLoadTest(unittest.TestCase):
+    """Run a short in-process load test and check the JSON report"""
+    
+    def test_report_written(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = str(Path(tmp_dir) / "load.json")
+            load_test.main(["--managers", "4", "--spectators", "6", "--players", "200",
+                            "--duration", "1.5", "--think-time", "0.01", "--output", output])
+            
+            with open(output, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+        
+        self.assertEqual(report["managers"], 4)
+        self.assertEqual(report["spectators"], 6)
+        self.assertGreater(report["requests"], 0)
+        self.assertLess(report["error_rate"], 0.05)
+        
+        operations = report["operations"]
+        for operation in ("poll", "subscribe", "next", "bid"):
+            self.assertIn(operation, operations)
+        self.assertGreater(operations["bid"]["ok"], 0)
+        self.assertGreaterEqual(operations["poll"]["p99_ms"], operations["poll"]["p50_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
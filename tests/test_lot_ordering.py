@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for lot ordering strategies and their use by the engine
+"""
+
+import sys
+import json
+import random
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import ConfigError, validate_config
+from auction_engine import AuctionEngine, Player
+from lot_ordering import ORDER_STRATEGIES, order_players
+
+CATEGORIES = [{'name': 'Elite'}, {'name': 'Pro'}, {'name': 'Rookie'}]
+
+
+class TestOrderPlayers(unittest.TestCase):
+    """Each strategy returns every player exactly once in the expected order"""
+    
+    def setUp(self):
+        self.players = [
+            Player("bob", 200, "Pro"),
+            Player("Amy", 100, "Rookie"),
+            Player("Cal", 300, "Elite"),
+            Player("dan", 100, "Pro"),
+            Player("Eve", 150, "Mystery"),
+        ]
+    
+    def names(self, order):
+        return [p.name for p in order_players(self.players, order, CATEGORIES, random.Random(1))]
+    
+    def test_category_uses_configured_rank_then_name(self):
+        self.assertEqual(self.names('category'), ["Cal", "bob", "dan", "Amy", "Eve"])
+    
+    def test_category_name(self):
+        self.assertEqual(self.names('category-asc'), ["Cal", "Eve", "bob", "dan", "Amy"])
+    
+    def test_price_orders_break_ties_by_name(self):
+        self.assertEqual(self.names('price-asc'), ["Amy", "dan", "Eve", "bob", "Cal"])
+        self.assertEqual(self.names('price-desc'), ["Cal", "bob", "Eve", "Amy", "dan"])
+    
+    def test_every_strategy_is_a_permutation(self):
+        for order in ORDER_STRATEGIES:
+            self.assertEqual(sorted(self.names(order)), sorted(p.name for p in self.players), order)
+    
+    def test_stratified_spreads_categories(self):
+        players = [Player(f"{cat}{i}", 100, cat) for cat in ("A", "B") for i in range(50)]
+        ordered = order_players(players, 'stratified', rng=random.Random(7))
+        
+        # Each tenth of the auction holds close to its share of each category
+        for start in range(0, 100, 10):
+            count_a = sum(1 for p in ordered[start:start + 10] if p.category == "A")
+            self.assertIn(count_a, range(3, 8))
+    
+    def test_unknown_order_rejected(self):
+        with self.assertRaises(ValueError):
+            order_players(self.players, 'alphabetical')
+
+
+class TestEnginePlayerOrder(unittest.TestCase):
+    """The engine draws lots in the configured order"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config_data = json.load(f)
+    
+    def test_sequential_order_draws_in_sequence(self):
+        self.config_data['player_order'] = 'price-desc'
+        engine = AuctionEngine(validate_config(self.config_data), rng=random.Random(3))
+        
+        prices = []
+        while engine.player_pool:
+            prices.append(engine.next_player().base_price)
+            engine.mark_unsold()
+        self.assertEqual(prices, sorted(prices, reverse=True))
+        
+        # Unsold players come back first-unsold-first
+        self.assertEqual(engine.next_player().base_price, prices[0])
+    
+    def test_invalid_player_order(self):
+        self.config_data['player_order'] = 'alphabetical'
+        with self.assertRaises(ConfigError):
+            validate_config(self.config_data)
+
+
+if __name__ == "__main__":
+    unittest.main()
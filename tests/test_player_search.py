@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the remaining player search index
+"""
+
+import sys
+import json
+import random
+import unittest
+import urllib.request
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine, Player
+from player_search import PlayerSearchIndex
+from synthetic_league import make_league_config
+import load_test
+
+# A search may look at each result and as many dead entries (compaction keeps
+# them fewer than live ones), plus this many: one per price bucket and slack
+MAX_EXTRA_VISITED = 100
+
+
+def brute_force(engine, prefix='', category=None, min_price=None, max_price=None):
+    """Names the search should return, in name order, from a scan of pool and unsold"""
+    players = [
+        p for p in engine.player_pool + list(engine.unsold_players)
+        if p.name.casefold().startswith(prefix.casefold())
+        and (category is None or p.category == category)
+        and (min_price is None or p.base_price >= min_price)
+        and (max_price is None or p.base_price <= max_price)
+    ]
+    return sorted(p.name.casefold() for p in players)
+
+
+class TestPlayerSearchIndex(unittest.TestCase):
+    """The index always matches a scan of the players still to be auctioned"""
+    
+    def test_prefix_is_case_insensitive(self):
+        players = [Player("Ann Lee", 100, "A"), Player("ann Marsh", 50, "B"), Player("Andy Roy", 80, "A"),
+                   Player("Bea Fox", 60, "A")]
+        index = PlayerSearchIndex(players)
+        
+        self.assertEqual([p.name for p in index.search("ANN")], ["Ann Lee", "ann Marsh"])
+        self.assertEqual([p.name for p in index.search("an", category="A")], ["Andy Roy", "Ann Lee"])
+        self.assertEqual([p.name for p in index.search("", max_price=60)], ["ann Marsh", "Bea Fox"])
+        self.assertEqual(len(index.search("an")), 3)
+        
+        index.discard(players[1])
+        index.discard(players[1])
+        self.assertEqual([p.name for p in index.search("ann")], ["Ann Lee"])
+        index.add(players[1])
+        self.assertEqual(len(index.search("ann", limit=1)), 1)
+        self.assertEqual(len(index), 4)
+    
+    def test_compaction_keeps_returning_players(self):
+        players = [Player(f"P{i:04d}", i, "A" if i % 2 else "B") for i in range(1000)]
+        index = PlayerSearchIndex(players)
+        for player in players[:900]:
+            index.discard(player)
+        self.assertLess(len(index.indexed), 1000)
+        
+        # Players off the market during a compaction can still come back
+        index.add(players[5])
+        self.assertEqual([p.name for p in index.search("p000")], ["P0005"])
+        self.assertEqual([p.name for p in index.search("p0005", category="A")], ["P0005"])
+        self.assertEqual(len(index.search("p", limit=10 ** 6)), 101)
+    
+    def test_engine_keeps_index_in_step(self):
+        config = validate_config(make_league_config(300, 4, seed=5))
+        engine = AuctionEngine(config, rng=random.Random(5))
+        for manager in engine.managers.values():
+            manager.budget = 10 ** 9
+        categories = [cat['name'] for cat in config.categories]
+        rng = random.Random(5)
+        
+        for step in range(120):
+            if step % 40 == 39:
+                engine.open_batch(3)
+                first = next(iter(engine.batch_lots))
+                engine.batch_bid(first, "Manager 1")
+                engine.settle_batch()
+            else:
+                engine.next_player()
+                if step % 3:
+                    engine.place_bid(f"Manager {step % 4 + 1}")
+                    engine.sell_player()
+                else:
+                    engine.mark_unsold()
+            
+            prefix = rng.choice(["", "p", "player 0001", "PLAYER 00002", "x"])
+            category = rng.choice([None] + categories)
+            min_price = rng.choice([None, 50])
+            found = engine.search_players(prefix, category, min_price, None, limit=10 ** 6)
+            self.assertEqual([p.name.casefold() for p in found], brute_force(engine, prefix, category, min_price))
+    
+    def test_selective_filters_visit_few_entries(self):
+        players = [Player(f"Player {i:06d}", 10 * (i * 7919 % 20 + 1), f"C{i % 3}") for i in range(50000)]
+        index = PlayerSearchIndex(players)
+        # Sold players leave dead entries behind until the next compaction
+        for player in players[::25]:
+            index.discard(player)
+        
+        queries = [("", None, 10 ** 6, None, 50), ("p", "C0", 200, 200, 5), ("", None, None, 10 ** 6, 50),
+                   ("player 04", "C2", 100, 110, 50), ("PLAYER 012", None, None, None, 50),
+                   ("", "C1", 10, 10, 10 ** 6), ("x", None, 10, 200, 50)]
+        for prefix, category, min_price, max_price, limit in queries:
+            found = index.search(prefix, category, min_price, max_price, limit)
+            expected = sorted(
+                p.name.casefold() for p in index.alive
+                if p.name.casefold().startswith(prefix.casefold())
+                and (category is None or p.category == category)
+                and (min_price is None or p.base_price >= min_price)
+                and (max_price is None or p.base_price <= max_price)
+            )[:limit]
+            self.assertEqual([p.name.casefold() for p in found], expected)
+            self.assertLessEqual(index.last_visited, 2 * len(found) + MAX_EXTRA_VISITED,
+                                 (prefix, category, min_price, max_price))
+    
+    def test_server_endpoint(self):
+        httpd, url = load_test.start_local_server(200, 4)
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+        
+        with urllib.request.urlopen(f"{url}/api/players?q=player%200001&limit=5") as response:
+            result = json.loads(response.read())
+        self.assertEqual(len(result["players"]), 5)
+        self.assertTrue(all(p["name"].startswith("Player 0001") for p in result["players"]))
+        
+        with self.assertRaises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{url}/api/players?min_price=cheap")
+        self.assertEqual(error.exception.code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the cProfile/tracemalloc profiling mode
+"""
+
+import sys
+import pstats
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from profiling import Profiler
+
+
+def busy_work():
+    return [str(i) * 10 for i in range(20000)]
+
+
+class TestProfiler(unittest.TestCase):
+    """Test start/stop toggling and report output"""
+    
+    def test_toggle(self):
+        profiler = Profiler()
+        self.assertTrue(profiler.toggle())
+        self.assertTrue(tracemalloc.is_tracing())
+        self.assertFalse(profiler.toggle())
+        self.assertFalse(tracemalloc.is_tracing())
+    
+    def test_dump_writes_pstats_and_allocations(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            profiler = Profiler(tmp_dir, top_allocations=5)
+            profiler.start()
+            data = busy_work()
+            stats_path, allocations_path = profiler.dump()
+            
+            # Dumping mid-run keeps the profiler running with a fresh capture
+            self.assertTrue(profiler.running)
+            profiler.stop()
+            
+            stats = pstats.Stats(stats_path)
+            self.assertTrue(any(func[2] == 'busy_work' for func in stats.stats))
+            
+            with open(allocations_path, 'r', encoding='utf-8') as f:
+                report = f.read()
+            self.assertIn("allocation sites", report)
+            self.assertIn("test_profiling.py", report)
+        
+        self.assertEqual(len(data), 20000)
+    
+    def test_dump_without_capture(self):
+        self.assertIsNone(Profiler().dump())
+
+
+if __name__ == "__main__":
+    unittest.main()
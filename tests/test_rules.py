@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared bidding rules engine
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from auction_engine import Manager, Player
+from rules import ManagerSnapshot, RulesEngine, evaluate_snapshot
+
+CATEGORIES = [
+    {'name': 'Elite', 'max_per_team': 2, 'min_per_team': 1, 'base_price': 100},
+    {'name': 'Rookie', 'max_per_team': 3, 'min_per_team': 2, 'base_price': 20},
+]
+
+
+class TestRulesEngine(unittest.TestCase):
+    """Hard limits plus the reserve for required players"""
+    
+    def setUp(self):
+        self.rules = RulesEngine(CATEGORIES, 10)
+    
+    def manager(self, budget=500, players=0, counts=None, max_players=5):
+        counts = counts or {}
+        return ManagerSnapshot("Ann", budget, players, max_players, counts, *self.rules.requirement_totals(counts))
+    
+    def test_reserve_covers_minimums_and_remaining_slots(self):
+        # 1 Elite (100) + 2 Rookies (2 x 20) + 2 more players at the lowest base price (20)
+        self.assertEqual(self.rules.reserve_needed(self.manager()), 180)
+        # Winning an Elite covers its 100 (the other four slots are still reserved)
+        self.assertEqual(self.rules.reserve_needed(self.manager(), 'Elite'), 80)
+    
+    def test_bid_limited_by_reserve(self):
+        manager = self.manager(budget=300)
+        self.assertEqual(self.rules.max_bid(manager, 'Rookie'), 300 - 160)
+        self.assertIsNone(self.rules.bid_rejection_reason(manager, 140, 'Rookie'))
+        self.assertIn("must keep", self.rules.bid_rejection_reason(manager, 150, 'Rookie'))
+    
+    def test_hard_limits(self):
+        self.assertIn("budget", self.rules.bid_rejection_reason(self.manager(budget=50), 60, 'Rookie'))
+        self.assertIn("full", self.rules.bid_rejection_reason(self.manager(players=5), 10, 'Rookie'))
+        self.assertIn("limit", self.rules.bid_rejection_reason(self.manager(counts={'Elite': 2}), 10, 'Elite'))
+    
+    def test_pass_needs_enough_players_left(self):
+        manager = self.manager(counts={'Rookie': 0})
+        self.assertIsNone(self.rules.pass_rejection_reason(manager, 'Rookie', 2))
+        self.assertIsNotNone(self.rules.pass_rejection_reason(manager, 'Rookie', 1))
+    
+    def test_engine_manager_keeps_requirement_totals(self):
+        manager = Manager("Ann", "A", 500, 5, {'Elite': 2, 'Rookie': 3}, {'Elite': 1, 'Rookie': 2},
+                          {'Elite': 100, 'Rookie': 20})
+        self.assertEqual((manager.missing_required, manager.missing_required_cost), (3, 140))
+        
+        rookies = [Player(f"R{i}", 20, 'Rookie') for i in range(3)]
+        for player in rookies:
+            player.sold_price = 20
+            manager.add_player(player)
+        # The third Rookie is beyond the minimum and changes nothing
+        self.assertEqual((manager.missing_required, manager.missing_required_cost), (1, 100))
+        self.assertEqual(self.rules.requirement_totals(manager.category_counts), (1, 100))
+        
+        manager.remove_player(rookies[0])
+        self.assertEqual((manager.missing_required, manager.missing_required_cost), (1, 100))
+        manager.remove_player(rookies[1])
+        self.assertEqual((manager.missing_required, manager.missing_required_cost), (2, 120))
+        self.assertEqual(self.rules.reserve_needed(manager), self.rules.reserve_needed(
+            self.manager(players=1, counts=dict(manager.category_counts))))
+    
+    def test_evaluate_snapshot(self):
+        table = evaluate_snapshot({
+            "rules": {"bid_increment": 10, "max_players": 5, "categories": CATEGORIES},
+            "lot": {"category": "Elite", "current_bid": 100, "players_left": 0,
+                    "managers": [{"name": "Ann", "budget": 500, "players": 0, "category_counts": {}},
+                                 {"name": "Ben", "budget": 150, "players": 0, "category_counts": {}}]}
+        })
+        self.assertEqual(table["Ann"]["next_bid"], 110)
+        self.assertTrue(table["Ann"]["can_bid"])
+        self.assertFalse(table["Ben"]["can_bid"])
+        self.assertFalse(table["Ann"]["can_pass"])
+        
+        with self.assertRaises(ValueError):
+            evaluate_snapshot({"rules": {}})
+        with self.assertRaises(ValueError):
+            evaluate_snapshot({"rules": {"bid_increment": 10, "max_players": 5,
+                                         "categories": [{"name": "Elite", "max_per_team": None}]},
+                               "lot": {"category": "Elite", "current_bid": 100, "managers": []}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite season history store
+"""
+
+import sys
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine
+from season_store import SeasonStore
+
+
+class TestSeasonStore(unittest.TestCase):
+    """Completed auctions are stored per season and queried across seasons"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config = validate_config(json.load(f))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = SeasonStore(str(Path(self.tmp.name) / "history.db"))
+        self.addCleanup(self.store.close)
+    
+    def run_auction(self, seed: int) -> AuctionEngine:
+        """Each player goes to the first manager after one or two bids; the last one stays unsold"""
+        engine = AuctionEngine(self.config, rng=random.Random(seed))
+        while len(engine.player_pool) > 0:
+            engine.next_player()
+            engine.place_bid("John Doe")
+            if seed % 2:
+                engine.place_bid("Jane Smith")
+            if engine.player_pool:
+                engine.sell_player()
+            else:
+                engine.mark_unsold()
+        return engine
+    
+    def test_record_and_query(self):
+        engine = self.run_auction(1)
+        self.store.record_auction("2025", engine)
+        
+        sold = engine.sold_players[0]
+        history = self.store.player_history(sold.name.upper())
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0]["price"], sold.sold_price)
+        self.assertEqual(history[0]["team"], engine.managers[sold.sold_to].team_name)
+        
+        unsold = engine.unsold_players[0]
+        self.assertIsNone(self.store.player_history(unsold.name)[0]["price"])
+        
+        bids = self.store.connection.execute("SELECT COUNT(*) FROM bids").fetchone()[0]
+        self.assertEqual(bids, len(engine.bid_history))
+        self.assertEqual(bids, 2 * len(self.config.players))
+    
+    def test_average_over_last_seasons(self):
+        for season, seed in (("2023", 1), ("2024", 2), ("2025", 3)):
+            self.store.record_auction(season, self.run_auction(seed))
+        self.assertEqual(self.store.seasons(), ["2023", "2024", "2025"])
+        
+        category = self.config.categories[0]['name']
+        rows = self.store.connection.execute(
+            "SELECT l.price FROM lots l JOIN seasons s ON s.id = l.season_id "
+            "WHERE l.category = ? AND l.price IS NOT NULL AND s.season IN ('2024', '2025')", (category,)
+        ).fetchall()
+        expected = sum(row[0] for row in rows) / len(rows) if rows else None
+        self.assertEqual(self.store.average_price(category, last=2), expected)
+        
+        plan = " ".join(row[-1] for row in self.store.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT AVG(price) FROM lots WHERE category = ? AND price IS NOT NULL", (category,)))
+        self.assertIn("idx_lots_category", plan)
+    
+    def test_rerecording_a_season_replaces_it(self):
+        self.store.record_auction("2025", self.run_auction(1))
+        self.store.record_auction("2025", self.run_auction(2))
+        
+        self.assertEqual(self.store.seasons(), ["2025"])
+        lots = self.store.connection.execute("SELECT COUNT(*) FROM lots").fetchone()[0]
+        self.assertEqual(lots, len(self.config.players))
+
+
+if __name__ == "__main__":
+    unittest.main()
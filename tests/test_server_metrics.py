@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Tests for the server /metrics endpoint and live auction API
+"""
+
+import sys
+import json
+import http.client
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Add src and scripts directories to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+import server
+from config_loader import load_config_file
+from auction_service import AuctionService
+from metrics import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test Prometheus text rendering"""
+    
+    def test_render_counter_gauge_histogram(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("demo_requests_total", "Requests", ("path",))
+        registry.gauge("demo_connections", "Connections").set(3)
+        latency = registry.histogram("demo_seconds", "Latency", buckets=(0.1, 1.0))
+        
+        requests.inc(path="/a")
+        requests.inc(path="/a")
+        latency.observe(0.05)
+        latency.observe(0.5)
+        
+        text = registry.render()
+        self.assertIn("# TYPE demo_requests_total counter", text)
+        self.assertIn('demo_requests_total{path="/a"} 2', text)
+        self.assertIn("demo_connections 3", text)
+        self.assertIn('demo_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('demo_seconds_bucket{le="+Inf"} 2', text)
+        self.assertIn("demo_seconds_count 2", text)
+    
+    def test_labels_must_match(self):
+        counter = MetricsRegistry().counter("demo_total", "Demo", ("path",))
+        with self.assertRaises(ValueError):
+            counter.inc(method="GET")
+
+
+class TestServerMetrics(unittest.TestCase):
+    """Run the threaded server on an ephemeral port with a live auction"""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.journal = Path(self.tmp_dir.name) / "journal.jsonl"
+        config = load_config_file(str(project_root / "test_data" / "sample_config.json"))
+        self.service = AuctionService(config, server.SERVER_METRICS, str(self.journal))
+        
+        handler = type("Handler", (server.AuctionHTTPRequestHandler,), {"service": self.service, "quiet": True})
+        self.httpd = server.AuctionHTTPServer(("127.0.0.1", 0), handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+    
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.service.close()
+        self.tmp_dir.cleanup()
+    
+    def request(self, path, payload=None):
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, method="POST" if data else "GET")
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return response.read().decode('utf-8')
+    
+    def test_metrics_after_bidding(self):
+        state = json.loads(self.request("/api/next", {}))
+        self.assertTrue(state["bidding_active"])
+        state = json.loads(self.request("/api/bid", {"manager": "John Doe"}))
+        self.assertEqual(state["highest_bidder"], "John Doe")
+        
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self.request("/api/bid", {"manager": "Nobody"})
+        self.assertEqual(ctx.exception.code, 409)
+        
+        text = self.request("/metrics")
+        self.assertIn('auction_http_requests_total{method="POST",path="/api/bid",status="200"}', text)
+        self.assertIn('auction_http_requests_total{method="POST",path="/api/bid",status="409"}', text)
+        self.assertIn('auction_bids_total{manager="John Doe"}', text)
+        self.assertIn("auction_http_active_connections", text)
+        self.assertIn('auction_engine_lock_wait_seconds_count{action="place_bid"}', text)
+        self.assertIn("auction_journal_fsync_seconds_count", text)
+        self.assertGreater(self.service.bids_per_second(), 0)
+        
+        entries = [json.loads(line) for line in self.journal.read_text(encoding='utf-8').splitlines()]
+        self.assertEqual([entry["action"] for entry in entries], ["next_player", "bid"])
+    
+    
+    def test_unknown_api_paths_share_one_label(self):
+        for path in ("/api/foo123", "/api/bar456"):
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                self.request(path, {})
+            self.assertEqual(ctx.exception.code, 404)
+        
+        text = self.request("/metrics")
+        self.assertIn('auction_http_requests_total{method="POST",path="other",status="404"}', text)
+        self.assertNotIn("foo123", text)
+        self.assertEqual(server.metrics_path_label("/api/bid"), "/api/bid")
+        self.assertEqual(server.metrics_path_label("/src/web/index.html"), "static")
+    
+    
+    def state_latency_sum(self):
+        prefix = 'auction_http_request_duration_seconds_sum{method="GET",path="/api/state"} '
+        for line in self.request("/metrics").splitlines():
+            if line.startswith(prefix):
+                return float(line[len(prefix):])
+        return 0.0
+    
+    def test_keep_alive_idle_time_not_timed(self):
+        before = self.state_latency_sum()
+        connection = http.client.HTTPConnection("127.0.0.1", self.httpd.server_address[1], timeout=5)
+        self.addCleanup(connection.close)
+        for _ in range(2):
+            connection.request("GET", "/api/state")
+            connection.getresponse().read()
+            # The server is already waiting for the next request line on this connection
+            time.sleep(0.3)
+        
+        self.assertLess(self.state_latency_sum() - before, 0.3)
+    
+    
+    def test_proxy_bids_over_api(self):
+        state = json.loads(self.request("/api/next", {}))
+        base = state["current_player"]["base_price"]
+        self.request("/api/proxy", {"manager": "John Doe", "max": base + 100})
+        state = json.loads(self.request("/api/proxy", {"manager": "Jane Smith", "max": base + 50}))
+        
+        self.assertEqual(state["highest_bidder"], "John Doe")
+        self.assertEqual(state["current_bid"], base + 75)
+    
+    
+    def test_vickrey_lot_over_api(self):
+        state = json.loads(self.request("/api/next", {"mode": "vickrey"}))
+        base = state["current_player"]["base_price"]
+        self.request("/api/sealed", {"manager": "John Doe", "amount": base + 40})
+        state = json.loads(self.request("/api/sealed", {"manager": "Bob Wilson", "amount": base + 90}))
+        self.assertEqual(state["sealed_bidders"], ["John Doe", "Bob Wilson"])
+        self.assertNotIn(str(base + 90), json.dumps(state["sealed_bidders"]))
+        
+        state = json.loads(self.request("/api/resolve", {}))
+        bob = next(m for m in state["managers"] if m["name"] == "Bob Wilson")
+        self.assertEqual(bob["players"], 1)
+        self.assertEqual(bob["budget"], 1500 - (base + 40))
+    
+    
+    def test_batch_lots_over_api(self):
+        state = json.loads(self.request("/api/batch/open", {"size": 2}))
+        first, second = state["batch_lots"]
+        self.request("/api/batch/bid", {"player": first["name"], "manager": "John Doe"})
+        state = json.loads(self.request("/api/batch/bid", {"player": second["name"], "manager": "Jane Smith"}))
+        self.assertEqual([lot["highest_bidder"] for lot in state["batch_lots"]], ["John Doe", "Jane Smith"])
+        
+        state = json.loads(self.request("/api/batch/settle", {}))
+        self.assertEqual(state["batch_lots"], [])
+        self.assertEqual(sum(m["players"] for m in state["managers"]), 2)
+    
+    
+    def test_rules_eligibility(self):
+        state = json.loads(self.request("/api/next", {}))
+        self.assertTrue(all(entry["can_bid"] for entry in state["eligibility"].values()))
+        
+        payload = {
+            "rules": {"bid_increment": 25, "max_players": 6,
+                      "categories": [{"name": "Elite", "max_per_team": 2, "min_per_team": 0, "base_price": 0}]},
+            "lot": {"category": "Elite", "current_bid": 200, "players_left": 1,
+                    "managers": [{"name": "Ann", "budget": 220, "players": 0, "category_counts": {}}]}
+        }
+        table = json.loads(self.request("/api/rules/eligibility", payload))["eligibility"]
+        self.assertEqual(table["Ann"]["next_bid"], 225)
+        self.assertFalse(table["Ann"]["can_bid"])
+        
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self.request("/api/rules/eligibility", {"rules": {}})
+        self.assertEqual(ctx.exception.code, 400)
+        
+        # Numeric strings are accepted; other limits are a client error, not a crash
+        payload["rules"]["categories"][0]["max_per_team"] = "2"
+        self.assertEqual(json.loads(self.request("/api/rules/eligibility", payload))["eligibility"], table)
+        payload["rules"]["categories"][0]["max_per_team"] = "two"
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self.request("/api/rules/eligibility", payload)
+        self.assertEqual(ctx.exception.code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
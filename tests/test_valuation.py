@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for expected-price fitting from past auctions
+"""
+
+import sys
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from config_loader import validate_config
+from auction_engine import AuctionEngine
+from auction_service import AuctionService
+from valuation import PriceModel, Sale, fit_price_model, read_history
+import fit_prices
+
+
+class TestPriceModel(unittest.TestCase):
+    """Category levels, shrunk player adjustments and season decay"""
+    
+    def test_player_adjustment_is_shrunk_towards_category(self):
+        model = fit_price_model([[Sale("Star", "Elite", 300), Sale("Plain", "Elite", 100)]], shrinkage=1.0)
+        
+        self.assertEqual(model.category_prices["Elite"], 200)
+        # One sale of weight 1 with shrinkage 1 moves halfway from the category average
+        self.assertEqual(model.expected_price("Star", "Elite"), 250)
+        self.assertEqual(model.expected_price("star ", "Elite"), 250)
+        self.assertEqual(model.expected_price("Newcomer", "Elite"), 200)
+        self.assertIsNone(model.expected_price("Newcomer", "Unknown"))
+    
+    def test_recent_seasons_weigh_more(self):
+        model = fit_price_model([[Sale("A", "Pro", 100)], [Sale("A", "Pro", 200)]], shrinkage=0.0, decay=0.5)
+        # (0.5 * 100 + 1 * 200) / 1.5
+        self.assertAlmostEqual(model.category_prices["Pro"], 250 / 1.5)
+    
+    def test_missing_category_borrowed_from_other_sales(self):
+        model = fit_price_model([[Sale("A", None, 90)], [Sale("A", "Pro", 110)]], decay=1.0)
+        self.assertEqual(model.sales, 2)
+        self.assertEqual(model.category_prices["Pro"], 100)
+    
+    def test_round_trip(self):
+        model = fit_price_model([[Sale("A", "Pro", 100), Sale("B", "Elite", 300)]])
+        restored = PriceModel.from_dict(json.loads(json.dumps(model.to_dict())))
+        self.assertEqual(restored.expected_price("A", "Pro"), model.expected_price("A", "Pro"))
+        
+        with self.assertRaises(ValueError):
+            PriceModel.from_dict({"players": {}})
+
+
+class TestHistoryFiles(unittest.TestCase):
+    """CSV exports and service journals both feed the fitting CLI"""
+    
+    def setUp(self):
+        with open(project_root / "test_data" / "sample_config.json", 'r', encoding='utf-8') as f:
+            self.config = validate_config(json.load(f))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+    
+    def test_csv_export_and_journal(self):
+        engine = AuctionEngine(self.config, rng=random.Random(1))
+        engine.next_player()
+        engine.place_bid("John Doe")
+        sold = engine.sell_player()
+        csv_path = Path(self.tmp.name) / "season1.csv"
+        engine.export_csv(csv_path)
+        
+        journal_path = Path(self.tmp.name) / "season2.jsonl"
+        service = AuctionService(self.config, journal_path=str(journal_path),
+                                 engine=AuctionEngine(self.config, rng=random.Random(2)))
+        service.next_player()
+        service.place_bid("Jane Smith")
+        service.sell_player()
+        service.close()
+        
+        self.assertEqual([(s.player, s.category, s.price) for s in read_history(csv_path)],
+                         [(sold.name, sold.category, sold.sold_price)])
+        self.assertEqual(len(read_history(journal_path)), 1)
+        
+        model_path = Path(self.tmp.name) / "model.json"
+        self.assertEqual(fit_prices.main([str(csv_path), str(journal_path), "--output", str(model_path)]), 0)
+        model = PriceModel.load(model_path)
+        self.assertEqual(model.sales, 2)
+        self.assertIsNotNone(model.expected_price(sold.name, sold.category))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the web page's local bidding rules
+"""
+
+import sys
+import json
+import random
+import re
+import shutil
+import subprocess
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src" / "python"))
+
+from rules import ManagerSnapshot, RulesEngine
+
+WEB_PAGE = project_root / "src" / "web" / "auction_web.html"
+
+# Local rule functions the page falls back to without the rules endpoint
+RULE_FUNCTIONS = ["localBidRejection", "canManagerBid", "getRequiredPlayersAndBudget", "canManagerAffordBid",
+                  "canManagerPassOnPlayer", "getAvailableBudgetAfterRequirements"]
+
+# Runs the extracted functions on every state read from stdin
+NODE_HARNESS = """
+const states = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+let auctionConfig, auction;
+%s
+const results = states.map(state => {
+    auctionConfig = state.config;
+    auction = state.auction;
+    const category = auction.currentPlayer.category;
+    const nextBid = auction.currentBid + auctionConfig.bidIncrement;
+    const table = {};
+    Object.values(auction.managers).forEach(m => {
+        table[m.name] = {
+            can_bid: canManagerBid(m, nextBid, category),
+            bid_allowed: localBidRejection(m.name, m, nextBid) === null,
+            can_pass: canManagerPassOnPlayer(m, category),
+            available_budget: getAvailableBudgetAfterRequirements(m)
+        };
+    });
+    return table;
+});
+process.stdout.write(JSON.stringify(results));
+"""
+
+
+def extract_function(source: str, name: str) -> str:
+    """Source of a top-level `function name(...) {...}` declaration"""
+    match = re.search(r"function %s\(" % name, source)
+    if match is None:
+        raise AssertionError(f"{name} not found in {WEB_PAGE.name}")
+    depth = 0
+    for index in range(source.index("{", match.end()), len(source)):
+        if source[index] == "{":
+            depth += 1
+        elif source[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return source[match.start():index + 1]
+    raise AssertionError(f"{name} has unbalanced braces")
+
+
+def random_state(rng: random.Random):
+    """A lot on a random roster state, in both the page's and the rules endpoint's layout"""
+    max_players = rng.randint(2, 8)
+    categories = []
+    for i in range(rng.randint(1, 4)):
+        minimum = rng.randint(0, 2)
+        categories.append({"name": f"Cat{i}", "max_per_team": rng.randint(max(1, minimum), 4),
+                           "min_per_team": minimum, "base_price": 10 * rng.randint(1, 30)})
+    
+    managers = {}
+    for i in range(rng.randint(1, 4)):
+        counts = {cat["name"]: rng.randint(0, cat["max_per_team"]) for cat in categories}
+        players = min(max_players, sum(counts.values()) + rng.randint(0, 2))
+        managers[f"M{i}"] = {"name": f"M{i}", "budget": rng.randint(0, 150) * 10,
+                             "players": [None] * players, "categoryCounts": counts}
+    
+    category = rng.choice(categories)["name"]
+    auction = {"currentPlayer": {"name": "Lot", "category": category}, "currentBid": 10 * rng.randint(1, 60),
+               "managers": managers, "categoryRemaining": {category: rng.randint(0, 3)}}
+    config = {"bidIncrement": rng.choice([5, 10, 25]), "maxPlayers": max_players,
+              "categories": [{"name": cat["name"], "maxPerTeam": cat["max_per_team"],
+                              "minPerTeam": cat["min_per_team"], "basePrice": cat["base_price"]}
+                             for cat in categories]}
+    return categories, config, auction
+
+
+@unittest.skipUnless(shutil.which("node"), "Node.js is needed to run the page's scripts")
+class TestWebRulesParity(unittest.TestCase):
+    """The page's fallback rules answer like RulesEngine on the same states"""
+    
+    def test_random_states_match_rules_engine(self):
+        source = WEB_PAGE.read_text(encoding='utf-8')
+        harness = NODE_HARNESS % "\n".join(extract_function(source, name) for name in RULE_FUNCTIONS)
+        
+        rng = random.Random(42)
+        states = [random_state(rng) for _ in range(500)]
+        result = subprocess.run(["node", "-e", harness], capture_output=True, text=True, timeout=60,
+                                input=json.dumps([{"config": config, "auction": auction}
+                                                  for _, config, auction in states]))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        
+        for (categories, config, auction), page in zip(states, json.loads(result.stdout)):
+            rules = RulesEngine(categories, config["bidIncrement"])
+            category = auction["currentPlayer"]["category"]
+            managers = []
+            for m in auction["managers"].values():
+                counts = dict(m["categoryCounts"])
+                managers.append(ManagerSnapshot(m["name"], m["budget"], len(m["players"]), config["maxPlayers"],
+                                                counts, *rules.requirement_totals(counts)))
+            table = rules.eligibility(managers, category, auction["currentBid"] + config["bidIncrement"],
+                                      auction["categoryRemaining"][category])
+            
+            for name, verdict in table.items():
+                expected = {"can_bid": verdict["can_bid"], "bid_allowed": verdict["can_bid"],
+                            "can_pass": verdict["can_pass"], "available_budget": verdict["available_budget"]}
+                self.assertEqual(page[name], expected, (config, auction, name))
+
+
+if __name__ == "__main__":
+    unittest.main()